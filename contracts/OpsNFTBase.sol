@@ -0,0 +1,491 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+import "@openzeppelin/contracts/token/ERC721/ERC721.sol";
+import "@openzeppelin/contracts/token/ERC721/extensions/ERC721URIStorage.sol";
+import "@openzeppelin/contracts/token/ERC721/extensions/ERC721Royalty.sol";
+import "@openzeppelin/contracts/access/Ownable.sol";
+import "@openzeppelin/contracts/utils/Counters.sol";
+
+/// @custom:security-contact block-ops.eth
+/// @notice Bounty logic shared by OpsNFT and OpsNFTSequential, which only
+/// differ in how they implement ERC721 enumeration.
+abstract contract OpsNFTBase is ERC721, ERC721URIStorage, ERC721Royalty, Ownable {
+    using Counters for Counters.Counter;
+
+    Counters.Counter internal _tokenIdCounter;
+    bool public initialized = false;
+    address public _royaltyAddress = 0x2615e4520418848893f9F0d69Ecc84084119D0E5;
+    uint8 public royaltyNumerator = 100;
+    uint16 public royaltyDenominator = 10000;
+    uint256 public totalEthPaidOut = 0;
+    uint256 public totalBountyAmount = 0;
+    // Royalties are accrued here and swept to _royaltyAddress by
+    // withdrawRoyalties instead of being sent on every mint and redeem.
+    uint256 public accruedRoyalties = 0;
+    // Prefix that turns a bytes32 content id into a full URI. The default
+    // is an IPFS CIDv1 (base16, dag-pb, sha2-256) prefix, so a sha2-256
+    // digest renders as ipfs://f01701220<digest in hex>.
+    string public contentBaseURI = "ipfs://f01701220";
+    bytes16 private constant _HEX_SYMBOLS = "0123456789abcdef";
+    enum PROJECT_STATE {
+        NEW,
+        ACTIVE,
+        CLOSED
+    }
+    struct Submission {
+        address submitter;
+        string metadataURI;
+    }
+    // Creator, project state and escrowed amount share a single storage
+    // slot (20 + 1 + 11 bytes) so minting a token only initializes one
+    // slot for them.
+    struct TokenData {
+        address creator;
+        PROJECT_STATE projectState;
+        uint88 amountOfEth;
+    }
+    // Everything tokenDetails returns for one token, with the submissions
+    // capped so that many tokens can be read in a single call.
+    struct TokenDetails {
+        address owner;
+        string tokenURI;
+        uint256 amountOfEth;
+        address creator;
+        uint256 tokenId;
+        PROJECT_STATE projectState;
+        uint256 submissionCount;
+        Submission[] submissions;
+    }
+    
+    mapping(uint256 => TokenData) private _tokenData;
+    mapping(address => uint256[]) public creatorToTokenIds;
+    // Every submission is written once to _submissions; the per-token and
+    // per-address indexes only hold its position (the submission id).
+    Submission[] private _submissions;
+    mapping(uint256 => uint256[]) public tokenIdToSubmissionIds;
+    mapping(uint256 => uint256) private _winningSubmissionIds;
+    mapping(address => uint256[]) public addressToTokenIdsWithSubmissions;
+    mapping(address => mapping(uint256 => uint256[])) public addressToTokenIdSubmissionIds;
+    // Tokens and submissions minted with a content id keep only the
+    // bytes32 digest; their URI is rebuilt from contentBaseURI on read.
+    mapping(uint256 => bytes32) private _tokenContentIds;
+    mapping(uint256 => bytes32) private _submissionContentIds;
+    // Token ids grouped by project state, with each token's position in
+    // its group so it can be moved to another group in O(1).
+    mapping(PROJECT_STATE => uint256[]) private _tokenIdsByState;
+    mapping(uint256 => uint256) private _tokenIdIndexInState;
+
+    // Mints and submissions made with a content id emit the raw id with an
+    // empty URI, and clients join it with contentBaseURI, instead of the
+    // contract building the URI only to log it.
+    event NFTMinted(address _to, string _tokenMetadata, uint256 _escrowValue, uint256 _tokenId, bytes32 _contentId);
+    event SubmissionMade(address _submitter, uint256 _tokenId, string _submissionString, address _nftOwner, bytes32 _contentId);
+    event Redeemed(address _redeemer, uint256 _tokenId, uint256 _amount);
+    event RoyaltyPaid(address _to, uint256 _amount);
+    event WinningSubmission(address _submitter, string _metadataURI, uint256 _tokenId);
+    event ContentBaseURIUpdated(string _contentBaseURI);
+    
+    constructor() ERC721("BLOCK", "OPS") {
+        _setDefaultRoyalty(_royaltyAddress, royaltyNumerator);
+    }
+
+    modifier isInitialized() {
+        require(initialized, "Contract is not yet initialized");
+        _;
+    }
+
+    function safeMint(string memory tokenMetadataURI) public payable {
+        // TODO: Implement way for owner to set a custom royalty value
+        //       to satisfy the future use case of providing 
+        //       consulting services in exchange for a higher % of the 
+        //       total contract value instead of an additional out-of-
+        //       pocket fee.
+        _safeMintWithValue(tokenMetadataURI, bytes32(0));
+    }
+
+    function safeMintWithContentId(bytes32 tokenContentId) public payable {
+        require(tokenContentId != bytes32(0), "Content id cannot be empty.");
+        _safeMintWithValue("", tokenContentId);
+    }
+
+    function _safeMintWithValue(string memory tokenMetadataURI, bytes32 tokenContentId) internal {
+        require(msg.value > 0, "You cannot escrow 0 ETH.");
+        require(msg.value < msg.sender.balance, "Insufficient ETH to Escrow.");
+
+        uint256 royaltyAmount = _mintBounty(tokenMetadataURI, tokenContentId, msg.value);
+        _accrueRoyalty(royaltyAmount);
+    }
+
+    function safeMintBatch(string[] memory tokenMetadataURIs, uint256[] memory amountsToEscrow) public payable {
+        require(tokenMetadataURIs.length > 0, "You must mint at least one NFT.");
+        require(tokenMetadataURIs.length == amountsToEscrow.length, "Every NFT needs exactly one escrow amount.");
+        require(msg.value < msg.sender.balance, "Insufficient ETH to Escrow.");
+
+        uint256 totalAmount = 0;
+        uint256 totalRoyaltyAmount = 0;
+        for (uint256 i = 0; i < tokenMetadataURIs.length; i++) {
+            require(amountsToEscrow[i] > 0, "You cannot escrow 0 ETH.");
+            totalAmount += amountsToEscrow[i];
+            totalRoyaltyAmount += _mintBounty(tokenMetadataURIs[i], bytes32(0), amountsToEscrow[i]);
+        }
+        require(totalAmount == msg.value, "Escrow amounts do not add up to the ETH sent.");
+
+        _accrueRoyalty(totalRoyaltyAmount);
+    }
+
+    function _mintBounty(string memory tokenMetadataURI, bytes32 tokenContentId, uint256 amount) internal returns (uint256) {
+        uint256 tokenId = _tokenIdCounter.current();
+        _tokenIdCounter.increment();
+        _safeMint(msg.sender, tokenId);
+        if (tokenContentId == bytes32(0)) {
+            _setTokenURI(tokenId, tokenMetadataURI);
+        } else {
+            _tokenContentIds[tokenId] = tokenContentId;
+        }
+
+        (, uint256 royaltyAmount) = royaltyInfo(tokenId, amount);
+        uint256 amountToEscrow = amount - royaltyAmount;
+        require(amountToEscrow <= type(uint88).max, "Escrow amount is too large.");
+        _tokenData[tokenId] = TokenData(msg.sender, PROJECT_STATE.NEW, uint88(amountToEscrow));
+        _addToStateIndex(tokenId, PROJECT_STATE.NEW);
+        creatorToTokenIds[msg.sender].push(tokenId);
+
+        totalBountyAmount += amountToEscrow;
+        initialized = true;
+        emit NFTMinted(msg.sender, tokenMetadataURI, amountToEscrow, tokenId, tokenContentId);
+        return royaltyAmount;
+    }
+    
+    function _payOutRoyalty(uint256 _tokenId, uint256 _nftSaleAmount) internal returns (uint256) {
+        (, uint256 royaltyAmount) = royaltyInfo(_tokenId, _nftSaleAmount);
+        _accrueRoyalty(royaltyAmount);
+        return royaltyAmount;
+    }
+
+    function _accrueRoyalty(uint256 _royaltyAmount) internal {
+        accruedRoyalties += _royaltyAmount;
+    }
+
+    function withdrawRoyalties() external {
+        uint256 royaltyAmount = accruedRoyalties;
+        require(royaltyAmount > 0, "No royalties to withdraw.");
+        accruedRoyalties = 0;
+
+        (bool success, ) = _royaltyAddress.call{value: royaltyAmount}("");
+        require(success, "Royalty Transfer Failed.");
+        emit RoyaltyPaid(_royaltyAddress, royaltyAmount);
+    }
+
+    function tokenDetails(uint256 _tokenId) public view returns (address, string memory, uint256, address, uint256, PROJECT_STATE, Submission[] memory) {
+        require(_exists(_tokenId), "NFT tokenId does not exist.");
+        return (
+            ownerOf(_tokenId), 
+            tokenURI(_tokenId), 
+            amountOfEthInNFT(_tokenId), 
+            tokenIdToNftCreators(_tokenId), 
+            _tokenId, 
+            tokenIdToProjectState(_tokenId), 
+            getSubmissionsForTokenId(_tokenId)
+        );
+    }
+
+    function tokenDetailsPaginated(uint256 _tokenId, uint256 _offset, uint256 _limit) public view returns (address, string memory, uint256, address, uint256, PROJECT_STATE, Submission[] memory) {
+        require(_exists(_tokenId), "NFT tokenId does not exist.");
+        return (
+            ownerOf(_tokenId), 
+            tokenURI(_tokenId), 
+            amountOfEthInNFT(_tokenId), 
+            tokenIdToNftCreators(_tokenId), 
+            _tokenId, 
+            tokenIdToProjectState(_tokenId), 
+            _submissionsPage(tokenIdToSubmissionIds[_tokenId], _offset, _limit)
+        );
+    }
+
+    function getTokenDetailsBatch(uint256[] memory _tokenIds, uint256 _maxSubmissions) public view returns (TokenDetails[] memory) {
+        TokenDetails[] memory details = new TokenDetails[](_tokenIds.length);
+        for (uint256 i = 0; i < _tokenIds.length; i++) {
+            uint256 tokenId = _tokenIds[i];
+            require(_exists(tokenId), "NFT tokenId does not exist.");
+            TokenData memory tokenData = _tokenData[tokenId];
+
+            TokenDetails memory tokenDetail;
+            tokenDetail.owner = ownerOf(tokenId);
+            tokenDetail.tokenURI = tokenURI(tokenId);
+            tokenDetail.amountOfEth = tokenData.amountOfEth;
+            tokenDetail.creator = tokenData.creator;
+            tokenDetail.tokenId = tokenId;
+            tokenDetail.projectState = tokenData.projectState;
+            tokenDetail.submissionCount = tokenIdToSubmissionIds[tokenId].length;
+            tokenDetail.submissions = _submissionsPage(tokenIdToSubmissionIds[tokenId], 0, _maxSubmissions);
+            details[i] = tokenDetail;
+        }
+        return details;
+    }
+
+    function contractAddress() public view returns (address) {
+        return address(this);
+    }
+
+    function redeemEthFromNFT(uint256 _tokenId) external isInitialized {
+        address nftOwner = ownerOf(_tokenId);
+        require(nftOwner == msg.sender, "Only the owner of the NFT can redeem the rewards.");
+        TokenData storage tokenData = _tokenData[_tokenId];
+        uint256 amount = tokenData.amountOfEth;
+
+        uint256 royaltyAmount = _payOutRoyalty(_tokenId, amount);
+        uint256 amountToPayOut = amount - royaltyAmount;
+
+        // The escrow is emptied before the transfer, so a redeem re-entered
+        // from the recipient finds nothing left to pay out.
+        tokenData.amountOfEth = 0;
+        totalEthPaidOut += amountToPayOut;
+        totalBountyAmount -= amountToPayOut;
+
+        (bool success, ) = msg.sender.call{value: amountToPayOut}("");
+        require(success, "Transfer Failed: redeemEthFromNFT.");
+
+        emit Redeemed(msg.sender, _tokenId, amountToPayOut);
+    } 
+
+    function makeSubmission(uint256 _tokenId, string memory submissionMetadataURI) external isInitialized {
+        _makeSubmission(_tokenId, submissionMetadataURI, bytes32(0));
+    }
+
+    function makeSubmissionWithContentId(uint256 _tokenId, bytes32 submissionContentId) external isInitialized {
+        require(submissionContentId != bytes32(0), "Content id cannot be empty.");
+        _makeSubmission(_tokenId, "", submissionContentId);
+    }
+
+    function _makeSubmission(uint256 _tokenId, string memory submissionMetadataURI, bytes32 submissionContentId) internal {
+        (address nftOwner, PROJECT_STATE projectState) = _ownerAndProjectState(_tokenId);
+        require(projectState != PROJECT_STATE.CLOSED, "Project is already closed");
+        if (projectState == PROJECT_STATE.NEW) {
+            _setProjectState(_tokenId, projectState, PROJECT_STATE.ACTIVE);
+        }
+        
+        uint256 submissionId = _submissions.length;
+        if (submissionContentId == bytes32(0)) {
+            _submissions.push(Submission(msg.sender, submissionMetadataURI));
+        } else {
+            _submissions.push().submitter = msg.sender;
+            _submissionContentIds[submissionId] = submissionContentId;
+        }
+
+        tokenIdToSubmissionIds[_tokenId].push(submissionId);
+        addressToTokenIdsWithSubmissions[msg.sender].push(_tokenId);
+        addressToTokenIdSubmissionIds[msg.sender][_tokenId].push(submissionId);
+
+        emit SubmissionMade(msg.sender, _tokenId, submissionMetadataURI, nftOwner, submissionContentId);
+    }
+
+    function declareWinningSubmission(uint256 _tokenId, uint256 _submissionId) external isInitialized {
+        (address nftOwner, PROJECT_STATE projectState) = _ownerAndProjectState(_tokenId);
+        require(nftOwner == msg.sender, "Only the owner of the NFT can declare a winner.");
+        require(projectState != PROJECT_STATE.CLOSED, "Project is already closed.");
+
+        uint256 winningSubmissionId = tokenIdToSubmissionIds[_tokenId][_submissionId];
+        _winningSubmissionIds[_tokenId] = winningSubmissionId;
+        Submission memory winningSubmission = getSubmission(winningSubmissionId);
+
+        safeTransferFrom(nftOwner, winningSubmission.submitter, _tokenId);
+        _setProjectState(_tokenId, projectState, PROJECT_STATE.CLOSED);
+        emit WinningSubmission(winningSubmission.submitter, winningSubmission.metadataURI, _tokenId);
+    }
+
+    function _setProjectState(uint256 _tokenId, PROJECT_STATE _currentState, PROJECT_STATE _newState) internal {
+        // Swap-and-pop _tokenId out of its current group.
+        uint256[] storage currentTokenIds = _tokenIdsByState[_currentState];
+        uint256 index = _tokenIdIndexInState[_tokenId];
+        uint256 lastTokenId = currentTokenIds[currentTokenIds.length - 1];
+        currentTokenIds[index] = lastTokenId;
+        _tokenIdIndexInState[lastTokenId] = index;
+        currentTokenIds.pop();
+
+        _addToStateIndex(_tokenId, _newState);
+        _tokenData[_tokenId].projectState = _newState;
+    }
+
+    function _addToStateIndex(uint256 _tokenId, PROJECT_STATE _projectState) internal {
+        _tokenIdIndexInState[_tokenId] = _tokenIdsByState[_projectState].length;
+        _tokenIdsByState[_projectState].push(_tokenId);
+    }
+
+    function getTokenIdsByState(PROJECT_STATE _projectState, uint256 _offset, uint256 _limit) public view returns (uint256[] memory) {
+        uint256[] storage tokenIds = _tokenIdsByState[_projectState];
+        uint256 end = _pageEnd(tokenIds.length, _offset, _limit);
+
+        uint256[] memory page = new uint256[](end - _offset);
+        for (uint256 i = _offset; i < end; i++) {
+            page[i - _offset] = tokenIds[i];
+        }
+        return page;
+    }
+
+    function getTokenCountByState(PROJECT_STATE _projectState) public view returns (uint256) {
+        return _tokenIdsByState[_projectState].length;
+    }
+
+    function _ownerAndProjectState(uint256 _tokenId) internal view returns (address, PROJECT_STATE) {
+        // Reads only the two storage values the state-changing functions
+        // need, instead of materializing the whole tokenDetails tuple.
+        return (ownerOf(_tokenId), _tokenData[_tokenId].projectState);
+    }
+
+    function amountOfEthInNFT(uint256 _tokenId) public view returns (uint256) {
+        return _tokenData[_tokenId].amountOfEth;
+    }
+
+    function tokenIdToNftCreators(uint256 _tokenId) public view returns (address) {
+        return _tokenData[_tokenId].creator;
+    }
+
+    function tokenIdToProjectState(uint256 _tokenId) public view returns (PROJECT_STATE) {
+        return _tokenData[_tokenId].projectState;
+    }
+
+    function getAmountStoredInNFT(uint256 _tokenId) public view returns (uint256) {
+        return amountOfEthInNFT(_tokenId);
+    }
+
+    function getNFTCreator(uint256 _tokenId) public view returns (address) {
+        return tokenIdToNftCreators(_tokenId);
+    }
+
+    function getRoyaltyNumeratorAndDenominator() public view returns (uint8, uint16) {
+        return (royaltyNumerator, royaltyDenominator);
+    }
+
+    function getArrayOfNFTsFromCreator(address _nftCreator) public view returns (uint256[] memory) {
+        uint256[] memory arrayOfNfts = creatorToTokenIds[_nftCreator];
+        return arrayOfNfts;
+    }
+
+    function getTotalEthPaidOut() public view returns (uint256) {
+        return totalEthPaidOut;
+    }
+
+    function getTotalBountyAmount() public view returns (uint256) {
+        return totalBountyAmount;
+    }
+
+    function getSubmission(uint256 _submissionId) public view returns (Submission memory) {
+        Submission memory submission = _submissions[_submissionId];
+        bytes32 submissionContentId = _submissionContentIds[_submissionId];
+        if (submissionContentId != bytes32(0)) {
+            submission.metadataURI = _contentURI(submissionContentId);
+        }
+        return submission;
+    }
+
+    function getSubmissionsForTokenId(uint256 _tokenId) public view returns (Submission[] memory) {
+        return _submissionsPage(tokenIdToSubmissionIds[_tokenId], 0, type(uint256).max);
+    }
+
+    function getSubmissionsForTokenIdPaginated(uint256 _tokenId, uint256 _offset, uint256 _limit) public view returns (Submission[] memory) {
+        return _submissionsPage(tokenIdToSubmissionIds[_tokenId], _offset, _limit);
+    }
+
+    function getSubmissionCount(uint256 _tokenId) public view returns (uint256) {
+        return tokenIdToSubmissionIds[_tokenId].length;
+    }
+
+    function _submissionsPage(uint256[] storage _submissionIds, uint256 _offset, uint256 _limit) internal view returns (Submission[] memory) {
+        // Copies at most _limit submissions so the cost of a page does not
+        // grow with the total number of ids in _submissionIds.
+        uint256 end = _pageEnd(_submissionIds.length, _offset, _limit);
+
+        Submission[] memory page = new Submission[](end - _offset);
+        for (uint256 i = _offset; i < end; i++) {
+            page[i - _offset] = getSubmission(_submissionIds[i]);
+        }
+        return page;
+    }
+
+    function _pageEnd(uint256 _total, uint256 _offset, uint256 _limit) internal pure returns (uint256) {
+        // End (exclusive) of the page starting at _offset; equal to _offset
+        // when the page is empty.
+        if (_offset >= _total) {
+            return _offset;
+        }
+        return _total - _offset > _limit ? _offset + _limit : _total;
+    }
+
+    function tokenIdToSubmissions(uint256 _tokenId, uint256 _index) public view returns (address, string memory) {
+        Submission memory submission = getSubmission(tokenIdToSubmissionIds[_tokenId][_index]);
+        return (submission.submitter, submission.metadataURI);
+    }
+
+    function addressToTokenIdSubmissions(address _submitter, uint256 _tokenId, uint256 _index) public view returns (address, string memory) {
+        Submission memory submission = getSubmission(addressToTokenIdSubmissionIds[_submitter][_tokenId][_index]);
+        return (submission.submitter, submission.metadataURI);
+    }
+
+    function tokenIdToWinningSubmission(uint256 _tokenId) public view returns (address, string memory) {
+        Submission memory winningSubmission = getWinningSubmissionForTokenId(_tokenId);
+        return (winningSubmission.submitter, winningSubmission.metadataURI);
+    }
+
+    function getWinningSubmissionForTokenId(uint256 _tokenId) public view returns (Submission memory) {
+        Submission memory winningSubmission;
+        // A project is only closed by declareWinningSubmission, so a closed
+        // project always has a valid winning submission id.
+        if (_tokenData[_tokenId].projectState == PROJECT_STATE.CLOSED) {
+            winningSubmission = getSubmission(_winningSubmissionIds[_tokenId]);
+        }
+        return winningSubmission;
+    }
+
+    function getTokenIdsWithSubmissionsFromAddress(address _submitter) public view returns (uint256[] memory) {
+        return addressToTokenIdsWithSubmissions[_submitter];
+    }
+
+    function getSubmissionsFromAddressForTokenId(address _submitter, uint256 _tokenId) public view returns (Submission[] memory) {
+        return _submissionsPage(addressToTokenIdSubmissionIds[_submitter][_tokenId], 0, type(uint256).max);
+    }
+
+    function setContentBaseURI(string memory _contentBaseURI) public onlyOwner {
+        contentBaseURI = _contentBaseURI;
+        emit ContentBaseURIUpdated(_contentBaseURI);
+    }
+
+    function _contentURI(bytes32 _contentId) internal view returns (string memory) {
+        bytes memory digest = new bytes(64);
+        for (uint256 i = 0; i < 32; i++) {
+            digest[2 * i] = _HEX_SYMBOLS[uint8(_contentId[i]) >> 4];
+            digest[2 * i + 1] = _HEX_SYMBOLS[uint8(_contentId[i]) & 0x0f];
+        }
+        return string(abi.encodePacked(contentBaseURI, digest));
+    }
+
+    // The following functions are overrides required by Solidity.
+
+    function _burn(uint256 tokenId) internal virtual override(ERC721, ERC721URIStorage, ERC721Royalty) {
+        super._burn(tokenId);
+    }
+
+    function tokenURI(uint256 tokenId)
+        public
+        view
+        virtual
+        override(ERC721, ERC721URIStorage)
+        returns (string memory)
+    {
+        bytes32 tokenContentId = _tokenContentIds[tokenId];
+        if (tokenContentId != bytes32(0)) {
+            return _contentURI(tokenContentId);
+        }
+        return super.tokenURI(tokenId);
+    }
+
+    function supportsInterface(bytes4 interfaceId)
+        public
+        view
+        virtual
+        override(ERC721, ERC721Royalty)
+        returns (bool)
+    {
+        return super.supportsInterface(interfaceId);
+    }
+}
@@ -0,0 +1,52 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+import "@openzeppelin/contracts/token/ERC721/extensions/IERC721Enumerable.sol";
+import "./OpsNFTBase.sol";
+
+/// @custom:security-contact block-ops.eth
+/// @notice OpsNFT without ERC721Enumerable's index mappings. Token ids are
+/// minted sequentially from 0 and are never burned, so totalSupply and
+/// tokenByIndex are answered from _tokenIdCounter, and tokenOfOwnerByIndex
+/// scans the ids in a view. Mints and transfers no longer pay to keep
+/// the indexes up to date. tokenOfOwnerByIndex returns the same tokens as
+/// ERC721Enumerable, in ascending id order.
+contract OpsNFTSequential is OpsNFTBase, IERC721Enumerable {
+    function totalSupply() public view override returns (uint256) {
+        return _tokenIdCounter.current();
+    }
+
+    function tokenByIndex(uint256 index) public view override returns (uint256) {
+        require(index < totalSupply(), "ERC721Enumerable: global index out of bounds");
+        return index;
+    }
+
+    /// @dev Scans every token id, so it costs O(totalSupply) gas, growing by
+    /// an ownerOf call per token ever minted. Only meant for off-chain view
+    /// calls: a contract calling it in a transaction will eventually run
+    /// out of gas as the supply grows.
+    function tokenOfOwnerByIndex(address owner, uint256 index) public view override returns (uint256) {
+        require(index < balanceOf(owner), "ERC721Enumerable: owner index out of bounds");
+        uint256 supply = totalSupply();
+        for (uint256 tokenId = 0; tokenId < supply; tokenId++) {
+            if (ownerOf(tokenId) == owner) {
+                if (index == 0) {
+                    return tokenId;
+                }
+                index--;
+            }
+        }
+        revert("ERC721Enumerable: owner index out of bounds");
+    }
+
+    // The following functions are overrides required by Solidity.
+
+    function supportsInterface(bytes4 interfaceId)
+        public
+        view
+        override(IERC165, OpsNFTBase)
+        returns (bool)
+    {
+        return interfaceId == type(IERC721Enumerable).interfaceId || super.supportsInterface(interfaceId);
+    }
+}
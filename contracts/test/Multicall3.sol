@@ -0,0 +1,31 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+/// @notice Development-network stand-in for Multicall3
+/// (0xcA11bde05977b3631167028862bE2a173976CA11), limited to the calls
+/// scripts/utils.py makes. Same ABI as the deployed contract.
+contract Multicall3 {
+    struct Call3 {
+        address target;
+        bool allowFailure;
+        bytes callData;
+    }
+
+    struct Result {
+        bool success;
+        bytes returnData;
+    }
+
+    function aggregate3(Call3[] calldata calls) public payable returns (Result[] memory returnData) {
+        returnData = new Result[](calls.length);
+        for (uint256 i = 0; i < calls.length; i++) {
+            Result memory result = returnData[i];
+            (result.success, result.returnData) = calls[i].target.call(calls[i].callData);
+            require(calls[i].allowFailure || result.success, "Multicall3: call failed");
+        }
+    }
+
+    function getBlockNumber() public view returns (uint256 blockNumber) {
+        blockNumber = block.number;
+    }
+}
@@ -0,0 +1,38 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+import "@openzeppelin/contracts/token/ERC721/IERC721Receiver.sol";
+import "../OpsNFTBase.sol";
+
+/// @notice Development-network bounty winner that redeems its bounty again
+/// from inside the ETH transfer of redeemEthFromNFT, for the reentrancy
+/// tests.
+contract ReentrantRedeemer is IERC721Receiver {
+    OpsNFTBase public immutable opsNFT;
+    uint256 public reentries;
+    uint256 private _tokenId;
+
+    constructor(OpsNFTBase _opsNFT) {
+        opsNFT = _opsNFT;
+    }
+
+    function makeSubmission(uint256 tokenId, string memory submissionMetadataURI) external {
+        opsNFT.makeSubmission(tokenId, submissionMetadataURI);
+    }
+
+    function redeem(uint256 tokenId) external {
+        _tokenId = tokenId;
+        opsNFT.redeemEthFromNFT(tokenId);
+    }
+
+    receive() external payable {
+        if (reentries == 0) {
+            reentries++;
+            opsNFT.redeemEthFromNFT(_tokenId);
+        }
+    }
+
+    function onERC721Received(address, address, uint256, bytes calldata) external pure override returns (bytes4) {
+        return IERC721Receiver.onERC721Received.selector;
+    }
+}
@@ -0,0 +1,233 @@
+import asyncio
+import itertools
+import time
+
+import aiohttp
+from eth_abi import decode_abi, encode_abi
+from eth_utils import function_abi_to_4byte_selector
+from eth_utils.abi import collapse_if_tuple
+from hexbytes import HexBytes
+
+from scripts.events import format_value
+
+
+class AsyncOpsNFTClient:
+    def __init__(
+        self,
+        rpc_url: str,
+        address: str,
+        abi: list,
+        max_concurrency: int = 50,
+        timeout: float = 10,
+        coalesce: bool = True,
+    ):
+        """
+        Asyncio client for the view functions of an OpsNFT. Calls are sent
+        as eth_call JSON-RPC requests over a pooled aiohttp session, with at
+        most max_concurrency requests in flight, so a service can serve
+        many users without blocking on each round-trip.
+
+        Use it as an async context manager:
+
+            async with AsyncOpsNFTClient(rpc_url, nft.address, nft.abi) as client:
+                details = await client.call_many(
+                    [("tokenDetails", (token_id,)) for token_id in token_ids]
+                )
+
+        Arguments:
+            rpc_url (str): HTTP endpoint of the node.
+            address (str): Address of the OpsNFT contract.
+            abi (list): ABI of the contract.
+            max_concurrency (int): Maximum number of requests in flight,
+                                   which is also the connection pool size.
+            timeout (float): Seconds before a request is abandoned with an
+                             asyncio.TimeoutError.
+            coalesce (bool): Share one request between concurrent calls with
+                             the same method, arguments and block. The
+                             number of requests saved is counted in
+                             stats["coalesced"].
+        """
+        self.rpc_url = rpc_url
+        self.address = address
+        self.functions = {
+            item["name"]: item for item in abi if item["type"] == "function"
+        }
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.coalesce = coalesce
+        self.stats = {
+            "calls": 0,
+            "coalesced": 0,
+            "requests": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+        self._in_flight_calls = {}
+        self._ids = itertools.count()
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    async def call(self, method_name: str, *args, block_identifier="latest"):
+        """
+        Arguments:
+            method_name (str): Name of the view function.
+            *args: Its arguments.
+            block_identifier (int | str): Block to read at.
+
+        Returns:
+            The decoded return value, formatted like Brownie's. Coalesced
+            calls return the same object.
+        """
+        self.stats["calls"] += 1
+        if not self.coalesce:
+            return await self._call(method_name, args, block_identifier)
+
+        key = (method_name, _hashable(args), block_identifier)
+        future = self._in_flight_calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._call(method_name, args, block_identifier)
+            )
+            self._in_flight_calls[key] = future
+            future.add_done_callback(lambda _: self._in_flight_calls.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        # Shielded, so that a caller being cancelled does not cancel the
+        # request the other callers are waiting on.
+        return await asyncio.shield(future)
+
+    async def _call(self, method_name: str, args: tuple, block_identifier):
+        function_abi = self.functions[method_name]
+        data = function_abi_to_4byte_selector(function_abi) + encode_abi(
+            [collapse_if_tuple(item) for item in function_abi["inputs"]], args
+        )
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+        result = await self._request(
+            "eth_call",
+            [{"to": self.address, "data": HexBytes(data).hex()}, block_identifier],
+        )
+
+        outputs = function_abi["outputs"]
+        values = decode_abi(
+            [collapse_if_tuple(item) for item in outputs], HexBytes(result)
+        )
+        values = [format_value(item, value) for item, value in zip(outputs, values)]
+        return values[0] if len(values) == 1 else tuple(values)
+
+    async def call_many(self, calls: list):
+        """
+        Arguments:
+            calls (list): (method name, args) pairs.
+
+        Returns:
+            list: The result of each call, in order.
+        """
+        return await asyncio.gather(
+            *[self.call(method_name, *args) for method_name, args in calls]
+        )
+
+    async def _request(self, method: str, params: list):
+        payload = {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": params,
+        }
+        async with self._semaphore:
+            self.stats["requests"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(
+                self.stats["max_in_flight"], self.stats["in_flight"]
+            )
+            try:
+                async with self._session.post(self.rpc_url, json=payload) as response:
+                    response.raise_for_status()
+                    body = await response.json()
+            finally:
+                self.stats["in_flight"] -= 1
+        if "error" in body:
+            raise ValueError(body["error"])
+        return body["result"]
+
+
+def _hashable(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+async def _timed_async_calls(rpc_url, address, abi, token_ids, max_concurrency):
+    async with AsyncOpsNFTClient(rpc_url, address, abi, max_concurrency) as client:
+        start_time = time.perf_counter()
+        await client.call_many([("tokenDetails", (token_id,)) for token_id in token_ids])
+        return time.perf_counter() - start_time
+
+
+def benchmark(contract, token_ids: list, max_concurrency: int = 50):
+    """
+    Reads tokenDetails for every token id with the synchronous Brownie
+    contract, then concurrently with AsyncOpsNFTClient, and prints the
+    requests per second of both.
+
+    Arguments:
+        contract (brownie.network.contract.ProjectContract): The OpsNFT.
+        token_ids (list): Token ids to read.
+        max_concurrency (int): Maximum number of async requests in flight.
+
+    Returns:
+        dict: Seconds taken by the "sync" and "async" runs.
+    """
+    # Brownie is only imported by the entry points, so that services can
+    # use the client without the Brownie project.
+    from brownie import web3
+
+    start_time = time.perf_counter()
+    for token_id in token_ids:
+        contract.tokenDetails(token_id)
+    seconds = {"sync": time.perf_counter() - start_time}
+
+    seconds["async"] = asyncio.run(
+        _timed_async_calls(
+            web3.provider.endpoint_uri,
+            contract.address,
+            contract.abi,
+            token_ids,
+            max_concurrency,
+        )
+    )
+    for name, elapsed in seconds.items():
+        print(
+            f"{name}: {len(token_ids)} tokenDetails calls in {elapsed:.2f}s "
+            f"({len(token_ids) / elapsed:.0f}/s)"
+        )
+    return seconds
+
+
+def main(number_of_tokens: int = 500):
+    from brownie import OpsNFT, Wei
+
+    from scripts.utils import Utils
+
+    ops_nft = OpsNFT[-1]
+    account = Utils().get_account()
+    # Batches of 20 stay well under the block gas limit.
+    amounts = [Wei("0.01 ether")] * 20
+    while ops_nft.totalSupply() < number_of_tokens:
+        ops_nft.safeMintBatch(
+            ["https://block-ops.xyz"] * len(amounts),
+            amounts,
+            {"from": account, "value": sum(amounts)},
+        )
+    benchmark(ops_nft, list(range(number_of_tokens)))
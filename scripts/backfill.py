@@ -0,0 +1,191 @@
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+
+from web3 import Web3
+
+from scripts.events import OPS_NFT_BUILD_PATH, decode_log, event_topics, load_abi
+from scripts.log_fetcher import AdaptiveLogFetcher
+
+# Set in every worker process by _init_worker.
+_worker = {}
+
+
+def _init_worker(rpc_url: str, address: str, build_path: str):
+    _worker["w3"] = Web3(Web3.HTTPProvider(rpc_url))
+    _worker["address"] = address
+    _worker["topics"] = event_topics(load_abi(build_path))
+
+
+def _backfill_shard(shard: tuple):
+    from_block, to_block = shard
+    fetcher = AdaptiveLogFetcher(_worker["w3"], _worker["address"], _worker["topics"])
+    events = []
+    for _, _, logs in fetcher.fetch(from_block, to_block):
+        events += [decode_log(log, _worker["topics"]) for log in logs]
+    events.sort(key=lambda event: (event["blockNumber"], event["logIndex"]))
+    return events
+
+
+def split_block_range(from_block: int, to_block: int, number_of_shards: int):
+    """
+    Splits a block range into consecutive shards of about the same size.
+
+    Arguments:
+        from_block (int): First block.
+        to_block (int): Last block, included.
+        number_of_shards (int): Maximum number of shards.
+
+    Returns:
+        list: (first block, last block) of each shard, in block order.
+    """
+    number_of_blocks = to_block - from_block + 1
+    number_of_shards = max(1, min(number_of_shards, number_of_blocks))
+    shard_size, remainder = divmod(number_of_blocks, number_of_shards)
+    shards = []
+    start_block = from_block
+    for index in range(number_of_shards):
+        end_block = start_block + shard_size - 1 + (1 if index < remainder else 0)
+        shards.append((start_block, end_block))
+        start_block = end_block + 1
+    return shards
+
+
+def backfill(
+    rpc_url: str,
+    address: str,
+    from_block: int,
+    to_block: int,
+    output_path: str,
+    workers: int = None,
+    shards_per_worker: int = 4,
+    build_path: str = OPS_NFT_BUILD_PATH,
+):
+    """
+    Extracts the OpsNFT event history between two blocks with a pool of
+    processes. Each worker fetches and decodes the logs of a shard of the
+    block range with the ABI from the build artifact; the shards are then
+    written to output_path in block and log index order, one JSON encoded
+    event per line.
+
+    Arguments:
+        rpc_url (str): HTTP endpoint of the node.
+        address (str): Address of the OpsNFT contract.
+        from_block (int): First block.
+        to_block (int): Last block, included.
+        output_path (str): File to write the events to.
+        workers (int): Number of processes. Defaults to the number of cores.
+        shards_per_worker (int): The range is split in more shards than
+                                 workers so busy stretches are spread out.
+        build_path (str): Build artifact to read the ABI from.
+
+    Returns:
+        dict: Number of events, blocks, workers and seconds taken.
+    """
+    workers = workers or os.cpu_count()
+    shards = split_block_range(from_block, to_block, workers * shards_per_worker)
+
+    start_time = time.perf_counter()
+    number_of_events = 0
+    with multiprocessing.Pool(
+        workers, initializer=_init_worker, initargs=(rpc_url, address, build_path)
+    ) as pool, open(output_path, "w") as f:
+        # imap returns the shards in order, and each shard is sorted, so
+        # writing them one after the other keeps the whole file sorted.
+        for events in pool.imap(_backfill_shard, shards):
+            for event in events:
+                f.write(json.dumps(event) + "\n")
+            number_of_events += len(events)
+
+    return {
+        "events": number_of_events,
+        "blocks": to_block - from_block + 1,
+        "workers": workers,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+
+def benchmark(rpc_url: str, address: str, from_block: int, to_block: int, worker_counts: list = None):
+    """
+    Runs the backfill of the same block range with an increasing number of
+    workers and prints how the time taken scales. Against a local Ganache
+    node, which answers one request at a time, the speedup mostly comes
+    from decoding in parallel.
+
+    Arguments:
+        rpc_url (str): HTTP endpoint of the node.
+        address (str): Address of the OpsNFT contract.
+        from_block (int): First block.
+        to_block (int): Last block, included.
+        worker_counts (list): Number of workers of each run. Defaults to
+                              powers of two up to the number of cores.
+
+    Returns:
+        list: The result of backfill for each run.
+    """
+    if worker_counts is None:
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= os.cpu_count():
+            worker_counts.append(worker_counts[-1] * 2)
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for workers in worker_counts:
+            output_path = os.path.join(output_dir, f"events-{workers}.jsonl")
+            results.append(
+                backfill(rpc_url, address, from_block, to_block, output_path, workers)
+            )
+
+    print("workers | events | seconds | events/sec | speedup")
+    for result in results:
+        print(
+            f"{result['workers']} | {result['events']} | {result['seconds']:.2f} | "
+            f"{result['events'] / result['seconds']:.0f} | "
+            f"{results[0]['seconds'] / result['seconds']:.2f}x"
+        )
+    return results
+
+
+def generate_history(contract, number_of_bounties: int = 200, submissions_per_bounty: int = 4):
+    """
+    Fills a development chain with bounties and submissions to backfill.
+
+    Arguments:
+        contract (brownie.network.contract.ProjectContract): The OpsNFT.
+        number_of_bounties (int): Number of bounties to mint.
+        submissions_per_bounty (int): Number of submissions on each bounty.
+    """
+    from brownie import Wei
+
+    from scripts.utils import Utils
+
+    utils = Utils()
+    creator = utils.get_account()
+    submitter = utils.get_account(index=1)
+    for _ in range(number_of_bounties):
+        safe_mint_tx = contract.safeMint(
+            "https://block-ops.xyz", {"from": creator, "value": Wei("0.01 ether")}
+        )
+        token_id = safe_mint_tx.events["NFTMinted"]["_tokenId"]
+        for _ in range(submissions_per_bounty):
+            contract.makeSubmission(
+                token_id, "https://block-ops.xyz/submission", {"from": submitter}
+            )
+        contract.declareWinningSubmission(token_id, 0, {"from": creator})
+
+
+def main():
+    # Brownie is only imported by the entry points, so that worker
+    # processes do not need the Brownie project.
+    from brownie import web3
+
+    from scripts.deploy import deploy_ops_nft
+
+    from_block = web3.eth.block_number + 1
+    ops_nft = deploy_ops_nft()
+    generate_history(ops_nft)
+    benchmark(
+        web3.provider.endpoint_uri, ops_nft.address, from_block, web3.eth.block_number
+    )
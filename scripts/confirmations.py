@@ -0,0 +1,160 @@
+import time
+
+from brownie import OpsNFT, web3
+from hexbytes import HexBytes
+from web3.exceptions import BlockNotFound
+
+from scripts.events import decode_log, event_topics
+
+
+class ConfirmationTracker:
+    def __init__(
+        self,
+        contract=None,
+        confirmations: int = 12,
+        on_log=None,
+        on_confirmed=None,
+        on_rollback=None,
+        start_block: int = None,
+    ):
+        """
+        Follows the chain head and reports OpsNFT event logs and tracked
+        transactions as soon as they are mined, instead of waiting a fixed
+        number of blocks. The hashes of the last `confirmations` blocks are
+        kept, so when one of them is replaced by a reorg everything that was
+        reported from it is rolled back.
+
+        Every callback receives one item: a decoded log, as returned by
+        scripts.events.decode_log, or a transaction as a dict with
+        transactionHash, blockNumber and blockHash.
+
+        Arguments:
+            contract (brownie.network.contract.ProjectContract): The OpsNFT
+                to follow. Defaults to the most recently deployed one.
+            confirmations (int): Number of blocks, including the block an
+                                 item was mined in, after which it is final.
+                                 Reorgs deeper than this are not detected.
+            on_log (callable): Called when an item is seen at the head.
+            on_confirmed (callable): Called when an item reaches
+                                     `confirmations` blocks.
+            on_rollback (callable): Called when the block of an item that
+                                    was not confirmed yet is orphaned.
+            start_block (int): First block to follow. Defaults to the block
+                               after the current head.
+        """
+        self.contract = contract if contract is not None else OpsNFT[-1]
+        self.topics = event_topics(self.contract.abi)
+        self.confirmations = confirmations
+        self.on_log = on_log or (lambda item: None)
+        self.on_confirmed = on_confirmed or (lambda item: None)
+        self.on_rollback = on_rollback or (lambda item: None)
+
+        self.next_block = (
+            start_block if start_block is not None else web3.eth.block_number + 1
+        )
+        # Unconfirmed blocks: number -> {"hash": ..., "items": [...]}
+        self.blocks = {}
+        self.pending_transactions = set()
+
+    def track_transaction(self, tx_hash):
+        """
+        Reports the transaction with the same callbacks as the logs, once
+        it is mined in a block that has not been processed yet.
+
+        Arguments:
+            tx_hash (str): Hash of the transaction.
+        """
+        self.pending_transactions.add(HexBytes(tx_hash).hex())
+
+    def poll(self):
+        """
+        Rolls back the orphaned blocks, then processes every block up to
+        the current head and confirms the ones that are deep enough.
+
+        Returns:
+            int: The current head block number.
+        """
+        head = web3.eth.block_number
+        for number in sorted(self.blocks, reverse=True):
+            if number <= head and self._block_hash(number) == self.blocks[number]["hash"]:
+                break
+            self._rollback(number)
+
+        while self.next_block <= head:
+            if not self._process_block(self.next_block):
+                # The chain changed under us, the next poll sorts it out.
+                break
+            self.next_block += 1
+
+        for number in sorted(self.blocks):
+            if head - number + 1 < self.confirmations:
+                break
+            for item in self.blocks.pop(number)["items"]:
+                self.on_confirmed(item)
+        return head
+
+    def _block_hash(self, number: int):
+        try:
+            return HexBytes(web3.eth.get_block(number)["hash"]).hex()
+        except BlockNotFound:
+            return None
+
+    def _process_block(self, number: int):
+        try:
+            block = web3.eth.get_block(number)
+        except BlockNotFound:
+            return False
+        block_hash = HexBytes(block["hash"]).hex()
+        parent = self.blocks.get(number - 1)
+        if parent is not None and parent["hash"] != HexBytes(block["parentHash"]).hex():
+            return False
+
+        logs = web3.eth.get_logs(
+            {
+                "fromBlock": number,
+                "toBlock": number,
+                "address": self.contract.address,
+                "topics": [list(self.topics)],
+            }
+        )
+        # The block may have been replaced between the two requests.
+        if any(HexBytes(log["blockHash"]).hex() != block_hash for log in logs):
+            return False
+
+        items = []
+        for tx_hash in block["transactions"]:
+            tx_hash = HexBytes(tx_hash).hex()
+            if tx_hash in self.pending_transactions:
+                self.pending_transactions.remove(tx_hash)
+                items.append(
+                    {
+                        "transactionHash": tx_hash,
+                        "blockNumber": number,
+                        "blockHash": block_hash,
+                    }
+                )
+        items += [decode_log(log, self.topics) for log in logs]
+
+        self.blocks[number] = {"hash": block_hash, "items": items}
+        for item in items:
+            self.on_log(item)
+        return True
+
+    def _rollback(self, number: int):
+        for item in self.blocks.pop(number)["items"]:
+            if "event" not in item:
+                # Wait for the transaction to be mined again.
+                self.pending_transactions.add(item["transactionHash"])
+            self.on_rollback(item)
+        self.next_block = min(self.next_block, number)
+
+
+def main(poll_interval: float = 2):
+    tracker = ConfirmationTracker(
+        on_log=lambda item: print(f"seen: {item}"),
+        on_confirmed=lambda item: print(f"confirmed: {item}"),
+        on_rollback=lambda item: print(f"rolled back: {item}"),
+    )
+    while True:
+        tracker.poll()
+        time.sleep(poll_interval)
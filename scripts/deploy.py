@@ -3,6 +3,7 @@ import brownie
 from brownie import OpsNFT, accounts
 from web3 import Web3
 import shutil
+from scripts.models import TokenDetails
 from scripts.utils import Utils
 
 
@@ -48,9 +49,8 @@ def deploy_and_test():
     ops_token_tx.wait(1)
 
     token_id = 0
-    token_details = ops_token.tokenDetails(token_id)
+    token_details = TokenDetails.from_tuple(ops_token.tokenDetails(token_id))
     print(f"token_details: {token_details}")
-    (nft_owner, token_metadata, token_value, initialized) = token_details
 
     owner_of_tx = ops_token.ownerOf(token_id)
     print(f"account: {account}")
@@ -63,8 +63,8 @@ def deploy_and_test():
     )
     transfer_tx.wait(1)
 
-    token_details = ops_token.tokenDetails(token_id)
-    (nft_owner, token_metadata, token_value, initialized) = token_details
+    token_details = TokenDetails.from_tuple(ops_token.tokenDetails(token_id))
+    print(f"token_details after transfer: {token_details}")
 
     nft_balance = Web3.fromWei(ops_token.balance(), "ether")
     first_account_balance = Web3.fromWei(account.balance(), "ether")
@@ -0,0 +1,140 @@
+import json
+
+from eth_abi import decode_abi
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from hexbytes import HexBytes
+
+OPS_NFT_BUILD_PATH = "build/contracts/OpsNFT.json"
+OPS_NFT_EVENTS = [
+    "NFTMinted",
+    "SubmissionMade",
+    "Redeemed",
+    "RoyaltyPaid",
+    "WinningSubmission",
+    "Transfer",
+    "ContentBaseURIUpdated",
+]
+
+
+def load_abi(build_path: str = OPS_NFT_BUILD_PATH):
+    """
+    Reads the ABI of a contract from its Brownie build artifact.
+
+    Arguments:
+        build_path (str): Path to the build artifact, eg.
+                          build/contracts/OpsNFT.json.
+
+    Returns:
+        list: The ABI of the contract.
+    """
+    with open(build_path) as f:
+        return json.load(f)["abi"]
+
+
+def event_topics(abi: list, event_names: list = OPS_NFT_EVENTS):
+    """
+    Given a contract ABI, maps the topic (keccak of the event signature)
+    of each of the requested events to the ABI of that event.
+
+    Arguments:
+        abi (list): The ABI of the contract.
+        event_names (list): Names of the events to keep.
+
+    Returns:
+        dict: Topic, as a 0x prefixed hex string, to event ABI.
+    """
+    return {
+        HexBytes(event_abi_to_log_topic(item)).hex(): item
+        for item in abi
+        if item["type"] == "event" and item["name"] in event_names
+    }
+
+
+def format_value(abi_item: dict, value):
+    """
+    Formats a value decoded by eth_abi the way Brownie returns it:
+    checksummed addresses, 0x prefixed hex strings for bytes, lists for
+    arrays and tuples for structs.
+
+    Arguments:
+        abi_item (dict): ABI of the input or output the value belongs to.
+        value: The decoded value.
+
+    Returns:
+        The formatted value.
+    """
+    abi_type = abi_item["type"]
+    if abi_type.endswith("]"):
+        item_abi = dict(abi_item, type=abi_type[: abi_type.rindex("[")])
+        return [format_value(item_abi, item) for item in value]
+    if abi_type == "tuple":
+        return tuple(
+            format_value(component, item)
+            for component, item in zip(abi_item["components"], value)
+        )
+    if abi_type == "address":
+        return to_checksum_address(value)
+    if isinstance(value, bytes):
+        return HexBytes(value).hex()
+    return value
+
+
+def decode_log(log, topics: dict):
+    """
+    Decodes a raw log, as returned by eth_getLogs, with the ABI of the
+    event its first topic points to.
+
+    Arguments:
+        log (dict): The log. Topics and data can either be hex strings
+                    (raw JSON-RPC) or bytes (web3).
+        topics (dict): Topic to event ABI, as returned by event_topics.
+
+    Returns:
+        dict: The event name, its decoded arguments and where the log
+              was found, or None if the log is not one of the events
+              in topics.
+    """
+    log_topics = [HexBytes(topic) for topic in log["topics"]]
+    if not log_topics or log_topics[0].hex() not in topics:
+        return None
+    event_abi = topics[log_topics[0].hex()]
+
+    indexed_inputs = [item for item in event_abi["inputs"] if item["indexed"]]
+    data_inputs = [item for item in event_abi["inputs"] if not item["indexed"]]
+    values = dict(
+        zip(
+            [item["name"] for item in data_inputs],
+            decode_abi([item["type"] for item in data_inputs], HexBytes(log["data"])),
+        )
+    )
+    hashed_inputs = set()
+    for item, topic in zip(indexed_inputs, log_topics[1:]):
+        # Indexed dynamic values are only stored as their hash.
+        if item["type"] in ("string", "bytes", "tuple") or item["type"].endswith("]"):
+            values[item["name"]] = topic.hex()
+            hashed_inputs.add(item["name"])
+        else:
+            (values[item["name"]],) = decode_abi([item["type"]], topic)
+
+    args = {
+        item["name"]: values[item["name"]]
+        if item["name"] in hashed_inputs
+        else format_value(item, values[item["name"]])
+        for item in event_abi["inputs"]
+    }
+    return {
+        "event": event_abi["name"],
+        "args": args,
+        "address": to_checksum_address(log["address"]),
+        "blockNumber": _to_int(log["blockNumber"]),
+        "blockHash": HexBytes(log["blockHash"]).hex(),
+        "transactionHash": HexBytes(log["transactionHash"]).hex(),
+        "logIndex": _to_int(log["logIndex"]),
+    }
+
+
+def _to_int(value):
+    # Raw JSON-RPC responses encode quantities as hex strings.
+    if isinstance(value, str):
+        return int(value, 16)
+    return value
@@ -0,0 +1,268 @@
+import json
+import math
+
+from brownie import Wei, web3
+
+from scripts.utils import Utils
+
+# geth's default --rpc.gascap, the most gas an eth_call can use.
+DEFAULT_CALL_GAS_CAP = 50_000_000
+
+# Functions that copy a dynamic array, and what the array grows with.
+CURVES = {
+    "tokenDetails": "submissions",
+    "getSubmissionsForTokenId": "submissions",
+    "getTokenIdsWithSubmissionsFromAddress": "submissions",
+    "getArrayOfNFTsFromCreator": "tokens",
+}
+
+
+def fit_linear(sizes: list, gas: list):
+    """
+    Least squares fit of gas = intercept + slope * size.
+
+    Arguments:
+        sizes (list): Array lengths.
+        gas (list): Gas used at each length.
+
+    Returns:
+        tuple: (intercept, slope)
+    """
+    number_of_points = len(sizes)
+    mean_size = sum(sizes) / number_of_points
+    mean_gas = sum(gas) / number_of_points
+    variance = sum((size - mean_size) ** 2 for size in sizes)
+    if variance == 0:
+        return mean_gas, 0.0
+    slope = (
+        sum((size - mean_size) * (g - mean_gas) for size, g in zip(sizes, gas)) / variance
+    )
+    return mean_gas - slope * mean_size, slope
+
+
+def fit_quadratic(sizes: list, gas: list):
+    """
+    Least squares fit of gas = a + b * size + c * size ** 2. Memory
+    expansion costs grow with the square of the memory used, so a function
+    returning a large array ends up with a quadratic term.
+
+    Arguments:
+        sizes (list): At least three distinct array lengths.
+        gas (list): Gas used at each length.
+
+    Returns:
+        tuple: (a, b, c)
+    """
+    sums = [sum(size ** power for size in sizes) for power in range(5)]
+    matrix = [[sums[row + column] for column in range(3)] for row in range(3)]
+    vector = [sum(g * size ** power for size, g in zip(sizes, gas)) for power in range(3)]
+    return tuple(_solve(matrix, vector))
+
+
+def _solve(matrix: list, vector: list):
+    # Gaussian elimination with partial pivoting.
+    size = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for row in range(column + 1, size):
+            factor = rows[row][column] / rows[column][column]
+            for index in range(column, size + 1):
+                rows[row][index] -= factor * rows[column][index]
+    solution = [0.0] * size
+    for row in reversed(range(size)):
+        known = sum(rows[row][index] * solution[index] for index in range(row + 1, size))
+        solution[row] = (rows[row][size] - known) / rows[row][row]
+    return solution
+
+
+def classify_growth(sizes: list, gas: list, tolerance: float = 0.01):
+    """
+    Arguments:
+        sizes (list): Array lengths.
+        gas (list): Gas used at each length.
+        tolerance (float): Fraction of its smallest cost a function may vary
+                           by, and still count as constant.
+
+    Returns:
+        str: "constant", "linear" or "super-linear". The last one means the
+             quadratic term adds more than tolerance to the cost at the
+             largest length.
+    """
+    if max(gas) - min(gas) <= tolerance * min(gas):
+        return "constant"
+    if len(set(sizes)) >= 3:
+        a, b, c = fit_quadratic(sizes, gas)
+        largest_size = max(sizes)
+        if c > 0 and c * largest_size ** 2 > tolerance * (a + b * largest_size):
+            return "super-linear"
+    return "linear"
+
+
+def max_size_under_cap(coefficients: tuple, gas_cap: int):
+    """
+    Largest array length whose fitted cost stays under gas_cap.
+
+    Arguments:
+        coefficients (tuple): (a, b, c) of gas = a + b * size + c * size ** 2.
+        gas_cap (int): Gas available.
+
+    Returns:
+        int: The length, or None if the cost does not grow with the length.
+    """
+    a, b, c = coefficients
+    if c > 0:
+        size = (-b + math.sqrt(b ** 2 - 4 * c * (a - gas_cap))) / (2 * c)
+    elif b > 0:
+        size = (gas_cap - a) / b
+    else:
+        return None
+    return max(0, math.floor(size))
+
+
+def analyze_curve(sizes: list, gas: list, gas_caps: dict, tolerance: float = 0.01):
+    """
+    Arguments:
+        sizes (list): Array lengths.
+        gas (list): Gas used at each length.
+        gas_caps (dict): Name -> gas limit to find the largest length for,
+                         eg. {"block": 30_000_000}.
+        tolerance (float): See classify_growth.
+
+    Returns:
+        dict: The fit, the growth and, for each cap, the largest length
+              that stays under it.
+    """
+    growth = classify_growth(sizes, gas, tolerance)
+    if growth == "super-linear":
+        coefficients = fit_quadratic(sizes, gas)
+    else:
+        coefficients = fit_linear(sizes, gas) + (0.0,)
+    if growth == "constant":
+        max_sizes = {name: None for name in gas_caps}
+    else:
+        max_sizes = {
+            name: max_size_under_cap(coefficients, gas_cap)
+            for name, gas_cap in gas_caps.items()
+        }
+    return {
+        "sizes": list(sizes),
+        "gas": list(gas),
+        "intercept": coefficients[0],
+        "gas_per_item": coefficients[1],
+        "quadratic": coefficients[2],
+        "growth": growth,
+        "max_size": max_sizes,
+    }
+
+
+def measure_gas_curves(contract, creator, submitter, sizes: list):
+    """
+    Grows one bounty's submissions and one creator's bounties through sizes
+    and estimates the gas of each function of CURVES at every size. A
+    function stops being measured once its estimate fails, eg. because it
+    no longer fits in the node's gas limit.
+
+    Arguments:
+        contract (brownie.network.contract.ProjectContract): The OpsNFT.
+        creator (brownie.network.account.Account): Mints the bounties.
+        submitter (brownie.network.account.Account): Makes the submissions.
+        sizes (list): Increasing array lengths to measure at.
+
+    Returns:
+        dict: Function name -> (sizes, gas) measured.
+    """
+    amount_to_escrow = Wei("0.01 ether")
+    safe_mint_tx = contract.safeMint(
+        "https://block-ops.xyz", {"from": creator, "value": amount_to_escrow}
+    )
+    token_id = safe_mint_tx.events["NFTMinted"]["_tokenId"]
+    number_of_tokens = len(contract.getArrayOfNFTsFromCreator(creator))
+    number_of_submissions = 0
+    estimates = {
+        "tokenDetails": lambda: contract.tokenDetails.estimate_gas(token_id),
+        "getSubmissionsForTokenId": lambda: contract.getSubmissionsForTokenId.estimate_gas(
+            token_id
+        ),
+        "getTokenIdsWithSubmissionsFromAddress": lambda: (
+            contract.getTokenIdsWithSubmissionsFromAddress.estimate_gas(submitter)
+        ),
+        "getArrayOfNFTsFromCreator": lambda: contract.getArrayOfNFTsFromCreator.estimate_gas(
+            creator
+        ),
+    }
+
+    curves = {function_name: ([], []) for function_name in CURVES}
+    for size in sizes:
+        while number_of_submissions < size:
+            contract.makeSubmission(
+                token_id, "https://block-ops.xyz/submission", {"from": submitter}
+            )
+            number_of_submissions += 1
+        while number_of_tokens < size:
+            contract.safeMint(
+                "https://block-ops.xyz", {"from": creator, "value": amount_to_escrow}
+            )
+            number_of_tokens += 1
+        for function_name, estimate in list(estimates.items()):
+            try:
+                gas = estimate()
+            except ValueError:
+                del estimates[function_name]
+                continue
+            measured_sizes, measured_gas = curves[function_name]
+            measured_sizes.append(size)
+            measured_gas.append(gas)
+    return curves
+
+
+def print_report(report: dict):
+    """
+    Prints the analyzed curves as a table, marking the functions whose cost
+    grows with their array length.
+
+    Arguments:
+        report (dict): Function name -> analyze_curve result.
+    """
+    caps = list(next(iter(report.values()))["max_size"]) if report else []
+    header = ["function", "grows with", "growth", "gas per item"]
+    print(" | ".join(header + [f"max N ({cap})" for cap in caps]))
+    for function_name, curve in report.items():
+        print(
+            " | ".join(
+                [
+                    function_name,
+                    CURVES[function_name],
+                    curve["growth"] + (" (!)" if curve["growth"] != "constant" else ""),
+                    f"{curve['gas_per_item']:.0f}",
+                ]
+                + [str(curve["max_size"][cap]) for cap in caps]
+            )
+        )
+
+
+def main(
+    sizes: list = (1, 25, 50, 100, 200),
+    block_gas_limit: int = None,
+    call_gas_cap: int = DEFAULT_CALL_GAS_CAP,
+    output_path: str = "gas-curves.json",
+):
+    from scripts.deploy import deploy_ops_nft
+
+    if block_gas_limit is None:
+        block_gas_limit = web3.eth.get_block("latest").gasLimit
+    gas_caps = {"block": block_gas_limit, "eth_call": call_gas_cap}
+
+    utils = Utils()
+    curves = measure_gas_curves(
+        deploy_ops_nft(), utils.get_account(index=1), utils.get_account(index=2), list(sizes)
+    )
+    report = {
+        function_name: analyze_curve(measured_sizes, gas, gas_caps)
+        for function_name, (measured_sizes, gas) in curves.items()
+        if len(measured_sizes) >= 2
+    }
+    print_report(report)
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
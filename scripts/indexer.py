@@ -0,0 +1,247 @@
+import json
+import sqlite3
+
+from brownie import OpsNFT, web3
+
+from scripts.events import decode_log, event_topics
+from scripts.log_fetcher import AdaptiveLogFetcher
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    contract TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    event TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (contract, block_number, log_index)
+);
+CREATE TABLE IF NOT EXISTS bounties (
+    contract TEXT NOT NULL,
+    token_id INTEGER NOT NULL,
+    creator TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    metadata_uri TEXT NOT NULL,
+    escrow_value TEXT NOT NULL,
+    project_state TEXT NOT NULL,
+    winner TEXT,
+    redeemed_amount TEXT,
+    PRIMARY KEY (contract, token_id)
+);
+CREATE INDEX IF NOT EXISTS bounties_by_creator ON bounties (contract, creator);
+CREATE TABLE IF NOT EXISTS submissions (
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    token_id INTEGER NOT NULL,
+    submitter TEXT NOT NULL,
+    metadata_uri TEXT NOT NULL,
+    PRIMARY KEY (contract, block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS submissions_by_submitter ON submissions (contract, submitter);
+"""
+
+
+class EventIndexer:
+    def __init__(
+        self,
+        contract=None,
+        db_path: str = "ops_nft_index.db",
+        start_block: int = 0,
+        block_range: int = 2000,
+    ):
+        """
+        Indexes the events of a deployed OpsNFT into a SQLite database.
+        The last processed block is checkpointed in the same transaction
+        as the events of each block range, so a restarted indexer resumes
+        where it stopped instead of scanning again from start_block.
+
+        Arguments:
+            contract (brownie.network.contract.ProjectContract): The OpsNFT
+                to index. Defaults to the most recently deployed one.
+            db_path (str): Path of the SQLite database.
+            start_block (int): First block to index when the database has
+                               no checkpoint for this contract yet.
+            block_range (int): Number of blocks of the first eth_getLogs
+                               call; the range then adapts to the results.
+        """
+        self.contract = contract if contract is not None else OpsNFT[-1]
+        self.address = self.contract.address
+        self.topics = event_topics(self.contract.abi)
+        # Base URI that content ids are joined with, as of the events being
+        # indexed. Read from the chain when first needed, then followed
+        # through ContentBaseURIUpdated.
+        self.content_base_uri = None
+        self.start_block = start_block
+        self.fetcher = AdaptiveLogFetcher(
+            web3, self.address, self.topics, initial_range=block_range
+        )
+
+        self.db = sqlite3.connect(db_path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def last_processed_block(self):
+        """
+        Returns:
+            int: The last block that was indexed, or None if nothing was
+                 indexed yet.
+        """
+        row = self.db.execute(
+            "SELECT last_block FROM checkpoints WHERE contract = ?", (self.address,)
+        ).fetchone()
+        return row["last_block"] if row else None
+
+    def sync(self, to_block: int = None):
+        """
+        Indexes every event from the block after the checkpoint up to
+        to_block.
+
+        Arguments:
+            to_block (int): Last block to index. Defaults to the latest block.
+
+        Returns:
+            int: The number of events that were indexed.
+        """
+        if to_block is None:
+            to_block = web3.eth.block_number
+        last_block = self.last_processed_block()
+        from_block = self.start_block if last_block is None else last_block + 1
+
+        number_of_events = 0
+        for _, end_block, logs in self.fetcher.fetch(from_block, to_block):
+            events = [decode_log(log, self.topics) for log in logs]
+            events = [event for event in events if event is not None]
+            with self.db:
+                for event in events:
+                    self._index_event(event)
+                self.db.execute(
+                    "INSERT OR REPLACE INTO checkpoints (contract, last_block) VALUES (?, ?)",
+                    (self.address, end_block),
+                )
+            number_of_events += len(events)
+        return number_of_events
+
+    def _index_event(self, event: dict):
+        inserted = self.db.execute(
+            "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                self.address,
+                event["blockNumber"],
+                event["logIndex"],
+                event["transactionHash"],
+                event["event"],
+                json.dumps(event["args"]),
+            ),
+        ).rowcount
+        if not inserted:
+            return
+
+        args = event["args"]
+        if event["event"] == "NFTMinted":
+            self.db.execute(
+                "INSERT INTO bounties VALUES (?, ?, ?, ?, ?, ?, 'NEW', NULL, NULL)",
+                (
+                    self.address,
+                    args["_tokenId"],
+                    args["_to"],
+                    args["_to"],
+                    self._metadata_uri(args["_tokenMetadata"], args["_contentId"], event),
+                    str(args["_escrowValue"]),
+                ),
+            )
+        elif event["event"] == "SubmissionMade":
+            self.db.execute(
+                "INSERT INTO submissions VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.address,
+                    event["blockNumber"],
+                    event["logIndex"],
+                    args["_tokenId"],
+                    args["_submitter"],
+                    self._metadata_uri(args["_submissionString"], args["_contentId"], event),
+                ),
+            )
+            self._update_bounty(
+                args["_tokenId"], "project_state = 'ACTIVE'", "project_state = 'NEW'"
+            )
+        elif event["event"] == "WinningSubmission":
+            self._update_bounty(
+                args["_tokenId"],
+                "project_state = 'CLOSED', winner = ?",
+                params=(args["_submitter"],),
+            )
+        elif event["event"] == "Redeemed":
+            self._update_bounty(
+                args["_tokenId"],
+                "redeemed_amount = ?",
+                params=(str(args["_amount"]),),
+            )
+        elif event["event"] == "ContentBaseURIUpdated":
+            self.content_base_uri = args["_contentBaseURI"]
+        elif event["event"] == "Transfer":
+            # Minting emits a Transfer before NFTMinted, so the bounty row
+            # may not exist yet; NFTMinted sets the first owner itself.
+            self._update_bounty(args["tokenId"], "owner = ?", params=(args["to"],))
+
+    def _metadata_uri(self, metadata_uri: str, content_id: str, event: dict):
+        # Mints and submissions made with a content id only log the id.
+        if int(content_id, 16) == 0:
+            return metadata_uri
+        if self.content_base_uri is None:
+            self.content_base_uri = self.contract.contentBaseURI(
+                block_identifier=event["blockNumber"]
+            )
+        return self.content_base_uri + content_id[2:]
+
+    def _update_bounty(self, token_id: int, assignments: str, condition: str = "1", params: tuple = ()):
+        self.db.execute(
+            f"UPDATE bounties SET {assignments} WHERE contract = ? AND token_id = ? AND {condition}",
+            params + (self.address, token_id),
+        )
+
+    def bounties_by_creator(self, creator: str):
+        """
+        Arguments:
+            creator (str): Address of the bounty creator.
+
+        Returns:
+            list: The bounties minted by creator, as dicts, in token id order.
+        """
+        rows = self.db.execute(
+            "SELECT * FROM bounties WHERE contract = ? AND creator = ? ORDER BY token_id",
+            (self.address, str(creator)),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def submissions_by_address(self, submitter: str):
+        """
+        Arguments:
+            submitter (str): Address of the submitter.
+
+        Returns:
+            list: The submissions made by submitter, as dicts, in the
+                  order they were made.
+        """
+        rows = self.db.execute(
+            "SELECT * FROM submissions WHERE contract = ? AND submitter = ? "
+            "ORDER BY block_number, log_index",
+            (self.address, str(submitter)),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    indexer = EventIndexer()
+    number_of_events = indexer.sync()
+    print(
+        f"Indexed {number_of_events} events up to block {indexer.last_processed_block()}"
+    )
+    indexer.close()
@@ -0,0 +1,334 @@
+import json
+import math
+import random
+import time
+
+from brownie import Wei, accounts, network
+
+from scripts.sender import BulkSender
+from scripts.utils import Utils
+
+DEFAULT_MIX = {
+    "safeMint": 4,
+    "makeSubmission": 4,
+    "declareWinningSubmission": 1,
+    "redeemEthFromNFT": 1,
+}
+
+
+class LoadGenerator:
+    def __init__(
+        self,
+        contract,
+        creators: list,
+        submitters: list,
+        mix: dict = None,
+        amount_to_escrow: int = Wei("0.01 ether"),
+        max_in_flight: int = 4,
+        seed: int = 0,
+    ):
+        """
+        Drives a weighted mix of OpsNFT transactions from several creators
+        and submitters, and records the gas used and the latency of each one.
+
+        Transactions are sent through a BulkSender, in batches of up to
+        max_in_flight per account that are pending at the same time. Each
+        batch is chosen from the bounty state settled by the previous ones,
+        so that every transaction can succeed whatever order the batch is
+        mined in. A function whose preconditions cannot be met yet falls
+        back to the step before it, eg. declareWinningSubmission before any
+        bounty has a submission sends a makeSubmission, or a safeMint when
+        there is no open bounty either.
+
+        Arguments:
+            contract (brownie.network.contract.ProjectContract): The OpsNFT.
+            creators (list): Accounts minting bounties and declaring winners.
+            submitters (list): Accounts making submissions and redeeming the
+                               bounties they won.
+            mix (dict): Relative weight of each function. Defaults to
+                        DEFAULT_MIX.
+            amount_to_escrow (int): Wei escrowed in each bounty.
+            max_in_flight (int): Maximum number of pending transactions per
+                                 account.
+            seed (int): Seed of the random choices, so that runs against two
+                        revisions of the contract send the same transactions.
+        """
+        self.contract = contract
+        self.creators = list(creators)
+        self.submitters = list(submitters)
+        self.mix = dict(DEFAULT_MIX if mix is None else mix)
+        unknown_functions = set(self.mix) - set(DEFAULT_MIX)
+        if unknown_functions:
+            raise ValueError(f"Unsupported functions in mix: {sorted(unknown_functions)}")
+        self.amount_to_escrow = amount_to_escrow
+        self.random = random.Random(seed)
+        unique_accounts = {account.address: account for account in self.creators + self.submitters}
+        self.sender = BulkSender(list(unique_accounts.values()), max_in_flight=max_in_flight)
+        self.batch_size = max_in_flight * len(unique_accounts)
+
+        # Bounty state, as token id -> creator and token id -> number of
+        # submissions, so that each transaction is chosen to succeed.
+        self.open_bounties = {}
+        self.submission_counts = {}
+        # Token id -> winner of the closed bounties not redeemed yet.
+        self.unredeemed_bounties = {}
+        # Token ids the current batch submits to, and closes or redeems.
+        self.batch_submissions = set()
+        self.batch_settlements = set()
+
+        self.records = {function_name: [] for function_name in self.mix}
+        self.seconds = None
+
+    def run(self, number_of_transactions: int):
+        """
+        Sends number_of_transactions transactions, batch by batch.
+
+        Arguments:
+            number_of_transactions (int): Number of transactions to send.
+
+        Returns:
+            dict: The report, see report().
+        """
+        start_time = time.perf_counter()
+        number_sent = 0
+        while number_sent < number_of_transactions:
+            batch_size = min(self.batch_size, number_of_transactions - number_sent)
+            self._send_batch(batch_size)
+            number_sent += batch_size
+        self.seconds = time.perf_counter() - start_time
+        return self.report()
+
+    def _send_batch(self, batch_size: int):
+        function_names = list(self.mix)
+        weights = [self.mix[function_name] for function_name in function_names]
+        self.batch_submissions.clear()
+        self.batch_settlements.clear()
+
+        sent = []
+        for _ in range(batch_size):
+            (function_name,) = self.random.choices(function_names, weights)
+            method, args, sender = getattr(self, f"_{function_name}")()
+            function_name = method.abi["name"]
+            index = self.sender.send(
+                method, *args, value=self._value(function_name), account=sender
+            )
+            sent.append((index, function_name, args))
+            if function_name == "makeSubmission":
+                self.batch_submissions.add(args[0])
+            elif function_name != "safeMint":
+                self.batch_settlements.add(args[0])
+        self.sender.wait_all()
+
+        for index, function_name, args in sent:
+            tx = self.sender.receipts[index]
+            # Reverted and dropped transactions are only counted by the
+            # sender's stats.
+            if tx.status != 1:
+                continue
+            self.records.setdefault(function_name, []).append(
+                (tx.gas_used, self.sender.latencies[index])
+            )
+            self._update_state(function_name, args, tx)
+
+    def _value(self, function_name: str):
+        return self.amount_to_escrow if function_name == "safeMint" else 0
+
+    def _safeMint(self):
+        return (
+            self.contract.safeMint,
+            ["https://block-ops.xyz/load"],
+            self.random.choice(self.creators),
+        )
+
+    def _makeSubmission(self):
+        token_ids = [
+            token_id for token_id in self.open_bounties if token_id not in self.batch_settlements
+        ]
+        if not token_ids:
+            return self._safeMint()
+        token_id = self.random.choice(token_ids)
+        return (
+            self.contract.makeSubmission,
+            [token_id, "https://block-ops.xyz/load/submission"],
+            self.random.choice(self.submitters),
+        )
+
+    def _declareWinningSubmission(self):
+        # A bounty the batch submits to is not closed in the same batch, as
+        # the submission could be mined after it.
+        token_ids = [
+            token_id
+            for token_id in self.open_bounties
+            if self.submission_counts[token_id]
+            and token_id not in self.batch_submissions
+            and token_id not in self.batch_settlements
+        ]
+        if not token_ids:
+            return self._makeSubmission()
+        token_id = self.random.choice(token_ids)
+        submission_id = self.random.randrange(self.submission_counts[token_id])
+        return (
+            self.contract.declareWinningSubmission,
+            [token_id, submission_id],
+            self.open_bounties[token_id],
+        )
+
+    def _redeemEthFromNFT(self):
+        token_ids = [
+            token_id
+            for token_id in self.unredeemed_bounties
+            if token_id not in self.batch_settlements
+        ]
+        if not token_ids:
+            return self._declareWinningSubmission()
+        token_id = self.random.choice(token_ids)
+        return (
+            self.contract.redeemEthFromNFT,
+            [token_id],
+            self.unredeemed_bounties[token_id],
+        )
+
+    def _update_state(self, function_name: str, args: list, tx):
+        if function_name == "safeMint":
+            token_id = tx.events["NFTMinted"]["_tokenId"]
+            self.open_bounties[token_id] = tx.sender
+            self.submission_counts[token_id] = 0
+        elif function_name == "makeSubmission":
+            self.submission_counts[args[0]] += 1
+        elif function_name == "declareWinningSubmission":
+            token_id = args[0]
+            del self.open_bounties[token_id]
+            self.unredeemed_bounties[token_id] = accounts.at(
+                tx.events["WinningSubmission"]["_submitter"]
+            )
+        elif function_name == "redeemEthFromNFT":
+            del self.unredeemed_bounties[args[0]]
+
+    def report(self):
+        """
+        Returns:
+            dict: The number of transactions confirmed and tx/s sustained,
+                  how many were reverted, dropped or replaced, and for each
+                  function its count, gas used and latency in milliseconds
+                  from broadcast to receipt, summarized by percentiles.
+        """
+        if self.seconds is None:
+            raise ValueError("No transactions were sent yet, call run() first")
+        functions = {}
+        for function_name, records in self.records.items():
+            if not records:
+                continue
+            gas_used = [gas for gas, _ in records]
+            latencies = [latency * 1000 for _, latency in records]
+            functions[function_name] = {
+                "count": len(records),
+                "gas": summarize(gas_used),
+                "latency_ms": summarize(latencies),
+            }
+        number_of_transactions = sum(len(records) for records in self.records.values())
+        return {
+            "network": network.show_active(),
+            "contract": self.contract.address,
+            "mix": self.mix,
+            "creators": len(self.creators),
+            "submitters": len(self.submitters),
+            "max_in_flight": self.sender.max_in_flight,
+            "transactions": number_of_transactions,
+            "reverted": self.sender.stats["reverted"],
+            "dropped": self.sender.stats["dropped"],
+            "replaced": self.sender.stats["replaced"],
+            "seconds": self.seconds,
+            "tx_per_second": number_of_transactions / self.seconds,
+            "functions": functions,
+        }
+
+
+def percentile(values: list, percent: float):
+    """
+    Nearest-rank percentile.
+
+    Arguments:
+        values (list): The values, in any order.
+        percent (float): Between 0 and 100.
+
+    Returns:
+        The smallest value greater than or equal to percent% of the values.
+    """
+    ordered_values = sorted(values)
+    rank = max(1, math.ceil(len(ordered_values) * percent / 100))
+    return ordered_values[rank - 1]
+
+
+def summarize(values: list):
+    """
+    Arguments:
+        values (list): A non empty list of numbers.
+
+    Returns:
+        dict: Their min, mean, 50th, 95th and 99th percentiles and max.
+    """
+    return {
+        "min": min(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values),
+    }
+
+
+def compare_reports(baseline: dict, report: dict):
+    """
+    Prints how the throughput, median gas and median latency of each
+    function changed between two reports, eg. of two contract revisions.
+
+    Arguments:
+        baseline (dict): The report to compare against.
+        report (dict): The new report.
+    """
+    print(f"tx/s: {baseline['tx_per_second']:.1f} -> {report['tx_per_second']:.1f}")
+    print("function | gas p50 | latency p50 (ms)")
+    for function_name, stats in report["functions"].items():
+        baseline_stats = baseline["functions"].get(function_name)
+        if baseline_stats is None:
+            print(
+                f"{function_name} | {stats['gas']['p50']} (new) | "
+                f"{stats['latency_ms']['p50']:.1f} (new)"
+            )
+            continue
+        print(
+            f"{function_name} | "
+            f"{baseline_stats['gas']['p50']} -> {stats['gas']['p50']} | "
+            f"{baseline_stats['latency_ms']['p50']:.1f} -> {stats['latency_ms']['p50']:.1f}"
+        )
+
+
+def main(
+    number_of_transactions: int = 500,
+    number_of_creators: int = 3,
+    number_of_submitters: int = 5,
+    output_path: str = "loadgen-report.json",
+    baseline_path: str = None,
+):
+    from scripts.deploy import deploy_ops_nft
+
+    utils = Utils()
+    # Index 0 deploys, and get_account(index=0) would fall through to the
+    # default account anyway.
+    creators = [utils.get_account(index=index) for index in range(1, number_of_creators + 1)]
+    submitters = [
+        utils.get_account(index=index)
+        for index in range(number_of_creators + 1, number_of_creators + number_of_submitters + 1)
+    ]
+    load_generator = LoadGenerator(deploy_ops_nft(), creators, submitters)
+    report = load_generator.run(number_of_transactions)
+
+    with open(output_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(
+        f"{report['transactions']} transactions in {report['seconds']:.2f}s "
+        f"({report['tx_per_second']:.1f} tx/s), report written to {output_path}"
+    )
+    if baseline_path is not None:
+        with open(baseline_path) as f:
+            compare_reports(json.load(f), report)
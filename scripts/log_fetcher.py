@@ -0,0 +1,119 @@
+import time
+
+from requests.exceptions import RequestException
+
+
+class AdaptiveLogFetcher:
+    def __init__(
+        self,
+        w3,
+        address: str,
+        topics: dict,
+        initial_range: int = 2000,
+        min_range: int = 1,
+        max_range: int = 500000,
+        target_logs: int = 5000,
+    ):
+        """
+        Fetches the logs of a contract with eth_getLogs over a block range
+        that adapts to the results: it doubles after a request that returned
+        less than half of target_logs, shrinks after one that returned more,
+        and is halved and retried when the provider rejects or times out on
+        a request (eg. "query returned more than 10000 results").
+
+        Arguments:
+            w3 (web3.Web3): Connected Web3 instance, eg. brownie.web3.
+            address (str): Address of the contract.
+            topics (dict): Topic to event ABI of the events to fetch, as
+                           returned by scripts.events.event_topics.
+            initial_range (int): Number of blocks of the first request.
+            min_range (int): Smallest range; a request failing at this size
+                             raises its error.
+            max_range (int): Largest range.
+            target_logs (int): Number of logs a request should return.
+        """
+        self.w3 = w3
+        self.address = address
+        self.topics = topics
+        self.block_range = initial_range
+        self.min_range = min_range
+        self.max_range = max_range
+        self.target_logs = target_logs
+        self.stats = {"blocks": 0, "logs": 0, "requests": 0, "errors": 0, "seconds": 0.0}
+
+    def fetch(self, from_block: int, to_block: int):
+        """
+        Fetches the logs between from_block and to_block, both included.
+
+        Arguments:
+            from_block (int): First block.
+            to_block (int): Last block.
+
+        Yields:
+            tuple: (first block, last block, logs) for each block range, in
+                   block order.
+        """
+        while from_block <= to_block:
+            end_block = min(from_block + self.block_range - 1, to_block)
+            start_time = time.perf_counter()
+            try:
+                logs = self.w3.eth.get_logs(
+                    {
+                        "address": self.address,
+                        "fromBlock": from_block,
+                        "toBlock": end_block,
+                        "topics": [list(self.topics)],
+                    }
+                )
+            except (ValueError, RequestException):
+                self.stats["seconds"] += time.perf_counter() - start_time
+                self.stats["errors"] += 1
+                if self.block_range <= self.min_range:
+                    raise
+                self.block_range = max(self.min_range, self.block_range // 2)
+                continue
+            self.stats["seconds"] += time.perf_counter() - start_time
+            self.stats["requests"] += 1
+            self.stats["blocks"] += end_block - from_block + 1
+            self.stats["logs"] += len(logs)
+
+            self._resize(len(logs), end_block - from_block + 1)
+            yield from_block, end_block, logs
+            from_block = end_block + 1
+
+    def _resize(self, number_of_logs: int, number_of_blocks: int):
+        if number_of_logs > self.target_logs:
+            # Aim for target_logs with the log density that was just seen.
+            new_range = number_of_blocks * self.target_logs // number_of_logs
+        elif number_of_logs < self.target_logs // 2:
+            new_range = self.block_range * 2
+        else:
+            return
+        self.block_range = max(self.min_range, min(self.max_range, new_range))
+
+    def blocks_per_second(self):
+        """
+        Returns:
+            float: Blocks covered per second spent in eth_getLogs so far.
+        """
+        if self.stats["seconds"] == 0:
+            return 0.0
+        return self.stats["blocks"] / self.stats["seconds"]
+
+
+def main():
+    # Brownie is only imported here, so that the fetcher can be used from
+    # processes that do not load the Brownie project.
+    from brownie import OpsNFT, web3
+
+    from scripts.events import event_topics
+
+    ops_nft = OpsNFT[-1]
+    fetcher = AdaptiveLogFetcher(web3, ops_nft.address, event_topics(ops_nft.abi))
+    for from_block, end_block, logs in fetcher.fetch(0, web3.eth.block_number):
+        print(f"blocks {from_block}-{end_block}: {len(logs)} logs")
+    print(
+        f"{fetcher.stats['blocks']} blocks, {fetcher.stats['logs']} logs, "
+        f"{fetcher.stats['requests']} requests, {fetcher.stats['errors']} errors: "
+        f"{fetcher.blocks_per_second():.0f} blocks/sec"
+    )
@@ -0,0 +1,199 @@
+from enum import IntEnum
+from typing import NamedTuple
+
+from eth_abi import decode_abi
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+
+WORD_SIZE = 32
+
+
+class ProjectState(IntEnum):
+    NEW = 0
+    ACTIVE = 1
+    CLOSED = 2
+
+
+class Submission(NamedTuple):
+    submitter: str
+    metadata_uri: str
+
+
+class TokenDetails:
+    # No per-instance __dict__, so holding many tokens costs a fixed amount
+    # of memory per token plus its submissions.
+    __slots__ = (
+        "owner",
+        "token_uri",
+        "amount_of_eth",
+        "creator",
+        "token_id",
+        "project_state",
+        "submission_count",
+        "_submissions",
+    )
+
+    def __init__(
+        self,
+        owner: str,
+        token_uri: str,
+        amount_of_eth: int,
+        creator: str,
+        token_id: int,
+        project_state: int,
+        submissions,
+        submission_count: int = None,
+    ):
+        """
+        Details of an OpsNFT token, as returned by tokenDetails.
+
+        Arguments:
+            owner (str): Owner of the token.
+            token_uri (str): Metadata URI of the token.
+            amount_of_eth (int): Wei escrowed in the token.
+            creator (str): Creator of the bounty.
+            token_id (int): Id of the token.
+            project_state (int): PROJECT_STATE of the bounty.
+            submissions: Either the (submitter, metadata URI) pairs, or the
+                         ABI encoded Submission[] as bytes, which is only
+                         decoded when submissions is first read.
+            submission_count (int): Total number of submissions, which can
+                                    be more than the submissions given when
+                                    they come from a paginated call.
+                                    Defaults to the number of submissions.
+        """
+        self.owner = owner
+        self.token_uri = token_uri
+        self.amount_of_eth = amount_of_eth
+        self.creator = creator
+        self.token_id = token_id
+        self.project_state = ProjectState(project_state)
+        if isinstance(submissions, bytes):
+            if submission_count is None:
+                submission_count = _read_uint(submissions, 0)
+            self._submissions = submissions
+        else:
+            self._submissions = tuple(Submission(*item) for item in submissions)
+            if submission_count is None:
+                submission_count = len(self._submissions)
+        self.submission_count = submission_count
+
+    @property
+    def submissions(self):
+        """
+        Returns:
+            tuple: The Submission entries, decoded on first access.
+        """
+        if isinstance(self._submissions, bytes):
+            # The array is encoded on its own, so prefix it with its offset
+            # to decode it as a one element tuple.
+            (submissions,) = decode_abi(
+                ["(address,string)[]"], _encode_uint(WORD_SIZE) + self._submissions
+            )
+            self._submissions = tuple(
+                Submission(to_checksum_address(submitter), metadata_uri)
+                for submitter, metadata_uri in submissions
+            )
+        return self._submissions
+
+    @classmethod
+    def from_tuple(cls, values):
+        """
+        Arguments:
+            values (tuple): The 7 values returned by tokenDetails or
+                            tokenDetailsPaginated through Brownie.
+
+        Returns:
+            TokenDetails
+        """
+        owner, token_uri, amount_of_eth, creator, token_id, project_state, submissions = values
+        return cls(owner, token_uri, amount_of_eth, creator, token_id, project_state, submissions)
+
+    @classmethod
+    def from_batch_tuple(cls, values):
+        """
+        Arguments:
+            values (tuple): One TokenDetails struct returned by
+                            getTokenDetailsBatch through Brownie.
+
+        Returns:
+            TokenDetails
+        """
+        (
+            owner,
+            token_uri,
+            amount_of_eth,
+            creator,
+            token_id,
+            project_state,
+            submission_count,
+            submissions,
+        ) = values
+        return cls(
+            owner,
+            token_uri,
+            amount_of_eth,
+            creator,
+            token_id,
+            project_state,
+            submissions,
+            submission_count,
+        )
+
+    @classmethod
+    def from_return_data(cls, return_data):
+        """
+        Decodes the raw eth_call result of tokenDetails. Every field but the
+        submissions is decoded right away; the submissions are kept encoded
+        until they are read.
+
+        Arguments:
+            return_data (bytes | str): The eth_call result.
+
+        Returns:
+            TokenDetails
+        """
+        data = bytes(HexBytes(return_data))
+        token_uri_offset = _read_uint(data, 1)
+        token_uri_length = _read_uint(data, 0, token_uri_offset)
+        token_uri_start = token_uri_offset + WORD_SIZE
+        return cls(
+            owner=to_checksum_address(data[12:WORD_SIZE]),
+            token_uri=data[token_uri_start : token_uri_start + token_uri_length].decode(),
+            amount_of_eth=_read_uint(data, 2),
+            creator=to_checksum_address(data[3 * WORD_SIZE + 12 : 4 * WORD_SIZE]),
+            token_id=_read_uint(data, 4),
+            project_state=_read_uint(data, 5),
+            submissions=data[_read_uint(data, 6) :],
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, TokenDetails):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields())
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields())
+        return f"TokenDetails({fields})"
+
+    @staticmethod
+    def _fields():
+        return (
+            "owner",
+            "token_uri",
+            "amount_of_eth",
+            "creator",
+            "token_id",
+            "project_state",
+            "submission_count",
+            "submissions",
+        )
+
+
+def _read_uint(data: bytes, word: int, start: int = 0):
+    offset = start + word * WORD_SIZE
+    return int.from_bytes(data[offset : offset + WORD_SIZE], "big")
+
+
+def _encode_uint(value: int):
+    return value.to_bytes(WORD_SIZE, "big")
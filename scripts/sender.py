@@ -0,0 +1,200 @@
+import time
+
+from brownie import OpsNFT, Wei, web3
+
+from scripts.utils import Utils
+
+
+class BulkSender:
+    def __init__(
+        self,
+        accounts: list,
+        max_in_flight: int = 16,
+        replace_after: float = 60,
+        fee_increment: float = 1.125,
+        max_replacements: int = 3,
+        gas_price=None,
+        poll_interval: float = 0.1,
+    ):
+        """
+        Sends many transactions without waiting for each one to be mined.
+        Nonces are assigned locally from each account's pending transaction
+        count, up to max_in_flight transactions are kept pending per
+        account, and transactions still pending after replace_after seconds
+        are rebroadcast with a higher fee.
+
+        Arguments:
+            accounts (list): Accounts to send from, eg.
+                             [utils.get_account(index=i) for i in range(1, 5)].
+            max_in_flight (int): Maximum number of pending transactions per
+                                 account.
+            replace_after (float): Seconds a transaction can stay pending
+                                   before its fee is bumped.
+            fee_increment (float): Multiplier applied to the fee of a
+                                   replaced transaction.
+            max_replacements (int): Maximum number of fee bumps per
+                                    transaction.
+            gas_price: Gas price of every transaction. Defaults to Brownie's.
+            poll_interval (float): Seconds between two receipt checks while
+                                   waiting.
+        """
+        self.accounts = list(accounts)
+        self.max_in_flight = max_in_flight
+        self.replace_after = replace_after
+        self.fee_increment = fee_increment
+        self.max_replacements = max_replacements
+        self.gas_price = gas_price
+        self.poll_interval = poll_interval
+
+        self.next_nonce = {
+            account.address: web3.eth.get_transaction_count(account.address, "pending")
+            for account in self.accounts
+        }
+        self.pending = {account.address: [] for account in self.accounts}
+        # Receipt of each transaction, in the order they were sent: the mined
+        # one once settled, the latest one broadcast until then.
+        self.receipts = []
+        # Seconds from the first broadcast of each transaction until it was
+        # settled, None while it is pending.
+        self.latencies = []
+        self.stats = {"sent": 0, "confirmed": 0, "reverted": 0, "replaced": 0, "dropped": 0}
+
+    def send(self, method, *args, value: int = 0, account=None):
+        """
+        Sends a contract transaction from the account with the fewest
+        pending transactions, waiting for one to be mined if every account
+        already has max_in_flight pending.
+
+        Arguments:
+            method (brownie.network.contract.ContractTx): The contract
+                function, eg. nft.safeMint.
+            *args: Its arguments.
+            value (int): Wei to send with the transaction.
+            account (brownie.network.account.Account): One of self.accounts
+                to send from instead, waiting until it has fewer than
+                max_in_flight pending.
+
+        Returns:
+            int: Index of the transaction in self.receipts.
+        """
+        choose_account = account is None
+        if choose_account:
+            account = self._next_account()
+        while len(self.pending[account.address]) >= self.max_in_flight:
+            time.sleep(self.poll_interval)
+            self.poll()
+            if choose_account:
+                account = self._next_account()
+
+        nonce = self.next_nonce[account.address]
+        tx_params = {"from": account, "value": value, "nonce": nonce, "required_confs": 0}
+        if self.gas_price is not None:
+            tx_params["gas_price"] = self.gas_price
+        # The nonce is only used once the transaction was broadcast, so a
+        # failed send does not leave a gap.
+        tx = method(*args, tx_params)
+        self.next_nonce[account.address] = nonce + 1
+
+        index = len(self.receipts)
+        self.receipts.append(tx)
+        self.latencies.append(None)
+        sent_at = time.monotonic()
+        # Every transaction broadcast with this nonce, as a replacement can
+        # lose the race against the transaction it replaces.
+        self.pending[account.address].append(
+            {
+                "index": index,
+                "txs": [tx],
+                "first_sent_at": sent_at,
+                "sent_at": sent_at,
+                "replacements": 0,
+            }
+        )
+        self.stats["sent"] += 1
+        return index
+
+    def _next_account(self):
+        return min(self.accounts, key=lambda account: len(self.pending[account.address]))
+
+    def poll(self):
+        """
+        Updates the pending transactions: records the mined ones and bumps
+        the fee of the ones pending for longer than replace_after. A nonce
+        is settled by whichever of its transactions was mined, and counted
+        as dropped if another transaction took it.
+
+        Returns:
+            int: The number of transactions still pending.
+        """
+        number_pending = 0
+        for address, pending in self.pending.items():
+            still_pending = []
+            for item in pending:
+                mined_txs = [tx for tx in item["txs"] if tx.status in (0, 1)]
+                if mined_txs:
+                    self.receipts[item["index"]] = mined_txs[0]
+                    self._settle(item, "confirmed" if mined_txs[0].status == 1 else "reverted")
+                    continue
+                if all(tx.status == -2 for tx in item["txs"]):
+                    self._settle(item, "dropped")
+                    continue
+                # -2 (dropped) on only some of them means the nonce was used
+                # by another one, whose receipt is not in yet.
+                tx = item["txs"][-1]
+                if (
+                    tx.status == -1
+                    and item["replacements"] < self.max_replacements
+                    and time.monotonic() - item["sent_at"] > self.replace_after
+                ):
+                    try:
+                        replacement_tx = tx.replace(increment=self.fee_increment)
+                    except ValueError:
+                        # Mined since its status was read, the next poll
+                        # records it.
+                        pass
+                    else:
+                        self.receipts[item["index"]] = replacement_tx
+                        item["txs"].append(replacement_tx)
+                        item["sent_at"] = time.monotonic()
+                        item["replacements"] += 1
+                        self.stats["replaced"] += 1
+                still_pending.append(item)
+            self.pending[address] = still_pending
+            number_pending += len(still_pending)
+        return number_pending
+
+    def _settle(self, item: dict, outcome: str):
+        self.latencies[item["index"]] = time.monotonic() - item["first_sent_at"]
+        self.stats[outcome] += 1
+
+    def wait_all(self, timeout: float = None):
+        """
+        Waits until every transaction sent so far has been mined.
+
+        Arguments:
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            list: The receipt of every transaction, in the order they were
+                  sent.
+        """
+        start_time = time.monotonic()
+        while self.poll():
+            if timeout is not None and time.monotonic() - start_time > timeout:
+                raise TimeoutError(f"{self.poll()} transactions still pending")
+            time.sleep(self.poll_interval)
+        return self.receipts
+
+
+def main(number_of_transactions: int = 100, number_of_accounts: int = 4):
+    utils = Utils()
+    sender = BulkSender(
+        [utils.get_account(index=index) for index in range(1, number_of_accounts + 1)]
+    )
+    ops_nft = OpsNFT[-1]
+    start_time = time.perf_counter()
+    for _ in range(number_of_transactions):
+        sender.send(ops_nft.safeMint, "https://block-ops.xyz", value=Wei("0.01 ether"))
+    sender.wait_all()
+    elapsed = time.perf_counter() - start_time
+    print(f"{sender.stats} in {elapsed:.2f}s ({number_of_transactions / elapsed:.1f} tx/s)")
@@ -0,0 +1,397 @@
+import os
+from collections import defaultdict
+from pathlib import Path
+
+from brownie import OpsNFT, Wei, chain, config, project
+from brownie.project import compiler
+from brownie.project.compiler import solidity
+from eth_utils import to_checksum_address
+
+from scripts.utils import Utils
+
+WORD_SIZE = 32
+# Largest distance from a keccak256 result at which a slot is still read as
+# an element of the array (or member of the struct) stored at that hash.
+MAX_HASH_OFFSET = 2 ** 32
+STORAGE_OPCODES = ("SLOAD", "SSTORE")
+
+
+def load_storage_layout(contract):
+    """
+    Recompiles the project the way Brownie compiles it, with every project
+    source, its remappings and the project root as the allowed path, asking
+    solc for the storage layout of a contract, which Brownie does not keep.
+
+    Arguments:
+        contract: The contract container or deployed contract, eg. OpsNFT.
+
+    Returns:
+        dict: The solc storageLayout, with its "storage" and "types".
+    """
+    build = contract._build
+    loaded_project = project.get_loaded_projects()[0]
+    project_sources = loaded_project._sources
+    contract_sources = {
+        path: project_sources.get(path)
+        for path in project_sources.get_path_list()
+        # Package sources read since the project was loaded are left to
+        # the remappings, as they were when it was compiled.
+        if Path(path).suffix == ".sol" and not Path(path).is_absolute()
+    }
+    interface_sources = {
+        path: source
+        for path, source in project_sources.get_interface_sources().items()
+        if Path(path).suffix == ".sol"
+    }
+    solidity.set_solc_version(build["compiler"]["version"].split("+")[0])
+    input_json = compiler.generate_input_json(
+        contract_sources,
+        evm_version=build["compiler"]["evm_version"],
+        interface_sources=interface_sources,
+        remappings=config["compiler"]["solc"].get("remappings", []),
+        optimizer=build["compiler"]["optimizer"],
+    )
+    source_path = build["sourcePath"]
+    input_json["settings"]["outputSelection"] = {
+        source_path: {build["contractName"]: ["storageLayout"]}
+    }
+    # Relative imports, eg. "./OpsNFTBase.sol", resolve from the project
+    # root.
+    cwd = os.getcwd()
+    os.chdir(loaded_project._path)
+    try:
+        output = compiler.compile_from_input_json(
+            input_json, allow_paths=loaded_project._path.as_posix()
+        )
+    finally:
+        os.chdir(cwd)
+    return output["contracts"][source_path][build["contractName"]]["storageLayout"]
+
+
+class SlotResolver:
+    def __init__(self, storage_layout: dict = None):
+        """
+        Names storage slots after the state variables they belong to, eg.
+        addressToTokenIdSubmissionIds[0x66aB...][0][2].
+
+        Mapping entries and dynamic array elements live at keccak256 hashes,
+        so the preimage of every hash computed during a transaction has to be
+        recorded with add_preimage before its slots can be named.
+
+        Arguments:
+            storage_layout (dict): The solc storageLayout of the contract,
+                                   see load_storage_layout. Without it,
+                                   slots are named by their number and keys.
+        """
+        self.storage = [] if storage_layout is None else storage_layout["storage"]
+        self.types = {} if storage_layout is None else storage_layout["types"]
+        self.preimages = {}
+
+    def add_preimage(self, hash_value: int, preimage: bytes):
+        self.preimages[hash_value] = preimage
+
+    def name(self, slot: int):
+        """
+        Arguments:
+            slot (int): A storage slot.
+
+        Returns:
+            str: The name of the variable, element or member at that slot.
+        """
+        located = self._locate_hash(slot)
+        if located is not None:
+            return located
+        variables = [
+            variable
+            for variable in self.storage
+            if 0 <= slot - int(variable["slot"]) < self._slots(variable["type"])
+        ]
+        if not variables:
+            return f"slot {slot}"
+        return "/".join(
+            self._member(variable["label"], variable["type"], slot - int(variable["slot"]))
+            for variable in variables
+        )
+
+    def variable(self, slot: int):
+        """
+        Arguments:
+            slot (int): A storage slot.
+
+        Returns:
+            str: The name of the state variable the slot belongs to, without
+                 keys, indexes or members.
+        """
+        name = self.name(slot)
+        return name.split("[")[0].split(".")[0]
+
+    def _locate_hash(self, slot: int):
+        # The slot is either a hash itself or a few slots after one: an
+        # array element or a struct member.
+        candidates = [
+            hash_value
+            for hash_value in self.preimages
+            if 0 <= slot - hash_value < MAX_HASH_OFFSET
+        ]
+        if not candidates:
+            return None
+        hash_value = max(candidates)
+        preimage = self.preimages[hash_value]
+        offset = slot - hash_value
+        if len(preimage) == WORD_SIZE:
+            # Data of the dynamic array, bytes or string stored at preimage.
+            base = int.from_bytes(preimage, "big")
+            label, type_id = self._label(base)
+            type_info = self.types.get(type_id, {})
+            if type_info.get("encoding") == "dynamic_array":
+                return self._element(label, type_info["base"], offset)
+            return f"{label}.data[{offset}]"
+        if len(preimage) > WORD_SIZE:
+            # mapping(key => value) entry, at keccak256(key . mapping slot).
+            label, type_id = self._label(hash_value)
+            return self._member(label, type_id, offset)
+        return None
+
+    def _label(self, slot: int):
+        # Name and type of whatever starts exactly at slot.
+        preimage = self.preimages.get(slot)
+        if preimage is not None and len(preimage) > WORD_SIZE:
+            base = int.from_bytes(preimage[-WORD_SIZE:], "big")
+            label, type_id = self._label(base)
+            type_info = self.types.get(type_id, {})
+            key = self._format_key(preimage[:-WORD_SIZE], type_info.get("key"))
+            return f"{label}[{key}]", type_info.get("value")
+        if preimage is not None:
+            base_label, base_type = self._label(int.from_bytes(preimage, "big"))
+            type_info = self.types.get(base_type, {})
+            if type_info.get("encoding") == "dynamic_array":
+                return f"{base_label}[0]", type_info["base"]
+            return f"{base_label}.data[0]", None
+        for variable in self.storage:
+            if int(variable["slot"]) == slot:
+                return variable["label"], variable["type"]
+        located = self._locate_hash(slot)
+        if located is not None:
+            return located, None
+        return f"slot {slot}", None
+
+    def _element(self, label: str, type_id: str, offset: int):
+        index, member_offset = divmod(offset, self._slots(type_id))
+        return self._member(f"{label}[{index}]", type_id, member_offset)
+
+    def _member(self, label: str, type_id: str, offset: int):
+        type_info = self.types.get(type_id, {})
+        members = [
+            member
+            for member in type_info.get("members", [])
+            if 0 <= offset - int(member["slot"]) < self._slots(member["type"])
+        ]
+        if members:
+            return "/".join(
+                self._member(
+                    f"{label}.{member['label']}", member["type"], offset - int(member["slot"])
+                )
+                for member in members
+            )
+        if offset == 0:
+            return label
+        if type_info.get("encoding") == "inplace" and "base" in type_info:
+            return self._element(label, type_info["base"], offset)
+        return f"{label}+{offset}"
+
+    def _slots(self, type_id: str):
+        type_info = self.types.get(type_id)
+        if type_info is None:
+            return 1
+        return max(1, -(-int(type_info["numberOfBytes"]) // WORD_SIZE))
+
+    def _format_key(self, key: bytes, type_id: str):
+        label = self.types.get(type_id, {}).get("label", "")
+        if label == "address" or label.startswith("contract "):
+            return to_checksum_address(key[-20:])
+        if label.startswith(("uint", "int", "enum ", "bool")):
+            return str(int.from_bytes(key, "big"))
+        if label in ("string", "bytes"):
+            return repr(key.decode(errors="replace"))
+        return "0x" + key.hex()
+
+
+class StorageProfile:
+    def __init__(self, tx, storage_layout: dict = None):
+        """
+        Attributes the gas of a transaction to the functions, source lines
+        and storage slots that spent it, from its Brownie trace.
+
+        Arguments:
+            tx (brownie.network.transaction.TransactionReceipt): The
+                transaction, on a node that supports debug_traceTransaction.
+            storage_layout (dict): See SlotResolver.
+        """
+        self.tx = tx
+        self.resolver = SlotResolver(storage_layout)
+        # Semicolon separated stack of functions, source lines and storage
+        # accesses -> gas, as read by flamegraph.pl and speedscope.
+        self.folded = defaultdict(int)
+        self.by_line = defaultdict(int)
+        self.by_variable = defaultdict(lambda: {"SLOAD": 0, "SSTORE": 0, "gas": 0})
+        self.by_slot = defaultdict(lambda: {"SLOAD": 0, "SSTORE": 0, "gas": 0})
+        self._sources = {}
+        self._profile(tx.trace)
+
+    @property
+    def attributed_gas(self):
+        return sum(self.folded.values())
+
+    def _profile(self, trace: list):
+        costs = _step_costs(trace)
+        # Internal function stack of each external call depth.
+        frames = {}
+        for index, step in enumerate(trace):
+            frame = frames.setdefault(step["depth"], [])
+            del frame[step["jumpDepth"]:]
+            frame.append(step["fn"])
+            for depth in list(frames):
+                if depth > step["depth"]:
+                    del frames[depth]
+
+            if step["op"] in ("SHA3", "KECCAK256") and index + 1 < len(trace):
+                offset = int(step["stack"][-1], 16)
+                length = int(step["stack"][-2], 16)
+                memory = bytes.fromhex("".join(step["memory"]))
+                hash_value = int(trace[index + 1]["stack"][-1], 16)
+                self.resolver.add_preimage(hash_value, memory[offset : offset + length])
+
+            path = [function_name for depth in sorted(frames) for function_name in frames[depth]]
+            line = self._source_line(step)
+            if line is not None:
+                path.append(line)
+                self.by_line[line] += costs[index]
+            if step["op"] in STORAGE_OPCODES:
+                slot = int(step["stack"][-1], 16)
+                slot_name = self.resolver.name(slot)
+                path.append(f"{step['op']} {slot_name}")
+                for stats in (
+                    self.by_variable[self.resolver.variable(slot)],
+                    self.by_slot[slot_name],
+                ):
+                    stats[step["op"]] += 1
+                    stats["gas"] += costs[index]
+            self.folded[";".join(path)] += costs[index]
+
+    def _source_line(self, step: dict):
+        source = step.get("source")
+        if not source:
+            return None
+        filename = source["filename"]
+        if filename not in self._sources:
+            try:
+                with open(filename, "rb") as f:
+                    self._sources[filename] = f.read()
+            except OSError:
+                self._sources[filename] = None
+        if self._sources[filename] is None:
+            return None
+        line_number = self._sources[filename].count(b"\n", 0, source["offset"][0]) + 1
+        return f"{os.path.basename(filename)}:{line_number}"
+
+    def write_folded(self, path: str):
+        """
+        Writes the folded stacks, to render with flamegraph.pl or
+        speedscope.
+
+        Arguments:
+            path (str): Output file.
+        """
+        with open(path, "w") as f:
+            for stack, gas in sorted(self.folded.items()):
+                if gas > 0:
+                    f.write(f"{stack} {gas}\n")
+
+    def print_report(self, limit: int = 15):
+        """
+        Prints the gas of each function as an indented tree, widest first,
+        followed by the most expensive source lines and storage variables.
+
+        Arguments:
+            limit (int): Number of lines and variables to print.
+        """
+        print(
+            f"{self.tx.fn_name}: {self.tx.gas_used} gas used, {self.attributed_gas} "
+            f"attributed to execution (the rest is intrinsic gas and refunds)"
+        )
+        tree = {}
+        for stack, gas in self.folded.items():
+            node = tree
+            for frame in stack.split(";"):
+                node = node.setdefault(frame, {"gas": 0, "children": {}})
+                node["gas"] += gas
+                node = node["children"]
+        self._print_tree(tree, 0, max(self.attributed_gas, 1))
+
+        print("\nsource line | gas")
+        for line, gas in sorted(self.by_line.items(), key=lambda item: -item[1])[:limit]:
+            print(f"{line} | {gas}")
+        print("\nstorage variable | SLOAD | SSTORE | gas")
+        for variable, stats in sorted(
+            self.by_variable.items(), key=lambda item: -item[1]["gas"]
+        )[:limit]:
+            print(f"{variable} | {stats['SLOAD']} | {stats['SSTORE']} | {stats['gas']}")
+
+    def _print_tree(self, tree: dict, indent: int, total_gas: int):
+        for frame, node in sorted(tree.items(), key=lambda item: -item[1]["gas"]):
+            if node["gas"] <= 0:
+                continue
+            bar = "#" * max(1, round(40 * node["gas"] / total_gas))
+            print(f"{'  ' * indent}{frame} {node['gas']} {bar}")
+            self._print_tree(node["children"], indent + 1, total_gas)
+
+
+def _step_costs(trace: list):
+    # Gas spent by each step itself. The difference with the next step at the
+    # same depth is exact, including for SSTORE, but for a call it also
+    # includes what the callee spent, which is then taken out.
+    costs = [step["gasCost"] for step in trace]
+    for index, step in enumerate(trace[:-1]):
+        next_step = trace[index + 1]
+        if next_step["depth"] == step["depth"]:
+            costs[index] = step["gas"] - next_step["gas"]
+        elif next_step["depth"] > step["depth"]:
+            return_index = next(
+                (
+                    later_index
+                    for later_index in range(index + 1, len(trace))
+                    if trace[later_index]["depth"] <= step["depth"]
+                ),
+                None,
+            )
+            if return_index is None:
+                continue
+            last_callee_step = trace[return_index - 1]
+            callee_gas = next_step["gas"] - (last_callee_step["gas"] - last_callee_step["gasCost"])
+            costs[index] = step["gas"] - trace[return_index]["gas"] - callee_gas
+    return costs
+
+
+def main(tx_hash: str = None):
+    storage_layout = load_storage_layout(OpsNFT)
+    if tx_hash is not None:
+        StorageProfile(chain.get_transaction(tx_hash), storage_layout).print_report()
+        return
+
+    utils = Utils()
+    creator = utils.get_account(index=1)
+    submitter = utils.get_account(index=2)
+    ops_nft = OpsNFT.deploy({"from": utils.get_account()})
+    txs = [
+        ops_nft.safeMint("https://block-ops.xyz", {"from": creator, "value": Wei("0.01 ether")})
+    ]
+    for _ in range(2):
+        txs.append(
+            ops_nft.makeSubmission(0, "https://block-ops.xyz/submission", {"from": submitter})
+        )
+    txs.append(ops_nft.declareWinningSubmission(0, 1, {"from": creator}))
+    for tx in txs:
+        profile = StorageProfile(tx, storage_layout)
+        profile.print_report()
+        profile.write_folded(f"{tx.fn_name}-{tx.txid[:10]}.folded")
+        print()
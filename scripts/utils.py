@@ -1,5 +1,7 @@
 import os
 
+import brownie
+import requests
 from brownie import Contract, accounts, config, network, web3
 from web3 import Web3
 
@@ -11,6 +13,10 @@ LOCAL_BLOCKCHAIN_ENVIRONMENTS = NON_FORKED_LOCAL_BLOCKCHAIN_ENVIRONMENTS + [
 ]
 OPENSEA_TESTNET_URL = "https://testnets.opensea.io/assets"
 
+# Names of the mock contracts, looked up when a mock is needed so that
+# importing this module does not require contracts/test to be compiled.
+contract_to_mock = {"multicall3": "Multicall3"}
+
 
 class Utils:
     def __init__(
@@ -97,12 +103,10 @@ class Utils:
             Contract of the type specificed by the dictionary. This could be either
             a mock or the 'real' contract on a live network.
         """
-        contract_type = contract_to_mock[contract_name]
+        contract_type = self._get_mock_type(contract_name)
         if self.active_network in self.non_forked_local_blockchain_environments:
             if len(contract_type) <= 0:
-                # TODO: Add deploy_mocks() method
-                # self.deploy_mocks()
-                print("Deployed Mocks")
+                self.deploy_mocks()
 
             contract = contract_type[-1]
         else:
@@ -121,3 +125,106 @@ class Utils:
                     f"brownie run scripts/deploy_mocks.py --network {self.active_network}"
                 )
         return contract
+
+    def deploy_mocks(self):
+        """
+        Deploys a mock of every contract in 'contract_to_mock', for the
+        networks where the real contracts do not exist.
+        """
+        account = self.get_account()
+        for contract_name in contract_to_mock:
+            self._get_mock_type(contract_name).deploy({"from": account})
+        print("Deployed Mocks")
+
+    def _get_mock_type(self, contract_name: str):
+        # The project's contract containers are added to the brownie
+        # namespace when the project is loaded.
+        return getattr(brownie, contract_to_mock[contract_name])
+
+    def get_multicall(self):
+        """
+        Returns the Multicall3 contract of the active network: a mock on
+        development networks, or the address from the brownie config.
+
+        Returns:
+            brownie.network.contract.ProjectContract: Multicall3, or None if
+            the active network has no 'multicall3' entry in the config.
+        """
+        if (
+            self.active_network not in self.non_forked_local_blockchain_environments
+            and "multicall3" not in config["networks"].get(self.active_network, {})
+        ):
+            return None
+        return self.get_contract("multicall3")
+
+    def batch_call(
+        self,
+        calls: list,
+        batch_size: int = 100,
+        allow_failure: bool = False,
+        use_multicall: bool = True,
+    ):
+        """
+        Given a list of contract view calls, makes them in batches of
+        batch_size instead of one request each. The batches go through
+        Multicall3's aggregate3, or through JSON-RPC batch requests pinned
+        to the current block when Multicall3 is not available.
+
+        Arguments:
+            calls (list): (method, args) pairs, eg. [(nft.tokenDetails, (0,))].
+            batch_size (int): Number of calls per request. Multicall batches
+                              share the gas limit of a single eth_call.
+            allow_failure (bool): Return None for calls that revert instead
+                                  of raising.
+            use_multicall (bool): Set to False to always use JSON-RPC batches.
+
+        Returns:
+            list: The decoded result of each call, in order, as the method
+                  would have returned it.
+        """
+        multicall = self.get_multicall() if use_multicall else None
+        results = []
+        for start in range(0, len(calls), batch_size):
+            batch = calls[start : start + batch_size]
+            call_data = [method.encode_input(*args) for method, args in batch]
+            if multicall is not None:
+                return_data = [
+                    return_data if success else None
+                    for success, return_data in multicall.aggregate3.call(
+                        [
+                            (method._address, allow_failure, data)
+                            for (method, _), data in zip(batch, call_data)
+                        ]
+                    )
+                ]
+            else:
+                return_data = self._json_rpc_batch_call(
+                    [method._address for method, _ in batch], call_data, allow_failure
+                )
+            results += [
+                None if data is None else method.decode_output(data)
+                for (method, _), data in zip(batch, return_data)
+            ]
+        return results
+
+    def _json_rpc_batch_call(self, addresses: list, call_data: list, allow_failure: bool):
+        block = hex(web3.eth.block_number)
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": index,
+                "method": "eth_call",
+                "params": [{"to": address, "data": data}, block],
+            }
+            for index, (address, data) in enumerate(zip(addresses, call_data))
+        ]
+        response = requests.post(web3.provider.endpoint_uri, json=payload)
+        response.raise_for_status()
+        return_data = [None] * len(payload)
+        for item in response.json():
+            if "error" in item:
+                if not allow_failure:
+                    raise ValueError(item["error"])
+                continue
+            return_data[item["id"]] = item["result"]
+        return return_data
@@ -0,0 +1,177 @@
+from collections import OrderedDict
+
+from brownie import web3
+from eth_utils import is_hex_address, to_checksum_address
+
+from scripts.events import OPS_NFT_EVENTS
+
+# Views that never change once a token is minted. tokenURI and
+# contentBaseURI only change through setContentBaseURI, which clears the
+# cache.
+IMMUTABLE_METHODS = {
+    "getRoyaltyNumeratorAndDenominator",
+    "getNFTCreator",
+    "tokenIdToNftCreators",
+    "tokenURI",
+    "contentBaseURI",
+    "contractAddress",
+}
+# Logs that change the mutable views of the token and addresses they carry.
+INVALIDATING_EVENTS = {
+    "NFTMinted",
+    "SubmissionMade",
+    "Redeemed",
+    "RoyaltyPaid",
+    "Transfer",
+    "WinningSubmission",
+    "Approval",
+    "ApprovalForAll",
+    "OwnershipTransferred",
+}
+# Logs a follower feeding the cache must subscribe to, eg. with
+# event_topics(abi, VIEW_CACHE_EVENTS): the ones the indexer follows, plus
+# the ones moving getApproved, isApprovedForAll and owner.
+VIEW_CACHE_EVENTS = OPS_NFT_EVENTS + ["Approval", "ApprovalForAll", "OwnershipTransferred"]
+# Views indexed by project state rather than by token, which any mint or
+# state change can move tokens in or out of.
+STATE_INDEXED_METHODS = {"getTokenIdsByState", "getTokenCountByState"}
+# Views taking a list of token ids as their first argument.
+BATCH_METHODS = {"getTokenDetailsBatch"}
+
+
+class ViewCache:
+    def __init__(self, contract, max_size: int = 10000, immutable_methods: set = IMMUTABLE_METHODS):
+        """
+        Read-through cache for the view functions of an OpsNFT, with a
+        bounded size and least recently used eviction.
+
+        Immutable views are memoized forever. Mutable views are stored with
+        the block they were read at, and are served for that block, or for
+        any later block up to the last one whose logs were passed to
+        handle_logs. A log invalidates the mutable entries of its token id,
+        including the batches containing it, the ones that take one of its
+        addresses as an argument, the ones without arguments (eg.
+        getTotalBountyAmount) and the views indexed by project state.
+        Addresses are keyed and matched in their checksum form.
+
+        Once logs have been handled, mutable views are read at the last
+        block they cover by default, so a lookup does not need to ask the
+        node for its latest block.
+
+        Arguments:
+            contract (brownie.network.contract.ProjectContract): The OpsNFT.
+            max_size (int): Maximum number of entries.
+            immutable_methods (set): Names of the views to memoize forever.
+        """
+        self.contract = contract
+        self.max_size = max_size
+        self.immutable_methods = immutable_methods
+        self.entries = OrderedDict()
+        self.synced_block = -1
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def call(self, method_name: str, *args, block_identifier: int = None):
+        """
+        Arguments:
+            method_name (str): Name of the view function.
+            *args: Its arguments.
+            block_identifier (int): Block to read at. Defaults to the last
+                                    block passed to handle_logs, or to the
+                                    latest block before any was.
+
+        Returns:
+            The value the view returns.
+        """
+        key = (method_name, tuple(_normalize(arg) for arg in args))
+        immutable = method_name in self.immutable_methods
+        if block_identifier is None and not immutable:
+            if self.synced_block >= 0:
+                block_identifier = self.synced_block
+            else:
+                block_identifier = web3.eth.block_number
+
+        entry = self.entries.get(key)
+        if entry is not None and (immutable or self._is_valid(entry[1], block_identifier)):
+            self.entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[0]
+
+        self.stats["misses"] += 1
+        value = getattr(self.contract, method_name)(
+            *args, block_identifier=block_identifier
+        )
+        self.entries[key] = (value, block_identifier)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+        return value
+
+    def _is_valid(self, read_block: int, block_identifier: int):
+        if read_block == block_identifier:
+            return True
+        return read_block < block_identifier <= self.synced_block
+
+    def handle_logs(self, events: list, to_block: int):
+        """
+        Invalidates the entries changed by the given logs. Every OpsNFT log
+        up to to_block must have been passed, so the remaining entries are
+        known to still hold up to that block.
+
+        Arguments:
+            events (list): Decoded logs, as returned by
+                           scripts.events.decode_log.
+            to_block (int): Last block covered by the logs.
+        """
+        for event in events:
+            self._invalidate(event["event"], event["args"])
+        self.synced_block = max(self.synced_block, to_block)
+
+    def _invalidate(self, event_name: str, args: dict):
+        if event_name == "ContentBaseURIUpdated":
+            # The URIs of every content id change.
+            self.stats["invalidations"] += len(self.entries)
+            self.entries.clear()
+            return
+        if event_name not in INVALIDATING_EVENTS:
+            return
+
+        token_id = args.get("_tokenId", args.get("tokenId"))
+        addresses = {
+            value for value in map(_normalize, args.values()) if _is_address(value)
+        }
+        for key in list(self.entries):
+            method_name, method_args = key
+            if method_name in self.immutable_methods:
+                # Reads of a token made before it was minted.
+                stale = event_name == "NFTMinted" and method_args[:1] == (token_id,)
+            elif method_name in STATE_INDEXED_METHODS:
+                stale = True
+            elif method_name in BATCH_METHODS:
+                stale = token_id in method_args[0]
+            else:
+                stale = (
+                    not method_args
+                    or method_args[0] == token_id
+                    or any(arg in addresses for arg in method_args)
+                )
+            if stale:
+                del self.entries[key]
+                self.stats["invalidations"] += 1
+
+
+def _normalize(value):
+    # Lists of token ids are stored as tuples, to be hashable, and addresses
+    # (strings of any case, or Brownie accounts and contracts) as checksummed
+    # strings.
+    if isinstance(value, list):
+        return tuple(value)
+    if hasattr(value, "address"):
+        value = str(value.address)
+    if _is_address(value):
+        return to_checksum_address(value)
+    return value
+
+
+def _is_address(value):
+    return isinstance(value, str) and is_hex_address(value)
@@ -0,0 +1,61 @@
+import json
+import os
+
+import pytest
+
+GAS_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "gas_baseline.json")
+
+
+class GasBenchmark:
+    def __init__(self, baseline: dict, threshold: float, update: bool):
+        self.baseline = baseline
+        self.threshold = threshold
+        self.update = update
+        self.results = {}
+
+    def check(self, name: str, gas: int):
+        """
+        Records the gas of a benchmark and fails when it is more than
+        threshold above its baseline, or has no baseline.
+
+        Arguments:
+            name (str): Name of the benchmark, eg. "makeSubmission[submissions=10]".
+            gas (int): Gas it used.
+        """
+        self.results[name] = gas
+        if self.update:
+            return
+        baseline_gas = self.baseline.get(name)
+        if baseline_gas is None:
+            pytest.fail(
+                f"No gas baseline for {name}, record it with --update-gas-baseline "
+                f"and commit {os.path.relpath(GAS_BASELINE_PATH)}"
+            )
+        assert gas <= baseline_gas * (1 + self.threshold), (
+            f"{name} used {gas} gas, {(gas / baseline_gas - 1) * 100:.1f}% more than "
+            f"its baseline of {baseline_gas}"
+        )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def skip_without_gas_benchmark(request):
+    # Module scoped so that the benchmarks are skipped before their module
+    # fixtures build thousands of transactions.
+    if not (
+        request.config.getoption("gas_benchmark")
+        or request.config.getoption("update_gas_baseline")
+    ):
+        pytest.skip("gas benchmarks only run with --gas-benchmark or --update-gas-baseline")
+
+
+@pytest.fixture(scope="session")
+def gas_benchmark(request):
+    with open(GAS_BASELINE_PATH) as f:
+        baseline = json.load(f)
+    update = request.config.getoption("update_gas_baseline")
+    benchmark = GasBenchmark(baseline, request.config.getoption("gas_threshold"), update)
+    yield benchmark
+    if update and benchmark.results:
+        with open(GAS_BASELINE_PATH, "w") as f:
+            json.dump({**baseline, **benchmark.results}, f, indent=2, sort_keys=True)
+            f.write("\n")
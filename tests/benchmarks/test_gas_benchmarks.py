@@ -0,0 +1,162 @@
+import pytest
+from brownie import Wei
+
+# Gas is measured with estimate_gas on the grown state, so that one chain
+# can be grown through every size without sending the measured
+# transactions. Metadata URIs are kept under 32 bytes so each one fits in a
+# single storage slot and the views stay under the block gas limit at 1,000
+# submissions.
+TOKEN_METADATA_URI = "ipfs://token"
+SUBMISSION_METADATA_URI = "ipfs://submission"
+CONTENT_ID = "0x" + "ab" * 32
+AMOUNT_TO_ESCROW = Wei("0.01 ether")
+
+SUBMISSION_COUNTS = [1, 10, 100, 1000]
+TOKEN_COUNTS = [1, 10, 100, 1000]
+
+SUBMISSION_BENCHMARKS = [
+    "makeSubmission",
+    "makeSubmissionWithContentId",
+    "declareWinningSubmission",
+    "redeemEthFromNFT",
+    "tokenDetails",
+    "tokenDetailsPaginated",
+    "getTokenDetailsBatch",
+    "getSubmissionsForTokenId",
+    "getSubmissionsForTokenIdPaginated",
+    "getSubmissionsFromAddressForTokenId",
+    "getTokenIdsWithSubmissionsFromAddress",
+]
+CREATOR_BENCHMARKS = [
+    "safeMint",
+    "safeMintWithContentId",
+    "safeMintBatch",
+    "getArrayOfNFTsFromCreator",
+    "getTokenIdsByState",
+    "getTokenCountByState",
+    "withdrawRoyalties",
+    "setContentBaseURI",
+]
+
+
+@pytest.fixture(scope="module")
+def owner(utils):
+    # The account the shared nft is deployed from.
+    return utils.get_account()
+
+
+# The two scenarios share the module's contract, so each one gets its own
+# creator.
+@pytest.fixture(scope="module")
+def bounty_creator(utils):
+    return utils.get_account(index=2)
+
+
+@pytest.fixture(scope="module")
+def submitter(utils):
+    return utils.get_account(index=3)
+
+
+@pytest.fixture(scope="module")
+def creator(utils):
+    return utils.get_account(index=4)
+
+
+def _estimate_submission_benchmarks(nft, creator, submitter, token_id, number_of_submissions):
+    return {
+        "makeSubmission": nft.makeSubmission.estimate_gas(
+            token_id, SUBMISSION_METADATA_URI, {"from": submitter}
+        ),
+        "makeSubmissionWithContentId": nft.makeSubmissionWithContentId.estimate_gas(
+            token_id, CONTENT_ID, {"from": submitter}
+        ),
+        "declareWinningSubmission": nft.declareWinningSubmission.estimate_gas(
+            token_id, number_of_submissions - 1, {"from": creator}
+        ),
+        "redeemEthFromNFT": nft.redeemEthFromNFT.estimate_gas(token_id, {"from": creator}),
+        "tokenDetails": nft.tokenDetails.estimate_gas(token_id),
+        "tokenDetailsPaginated": nft.tokenDetailsPaginated.estimate_gas(token_id, 0, 10),
+        "getTokenDetailsBatch": nft.getTokenDetailsBatch.estimate_gas([token_id], 10),
+        "getSubmissionsForTokenId": nft.getSubmissionsForTokenId.estimate_gas(token_id),
+        "getSubmissionsForTokenIdPaginated": nft.getSubmissionsForTokenIdPaginated.estimate_gas(
+            token_id, 0, 10
+        ),
+        "getSubmissionsFromAddressForTokenId": nft.getSubmissionsFromAddressForTokenId.estimate_gas(
+            submitter, token_id
+        ),
+        "getTokenIdsWithSubmissionsFromAddress": nft.getTokenIdsWithSubmissionsFromAddress.estimate_gas(
+            submitter
+        ),
+    }
+
+
+def _estimate_creator_benchmarks(nft, owner, creator):
+    return {
+        "safeMint": nft.safeMint.estimate_gas(
+            TOKEN_METADATA_URI, {"from": creator, "value": AMOUNT_TO_ESCROW}
+        ),
+        "safeMintWithContentId": nft.safeMintWithContentId.estimate_gas(
+            CONTENT_ID, {"from": creator, "value": AMOUNT_TO_ESCROW}
+        ),
+        "safeMintBatch": nft.safeMintBatch.estimate_gas(
+            [TOKEN_METADATA_URI] * 10,
+            [AMOUNT_TO_ESCROW] * 10,
+            {"from": creator, "value": AMOUNT_TO_ESCROW * 10},
+        ),
+        "getArrayOfNFTsFromCreator": nft.getArrayOfNFTsFromCreator.estimate_gas(creator),
+        "getTokenIdsByState": nft.getTokenIdsByState.estimate_gas(0, 0, 100),
+        "getTokenCountByState": nft.getTokenCountByState.estimate_gas(0),
+        # Every mint accrues royalties, so there is always some to withdraw.
+        "withdrawRoyalties": nft.withdrawRoyalties.estimate_gas({"from": creator}),
+        "setContentBaseURI": nft.setContentBaseURI.estimate_gas(
+            "https://arweave.net/", {"from": owner}
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def submission_gas(nft, bounty_creator, submitter):
+    # Grows a single bounty through every submission count, measuring at
+    # each one.
+    safe_mint_tx = nft.safeMint(
+        TOKEN_METADATA_URI, {"from": bounty_creator, "value": AMOUNT_TO_ESCROW}
+    )
+    token_id = safe_mint_tx.events["NFTMinted"]["_tokenId"]
+    results = {}
+    number_of_submissions = 0
+    for count in SUBMISSION_COUNTS:
+        while number_of_submissions < count:
+            nft.makeSubmission(token_id, SUBMISSION_METADATA_URI, {"from": submitter})
+            number_of_submissions += 1
+        results[count] = _estimate_submission_benchmarks(
+            nft, bounty_creator, submitter, token_id, number_of_submissions
+        )
+    return results
+
+
+@pytest.fixture(scope="module")
+def creator_gas(nft, owner, creator):
+    # Grows the number of bounties of a single creator, measuring at each
+    # count.
+    results = {}
+    number_of_tokens = 0
+    for count in TOKEN_COUNTS:
+        while number_of_tokens < count:
+            nft.safeMint(TOKEN_METADATA_URI, {"from": creator, "value": AMOUNT_TO_ESCROW})
+            number_of_tokens += 1
+        results[count] = _estimate_creator_benchmarks(nft, owner, creator)
+    return results
+
+
+@pytest.mark.parametrize("count", SUBMISSION_COUNTS)
+@pytest.mark.parametrize("function_name", SUBMISSION_BENCHMARKS)
+def test_gas_with_submissions(submission_gas, gas_benchmark, function_name, count):
+    gas_benchmark.check(
+        f"{function_name}[submissions={count}]", submission_gas[count][function_name]
+    )
+
+
+@pytest.mark.parametrize("count", TOKEN_COUNTS)
+@pytest.mark.parametrize("function_name", CREATOR_BENCHMARKS)
+def test_gas_with_tokens_per_creator(creator_gas, gas_benchmark, function_name, count):
+    gas_benchmark.check(f"{function_name}[tokens={count}]", creator_gas[count][function_name])
@@ -1,9 +1,68 @@
+import time
+from contextlib import contextmanager
+
 import brownie
 import pytest
+from brownie import chain
 from web3 import Web3
 
 from scripts.utils import Utils
 
+TOKEN_METADATA_URI = "https://my-nft.metadata/here-is-some-cool-metadata.json"
+SUBMISSION_METADATA_URI = "https://my-submission.metadata/here-is-a-submission.json"
+SEEDED_ESCROW = Web3.toWei(1, "ether")
+NUMBER_OF_SEEDED_TOKENS = 5
+NUMBER_OF_SEEDED_SUBMISSIONS = 20
+# Accounts the seeded state is built from, away from the accounts the tests
+# send from so that their balances and nonces are not affected.
+SEEDER_ACCOUNT_INDEX = 9
+SEED_SUBMITTER_ACCOUNT_INDEX = 8
+
+_seeding = {}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--gas-benchmark",
+        action="store_true",
+        help="Run the gas benchmarks in tests/benchmarks against the baseline.",
+    )
+    parser.addoption(
+        "--update-gas-baseline",
+        action="store_true",
+        help="Run the gas benchmarks and write their results to the baseline.",
+    )
+    parser.addoption(
+        "--gas-threshold",
+        type=float,
+        default=0.05,
+        help="Fraction above its baseline at which a gas benchmark fails.",
+    )
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _seeding:
+        terminalreporter.write_sep("=", "seeded chain")
+        terminalreporter.write_line(
+            f"{_seeding['transactions']} transactions seeded in "
+            f"{_seeding['seconds']:.2f}s for {_seeding['modules']} modules, "
+            "restored by snapshot before every test"
+        )
+
+
+@contextmanager
+def _record_seeding():
+    # Adds the time and transactions spent seeding a module's contracts to
+    # the terminal summary.
+    start_time = time.perf_counter()
+    number_of_transactions = len(chain.history)
+    yield
+    _seeding["modules"] = _seeding.get("modules", 0) + 1
+    _seeding["transactions"] = (
+        _seeding.get("transactions", 0) + len(chain.history) - number_of_transactions
+    )
+    _seeding["seconds"] = _seeding.get("seconds", 0) + time.perf_counter() - start_time
+
 
 @pytest.fixture(scope="function", autouse=True)
 def isolate(fn_isolation):
@@ -19,12 +78,12 @@ def amount_to_escrow_in_nft():
 
 @pytest.fixture
 def token_metadata_uri():
-    return "https://my-nft.metadata/here-is-some-cool-metadata.json"
+    return TOKEN_METADATA_URI
 
 
 @pytest.fixture
 def submission_metadata_uri():
-    return "https://my-submission.metadata/here-is-a-submission.json"
+    return SUBMISSION_METADATA_URI
 
 
 @pytest.fixture(scope="module")
@@ -54,6 +113,28 @@ def royalty_account():
     return royalty_account
 
 
+@pytest.fixture(scope="module")
+def seeder_account():
+    utils = Utils()
+    return utils.get_account(index=SEEDER_ACCOUNT_INDEX)
+
+
+@pytest.fixture(scope="module")
+def seed_submitter_account():
+    utils = Utils()
+    return utils.get_account(index=SEED_SUBMITTER_ACCOUNT_INDEX)
+
+
+@pytest.fixture(scope="session")
+def number_of_seeded_tokens():
+    return NUMBER_OF_SEEDED_TOKENS
+
+
+@pytest.fixture(scope="session")
+def number_of_seeded_submissions():
+    return NUMBER_OF_SEEDED_SUBMISSIONS
+
+
 @pytest.fixture(scope="module")
 def nft(OpsNFT):
     utils = Utils()
@@ -61,6 +142,52 @@ def nft(OpsNFT):
     return OpsNFT.deploy({"from": account})
 
 
+@pytest.fixture(scope="module")
+def sequential_nft(OpsNFTSequential):
+    utils = Utils()
+    account = utils.get_account()
+    return OpsNFTSequential.deploy({"from": account})
+
+
+# The seeded contracts are built once for each module that uses them, after
+# module_isolation has reset the chain. fn_isolation then snapshots the
+# chain with them in place, so every test of the module starts from the
+# same seeded state without sending the transactions again.
+@pytest.fixture(scope="module")
+def minted_nft(module_isolation, OpsNFT, seeder_account):
+    """
+    An OpsNFT with NUMBER_OF_SEEDED_TOKENS tokens minted by seeder_account,
+    each escrowing SEEDED_ESCROW, and no submissions.
+    """
+    with _record_seeding():
+        minted_nft = OpsNFT.deploy({"from": seeder_account})
+        for _ in range(NUMBER_OF_SEEDED_TOKENS):
+            minted_nft.safeMint(
+                TOKEN_METADATA_URI, {"from": seeder_account, "value": SEEDED_ESCROW}
+            )
+    return minted_nft
+
+
+@pytest.fixture(scope="module")
+def nft_with_submissions(module_isolation, OpsNFT, seeder_account, seed_submitter_account):
+    """
+    An OpsNFT with 3 tokens minted by seeder_account, each escrowing
+    SEEDED_ESCROW and with NUMBER_OF_SEEDED_SUBMISSIONS submissions from
+    seed_submitter_account.
+    """
+    with _record_seeding():
+        nft_with_submissions = OpsNFT.deploy({"from": seeder_account})
+        for token_id in range(3):
+            nft_with_submissions.safeMint(
+                TOKEN_METADATA_URI, {"from": seeder_account, "value": SEEDED_ESCROW}
+            )
+            for _ in range(NUMBER_OF_SEEDED_SUBMISSIONS):
+                nft_with_submissions.makeSubmission(
+                    token_id, SUBMISSION_METADATA_URI, {"from": seed_submitter_account}
+                )
+    return nft_with_submissions
+
+
 @pytest.fixture(scope="module")
 def utils():
     return Utils()
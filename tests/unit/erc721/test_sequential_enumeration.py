@@ -0,0 +1,126 @@
+import pytest
+from brownie import exceptions
+
+IERC721_ENUMERABLE_INTERFACE_ID = "0x780e9d63"
+
+
+def _mint_and_transfer(contract, valid_account, invalid_account, token_metadata_uri, amount):
+    for minter in [valid_account] * 3 + [invalid_account] * 2:
+        safe_mint_tx = contract.safeMint(
+            token_metadata_uri, {"from": minter, "value": amount}
+        )
+        safe_mint_tx.wait(1)
+
+    transfer_tx = contract.safeTransferFrom(
+        valid_account, invalid_account, 0, {"from": valid_account}
+    )
+    transfer_tx.wait(1)
+    transfer_tx = contract.safeTransferFrom(
+        invalid_account, valid_account, 4, {"from": invalid_account}
+    )
+    transfer_tx.wait(1)
+
+
+def _tokens_of_owner(contract, owner):
+    return [
+        contract.tokenOfOwnerByIndex(owner, index)
+        for index in range(contract.balanceOf(owner))
+    ]
+
+
+def test_sequential_enumeration_matches_erc721_enumerable(
+    nft,
+    sequential_nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    for contract in [nft, sequential_nft]:
+        _mint_and_transfer(
+            contract,
+            valid_account,
+            invalid_account,
+            token_metadata_uri,
+            amount_to_escrow_in_nft,
+        )
+
+    assert sequential_nft.totalSupply() == nft.totalSupply() == 5
+    for index in range(nft.totalSupply()):
+        assert sequential_nft.tokenByIndex(index) == nft.tokenByIndex(index)
+
+    # ERC721Enumerable reorders an owner's tokens on transfer, while
+    # OpsNFTSequential always returns them in ascending id order.
+    for owner in [valid_account, invalid_account]:
+        sequential_tokens = _tokens_of_owner(sequential_nft, owner)
+        assert sequential_tokens == sorted(_tokens_of_owner(nft, owner))
+        assert sequential_tokens == sorted(sequential_tokens)
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        sequential_nft.tokenByIndex(5)
+    with pytest.raises(exceptions.VirtualMachineError):
+        sequential_nft.tokenOfOwnerByIndex(valid_account, 3)
+
+
+def test_sequential_nft_supports_enumerable_interface(nft, sequential_nft):
+    assert nft.supportsInterface(IERC721_ENUMERABLE_INTERFACE_ID)
+    assert sequential_nft.supportsInterface(IERC721_ENUMERABLE_INTERFACE_ID)
+
+
+def test_sequential_nft_runs_bounties(
+    sequential_nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    safe_mint_tx = sequential_nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    submission_tx = sequential_nft.makeSubmission(
+        0, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    winning_submission_tx = sequential_nft.declareWinningSubmission(
+        0, 0, {"from": valid_account}
+    )
+    winning_submission_tx.wait(1)
+
+    assert sequential_nft.ownerOf(0) == invalid_account
+    assert sequential_nft.tokenOfOwnerByIndex(invalid_account, 0) == 0
+    assert sequential_nft.balanceOf(valid_account) == 0
+
+
+def test_sequential_mint_and_transfer_are_cheaper(
+    nft,
+    sequential_nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    mint_gas = {}
+    transfer_gas = {}
+    for name, contract in [("OpsNFT", nft), ("OpsNFTSequential", sequential_nft)]:
+        # The second mint and the first transfer are compared, so
+        # both contracts start from the same warm state.
+        for _ in range(2):
+            safe_mint_tx = contract.safeMint(
+                token_metadata_uri,
+                {"from": valid_account, "value": amount_to_escrow_in_nft},
+            )
+            safe_mint_tx.wait(1)
+        mint_gas[name] = safe_mint_tx.gas_used
+
+        transfer_tx = contract.safeTransferFrom(
+            valid_account, invalid_account, 0, {"from": valid_account}
+        )
+        transfer_tx.wait(1)
+        transfer_gas[name] = transfer_tx.gas_used
+
+    # ERC721Enumerable writes at least four fresh slots on a mint, each one
+    # costing 20,000 gas, so the saving is at least one of them.
+    assert mint_gas["OpsNFT"] - mint_gas["OpsNFTSequential"] >= 20000
+    assert transfer_gas["OpsNFTSequential"] < transfer_gas["OpsNFT"]
@@ -0,0 +1,160 @@
+import pytest
+from brownie import exceptions
+
+
+@pytest.fixture
+def token_content_id():
+    return "0x" + "11" * 32
+
+
+@pytest.fixture
+def submission_content_id():
+    return "0x" + "ab" * 32
+
+
+def test_safe_mint_with_content_id(
+    nft, valid_account, token_content_id, amount_to_escrow_in_nft
+):
+    safe_mint_tx = nft.safeMintWithContentId(
+        token_content_id, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+
+    token_id = 0
+    expected_token_uri = nft.contentBaseURI() + token_content_id[2:]
+    assert nft.tokenURI(token_id) == expected_token_uri
+    assert nft.tokenDetails(token_id)[1] == expected_token_uri
+    assert safe_mint_tx.events["NFTMinted"]["_tokenMetadata"] == ""
+    assert safe_mint_tx.events["NFTMinted"]["_contentId"] == token_content_id
+    assert nft.ownerOf(token_id) == valid_account
+
+
+def test_content_id_can_not_be_empty(
+    nft, valid_account, invalid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    empty_content_id = "0x" + "00" * 32
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.safeMintWithContentId(
+            empty_content_id,
+            {"from": valid_account, "value": amount_to_escrow_in_nft},
+        )
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.makeSubmissionWithContentId(0, empty_content_id, {"from": invalid_account})
+
+
+def test_make_submission_with_content_id(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    submission_content_id,
+    amount_to_escrow_in_nft,
+):
+    token_id = 0
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+
+    submission_tx = nft.makeSubmission(
+        token_id, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    submission_tx = nft.makeSubmissionWithContentId(
+        token_id, submission_content_id, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+
+    expected_submission_uri = nft.contentBaseURI() + submission_content_id[2:]
+    assert submission_tx.events["SubmissionMade"]["_submissionString"] == ""
+    assert submission_tx.events["SubmissionMade"]["_contentId"] == submission_content_id
+    assert nft.getSubmissionsForTokenId(token_id) == [
+        (invalid_account, submission_metadata_uri),
+        (invalid_account, expected_submission_uri),
+    ]
+    assert nft.getSubmission(1) == (invalid_account, expected_submission_uri)
+
+    winning_submission_tx = nft.declareWinningSubmission(
+        token_id, 1, {"from": valid_account}
+    )
+    winning_submission_tx.wait(1)
+    assert (
+        winning_submission_tx.events["WinningSubmission"]["_metadataURI"]
+        == expected_submission_uri
+    )
+    assert nft.getWinningSubmissionForTokenId(token_id) == (
+        invalid_account,
+        expected_submission_uri,
+    )
+
+
+def test_only_owner_can_set_content_base_uri(
+    nft, valid_account, invalid_account, token_content_id, amount_to_escrow_in_nft
+):
+    safe_mint_tx = nft.safeMintWithContentId(
+        token_content_id, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+
+    new_content_base_uri = "https://arweave.net/"
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.setContentBaseURI(new_content_base_uri, {"from": invalid_account})
+
+    set_base_uri_tx = nft.setContentBaseURI(new_content_base_uri, {"from": valid_account})
+    set_base_uri_tx.wait(1)
+    assert "ContentBaseURIUpdated" in set_base_uri_tx.events.keys()
+    assert nft.contentBaseURI() == new_content_base_uri
+    assert nft.tokenURI(0) == new_content_base_uri + token_content_id[2:]
+
+
+def test_content_id_gas_does_not_depend_on_uri_length(
+    nft, valid_account, invalid_account, amount_to_escrow_in_nft
+):
+    short_uri = "https://block-ops.io/a.json"
+    long_uri = "https://block-ops.io/" + "a" * 200 + ".json"
+
+    # The first mint and submission initialize contract-wide storage, so
+    # they are left out of the comparisons.
+    string_mint_gas = []
+    for uri in [short_uri, short_uri, long_uri]:
+        safe_mint_tx = nft.safeMint(
+            uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+        string_mint_gas.append(safe_mint_tx.gas_used)
+
+    content_id_mint_gas = []
+    for content_id in ["0x" + "11" * 32, "0x" + "22" * 32]:
+        safe_mint_tx = nft.safeMintWithContentId(
+            content_id, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+        content_id_mint_gas.append(safe_mint_tx.gas_used)
+
+    assert string_mint_gas[2] > string_mint_gas[1]
+    assert content_id_mint_gas[0] == content_id_mint_gas[1]
+    assert content_id_mint_gas[0] < string_mint_gas[2]
+
+    string_submission_gas = []
+    for uri in [short_uri, short_uri, long_uri]:
+        submission_tx = nft.makeSubmission(0, uri, {"from": invalid_account})
+        submission_tx.wait(1)
+        string_submission_gas.append(submission_tx.gas_used)
+
+    content_id_submission_gas = []
+    for content_id in ["0x" + "33" * 32, "0x" + "44" * 32]:
+        submission_tx = nft.makeSubmissionWithContentId(
+            0, content_id, {"from": invalid_account}
+        )
+        submission_tx.wait(1)
+        content_id_submission_gas.append(submission_tx.gas_used)
+
+    assert string_submission_gas[2] > string_submission_gas[1]
+    assert content_id_submission_gas[0] == content_id_submission_gas[1]
+    assert content_id_submission_gas[0] < string_submission_gas[2]
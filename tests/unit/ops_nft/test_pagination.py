@@ -0,0 +1,156 @@
+import pytest
+from brownie import exceptions
+
+
+def _make_submissions(nft, token_id, submitter, number_of_submissions):
+    for i in range(number_of_submissions):
+        submission_tx = nft.makeSubmission(
+            token_id,
+            f"https://block-ops.io/ipfs/submission-{i}.json",
+            {"from": submitter},
+        )
+        submission_tx.wait(1)
+
+
+def test_submission_count(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    token_id = 0
+    assert nft.getSubmissionCount(token_id) == 0
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    assert nft.getSubmissionCount(token_id) == 0
+
+    _make_submissions(nft, token_id, invalid_account, 3)
+    assert nft.getSubmissionCount(token_id) == 3
+
+
+def test_submissions_are_paginated(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    token_id = 0
+    number_of_submissions = 5
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    _make_submissions(nft, token_id, invalid_account, number_of_submissions)
+
+    all_submissions = nft.getSubmissionsForTokenId(token_id)
+    assert len(all_submissions) == number_of_submissions
+
+    first_page = nft.getSubmissionsForTokenIdPaginated(token_id, 0, 2)
+    second_page = nft.getSubmissionsForTokenIdPaginated(token_id, 2, 2)
+    last_page = nft.getSubmissionsForTokenIdPaginated(token_id, 4, 2)
+    assert first_page == all_submissions[0:2]
+    assert second_page == all_submissions[2:4]
+    assert last_page == all_submissions[4:5]
+
+    assert nft.getSubmissionsForTokenIdPaginated(token_id, 5, 2) == ()
+    assert nft.getSubmissionsForTokenIdPaginated(token_id, 0, 0) == ()
+    assert (
+        nft.getSubmissionsForTokenIdPaginated(token_id, 1, 2**256 - 1)
+        == all_submissions[1:]
+    )
+
+
+def test_seeded_submissions_are_paginated(nft_with_submissions, number_of_seeded_submissions):
+    nft = nft_with_submissions
+    token_id = 1
+    page_size = 3
+
+    all_submissions = nft.getSubmissionsForTokenId(token_id)
+    assert len(all_submissions) == number_of_seeded_submissions
+
+    pages = [
+        nft.getSubmissionsForTokenIdPaginated(token_id, offset, page_size)
+        for offset in range(0, number_of_seeded_submissions, page_size)
+    ]
+    assert all(len(page) == page_size for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= page_size
+    assert sum(pages, ()) == all_submissions
+
+    assert (
+        nft.getSubmissionsForTokenIdPaginated(token_id, number_of_seeded_submissions, 2)
+        == ()
+    )
+    assert nft.getSubmissionsForTokenIdPaginated(token_id, 0, 0) == ()
+    assert (
+        nft.getSubmissionsForTokenIdPaginated(token_id, 1, 2**256 - 1)
+        == all_submissions[1:]
+    )
+
+
+def test_token_details_paginated(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    token_id = 0
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.tokenDetailsPaginated(token_id, 0, 1)
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    _make_submissions(nft, token_id, invalid_account, 3)
+
+    token_details = nft.tokenDetails(token_id)
+    paginated_token_details = nft.tokenDetailsPaginated(token_id, 1, 1)
+
+    assert paginated_token_details[:6] == token_details[:6]
+    assert paginated_token_details[6] == token_details[6][1:2]
+
+
+def test_page_cost_is_flat_as_submissions_grow(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    token_id = 0
+    page_size = 5
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+
+    _make_submissions(nft, token_id, invalid_account, page_size)
+    small_page_gas = nft.getSubmissionsForTokenIdPaginated.estimate_gas(
+        token_id, 0, page_size, {"from": valid_account}
+    )
+    small_full_gas = nft.getSubmissionsForTokenId.estimate_gas(
+        token_id, {"from": valid_account}
+    )
+
+    _make_submissions(nft, token_id, invalid_account, 4 * page_size)
+    large_page_gas = nft.getSubmissionsForTokenIdPaginated.estimate_gas(
+        token_id, 0, page_size, {"from": valid_account}
+    )
+    large_full_gas = nft.getSubmissionsForTokenId.estimate_gas(
+        token_id, {"from": valid_account}
+    )
+
+    assert (
+        large_page_gas == small_page_gas
+    ), f"Page cost grew with the number of submissions: {small_page_gas} -> {large_page_gas}"
+    assert large_full_gas > small_full_gas
@@ -65,3 +65,47 @@ def test_total_bounty_amount(
 
     nft_total_bounty_amount = nft.getTotalBountyAmount()
     assert nft_total_bounty_amount == total_amount_escrowed
+
+
+def test_token_data_getters(
+    nft,
+    token_metadata_uri,
+    submission_metadata_uri,
+    valid_account,
+    amount_to_escrow_in_nft,
+    invalid_account,
+):
+    token_id = 0
+    assert nft.amountOfEthInNFT(token_id) == 0
+    assert nft.tokenIdToProjectState(token_id) == 0
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    escrow_value = safe_mint_tx.events["NFTMinted"]["_escrowValue"]
+
+    assert nft.amountOfEthInNFT(token_id) == escrow_value
+    assert nft.tokenIdToNftCreators(token_id) == valid_account
+    assert nft.tokenIdToProjectState(token_id) == 0
+
+    submission_tx = nft.makeSubmission(
+        token_id, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    assert nft.tokenIdToProjectState(token_id) == 1
+    assert nft.amountOfEthInNFT(token_id) == escrow_value
+
+    winning_submission_tx = nft.declareWinningSubmission(
+        token_id, 0, {"from": valid_account}
+    )
+    winning_submission_tx.wait(1)
+    assert nft.tokenIdToProjectState(token_id) == 2
+    assert nft.tokenIdToNftCreators(token_id) == valid_account
+
+    redemption_tx = nft.redeemEthFromNFT(token_id, {"from": invalid_account})
+    redemption_tx.wait(1)
+    assert nft.amountOfEthInNFT(token_id) == 0
+    assert nft.tokenIdToNftCreators(token_id) == valid_account
+    assert nft.tokenIdToProjectState(token_id) == 2
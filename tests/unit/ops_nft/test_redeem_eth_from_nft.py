@@ -10,45 +10,37 @@ def test_redeem_requires_initialization(nft):
         nft.redeemEthFromNFT(0)
 
 
-def test_redeem_can_only_be_called_by_owner(
-    nft, token_metadata_uri, amount_to_escrow_in_nft, valid_account, invalid_account
-):
-
-    safe_mint_tx = nft.safeMint(
-        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
-    )
-    safe_mint_tx.wait(1)
-
+def test_redeem_can_only_be_called_by_owner(minted_nft, seeder_account, invalid_account):
+    nft = minted_nft
     token_id = 0
-    assert nft.ownerOf(token_id) == valid_account
+    assert nft.ownerOf(token_id) == seeder_account
     with pytest.raises(exceptions.VirtualMachineError):
         redemption_tx = nft.redeemEthFromNFT(token_id, {"from": invalid_account})
         redemption_tx.wait(1)
 
-    redemption_tx = nft.redeemEthFromNFT(token_id, {"from": valid_account})
+    redemption_tx = nft.redeemEthFromNFT(token_id, {"from": seeder_account})
     redemption_tx.wait(1)
 
     assert "Redeemed" in redemption_tx.events.keys()
 
 
 def test_redeems_correct_amount_of_eth(
-    nft, token_metadata_uri, amount_to_escrow_in_nft, valid_account, invalid_account
+    minted_nft, amount_to_escrow_in_nft, number_of_seeded_tokens
 ):
-
-    safe_mint_tx = nft.safeMint(
-        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
-    )
-    safe_mint_tx.wait(1)
-
+    nft = minted_nft
     token_id = 0
     _, royalty_amount = nft.royaltyInfo(token_id, amount_to_escrow_in_nft)
     amount_to_escrow_minus_royalty_fee = amount_to_escrow_in_nft - royalty_amount
     royalty_fraction = royalty_amount / amount_to_escrow_in_nft
-    assert amount_to_escrow_minus_royalty_fee == nft.balance()
+    # The contract also holds the royalties accrued so far, and every seeded
+    # token escrows the same amount.
+    escrowed_amount = (nft.balance() - nft.accruedRoyalties()) // number_of_seeded_tokens
+    assert escrowed_amount == nft.getAmountStoredInNFT(token_id)
+    assert amount_to_escrow_minus_royalty_fee == escrowed_amount
     assert royalty_fraction >= 0, f"royalty_fraction is negative: {royalty_fraction}"
 
-    _, royalty_amount_on_redemption = nft.royaltyInfo(token_id, nft.balance())
-    amount_of_eth_to_be_redeemed = nft.balance() - royalty_amount_on_redemption
+    _, royalty_amount_on_redemption = nft.royaltyInfo(token_id, escrowed_amount)
+    amount_of_eth_to_be_redeemed = escrowed_amount - royalty_amount_on_redemption
 
     # amount the redeemer redeems is the original escrowed amount
     # minues 1% at the time of minting and 1% at the time of
@@ -96,14 +88,15 @@ def test_account_balances_are_correct(
     assert minter_beginning_balance - valid_account.balance() == amount_to_escrow_in_nft
 
     # asserting that the nft balance has been increased
-    # by amount_to_escrow_in_nft minus the minted_royalty_amount
-    assert amount_to_escrow_minus_royalty_fee == nft.balance()
+    # by amount_to_escrow_in_nft, of which minted_royalty_amount
+    # is accrued for the royalty_address.
+    assert amount_to_escrow_in_nft == nft.balance()
+    assert minted_royalty_amount == nft.accruedRoyalties()
+    assert amount_to_escrow_minus_royalty_fee == nft.getAmountStoredInNFT(token_id)
 
-    # asserting that the royalty_address balance has been
-    # increased by the royalty amount.
-    assert (
-        royalty_account.balance() == minted_royalty_amount + royalty_beginning_balance
-    )
+    # asserting that the royalty_address balance is only
+    # increased once the royalties are withdrawn.
+    assert royalty_account.balance() == royalty_beginning_balance
 
     # We pretend the job has been completed, so the
     # NFT is transfered to the redeemers account.
@@ -115,14 +108,20 @@ def test_account_balances_are_correct(
     assert nft.ownerOf(token_id) == invalid_account
 
     # Now we calculate what the new royalty fee is.
-    _, redeemed_royalty_amount = nft.royaltyInfo(token_id, nft.balance())
+    _, redeemed_royalty_amount = nft.royaltyInfo(
+        token_id, nft.getAmountStoredInNFT(token_id)
+    )
 
     # Now we redeem the NFT
     redemption_tx = nft.redeemEthFromNFT(token_id, {"from": invalid_account})
     redemption_tx.wait(1)
-    assert "RoyaltyPaid" in redemption_tx.events.keys()
     assert "Redeemed" in redemption_tx.events.keys()
 
+    # And sweep the accrued royalties to the royalty_address.
+    withdraw_tx = nft.withdrawRoyalties({"from": valid_account})
+    withdraw_tx.wait(1)
+    assert "RoyaltyPaid" in withdraw_tx.events.keys()
+
     minter_final_balance = valid_account.balance()
     redeemer_final_balance = invalid_account.balance()
     royalty_account_final_balance = royalty_account.balance()
@@ -162,3 +161,68 @@ def test_get_royalty_num_and_denom(nft):
     numerator, denominator = nft.getRoyaltyNumeratorAndDenominator()
     assert numerator == 100
     assert numerator / denominator == 0.01
+
+
+def test_royalties_accrue_until_withdrawn(
+    nft,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+    valid_account,
+    royalty_account,
+):
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.withdrawRoyalties({"from": valid_account})
+
+    royalty_beginning_balance = royalty_account.balance()
+    expected_royalties = 0
+    for token_id in range(3):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+        expected_royalties += nft.royaltyInfo(token_id, amount_to_escrow_in_nft)[1]
+
+        _, redeemed_royalty_amount = nft.royaltyInfo(
+            token_id, nft.getAmountStoredInNFT(token_id)
+        )
+        redemption_tx = nft.redeemEthFromNFT(token_id, {"from": valid_account})
+        redemption_tx.wait(1)
+        assert "RoyaltyPaid" not in redemption_tx.events.keys()
+        expected_royalties += redeemed_royalty_amount
+
+    assert nft.accruedRoyalties() == expected_royalties
+    assert royalty_account.balance() == royalty_beginning_balance
+
+    withdraw_tx = nft.withdrawRoyalties({"from": valid_account})
+    withdraw_tx.wait(1)
+    assert withdraw_tx.events["RoyaltyPaid"]["_amount"] == expected_royalties
+    assert royalty_account.balance() == royalty_beginning_balance + expected_royalties
+    assert nft.accruedRoyalties() == 0
+    assert nft.balance() == 0
+
+
+def test_reentrant_redeem_pays_out_once(
+    minted_nft,
+    ReentrantRedeemer,
+    submission_metadata_uri,
+    seeder_account,
+    valid_account,
+):
+    # The other seeded bounties keep ETH in the contract for a re-entered
+    # redeem to take.
+    nft = minted_nft
+    redeemer = ReentrantRedeemer.deploy(nft, {"from": valid_account})
+    redeemer.makeSubmission(0, submission_metadata_uri, {"from": valid_account})
+    nft.declareWinningSubmission(0, 0, {"from": seeder_account})
+
+    amount = nft.getAmountStoredInNFT(0)
+    _, royalty_amount = nft.royaltyInfo(0, amount)
+    contract_balance = nft.balance()
+    redemption_tx = redeemer.redeem(0, {"from": valid_account})
+    redemption_tx.wait(1)
+
+    assert redeemer.reentries() == 1
+    assert redeemer.balance() == amount - royalty_amount
+    assert nft.balance() == contract_balance - (amount - royalty_amount)
+    assert nft.getAmountStoredInNFT(0) == 0
+    assert nft.getAmountStoredInNFT(1) > 0
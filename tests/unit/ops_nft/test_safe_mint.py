@@ -150,7 +150,7 @@ def test_nftminted_event_is_emitted(
     ), f"NFTMinted Event not emitted during safeMint"
 
 
-def test_royaltypaid_event_is_emitted(
+def test_royalty_is_accrued_on_mint(
     nft, token_metadata_uri, valid_account, amount_to_escrow_in_nft
 ):
     safe_mint_tx = nft.safeMint(
@@ -158,8 +158,30 @@ def test_royaltypaid_event_is_emitted(
     )
     safe_mint_tx.wait(1)
     assert (
-        "RoyaltyPaid" in safe_mint_tx.events.keys()
-    ), f"RoyaltyPaid Event not emitted during safeMint"
+        "RoyaltyPaid" not in safe_mint_tx.events.keys()
+    ), f"RoyaltyPaid Event emitted during safeMint"
+
+    _, royalty_amount = nft.royaltyInfo(0, amount_to_escrow_in_nft)
+    assert nft.accruedRoyalties() == royalty_amount
+
+
+def test_royaltypaid_event_is_emitted_on_withdrawal(
+    nft, token_metadata_uri, valid_account, amount_to_escrow_in_nft
+):
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    accrued_royalties = nft.accruedRoyalties()
+
+    withdraw_tx = nft.withdrawRoyalties({"from": valid_account})
+    withdraw_tx.wait(1)
+    assert (
+        "RoyaltyPaid" in withdraw_tx.events.keys()
+    ), f"RoyaltyPaid Event not emitted during withdrawRoyalties"
+    assert withdraw_tx.events["RoyaltyPaid"]["_to"] == nft._royaltyAddress()
+    assert withdraw_tx.events["RoyaltyPaid"]["_amount"] == accrued_royalties
+    assert nft.accruedRoyalties() == 0
 
 
 def test_amount_of_eth_in_nft_is_updated(
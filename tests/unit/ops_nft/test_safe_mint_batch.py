@@ -0,0 +1,139 @@
+import pytest
+from brownie import exceptions
+from web3 import Web3
+
+
+@pytest.fixture
+def token_metadata_uris():
+    return [
+        f"https://my-nft.metadata/here-is-some-cool-metadata-{i}.json"
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def amounts_to_escrow(token_metadata_uris):
+    return [Web3.toWei(i + 1, "ether") for i in range(len(token_metadata_uris))]
+
+
+def test_safe_mint_batch_mints_every_token(
+    nft, valid_account, token_metadata_uris, amounts_to_escrow
+):
+    safe_mint_batch_tx = nft.safeMintBatch(
+        token_metadata_uris,
+        amounts_to_escrow,
+        {"from": valid_account, "value": sum(amounts_to_escrow)},
+    )
+    safe_mint_batch_tx.wait(1)
+
+    assert nft.totalSupply() == len(token_metadata_uris)
+    assert nft.initialized() == True
+    assert nft.getArrayOfNFTsFromCreator(valid_account) == tuple(
+        range(len(token_metadata_uris))
+    )
+
+    for token_id, (token_metadata_uri, amount) in enumerate(
+        zip(token_metadata_uris, amounts_to_escrow)
+    ):
+        _, royalty_amount = nft.royaltyInfo(token_id, amount)
+        assert nft.ownerOf(token_id) == valid_account
+        assert nft.tokenURI(token_id) == token_metadata_uri
+        assert nft.getAmountStoredInNFT(token_id) == amount - royalty_amount
+        assert nft.getNFTCreator(token_id) == valid_account
+
+
+def test_safe_mint_batch_events(
+    nft, valid_account, royalty_account, token_metadata_uris, amounts_to_escrow
+):
+    royalty_beginning_balance = royalty_account.balance()
+    safe_mint_batch_tx = nft.safeMintBatch(
+        token_metadata_uris,
+        amounts_to_escrow,
+        {"from": valid_account, "value": sum(amounts_to_escrow)},
+    )
+    safe_mint_batch_tx.wait(1)
+
+    minted_events = safe_mint_batch_tx.events["NFTMinted"]
+    assert len(minted_events) == len(token_metadata_uris)
+    for token_id, event in enumerate(minted_events):
+        assert event["_tokenId"] == token_id
+        assert event["_tokenMetadata"] == token_metadata_uris[token_id]
+
+    total_royalty_amount = sum(
+        nft.royaltyInfo(token_id, amount)[1]
+        for token_id, amount in enumerate(amounts_to_escrow)
+    )
+    assert "RoyaltyPaid" not in safe_mint_batch_tx.events.keys()
+    assert nft.accruedRoyalties() == total_royalty_amount
+
+    withdraw_tx = nft.withdrawRoyalties({"from": valid_account})
+    withdraw_tx.wait(1)
+    assert len(withdraw_tx.events["RoyaltyPaid"]) == 1
+    assert withdraw_tx.events["RoyaltyPaid"]["_amount"] == total_royalty_amount
+    assert royalty_account.balance() == royalty_beginning_balance + total_royalty_amount
+    assert nft.getTotalBountyAmount() == sum(amounts_to_escrow) - total_royalty_amount
+
+
+def test_safe_mint_batch_requires_matching_value(
+    nft, valid_account, token_metadata_uris, amounts_to_escrow
+):
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.safeMintBatch(
+            token_metadata_uris,
+            amounts_to_escrow,
+            {"from": valid_account, "value": sum(amounts_to_escrow) - 1},
+        )
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.safeMintBatch(
+            token_metadata_uris,
+            amounts_to_escrow,
+            {"from": valid_account, "value": sum(amounts_to_escrow) + 1},
+        )
+
+
+def test_safe_mint_batch_rejects_invalid_input(
+    nft, valid_account, token_metadata_uris, amounts_to_escrow
+):
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.safeMintBatch([], [], {"from": valid_account})
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.safeMintBatch(
+            token_metadata_uris,
+            amounts_to_escrow[:-1],
+            {"from": valid_account, "value": sum(amounts_to_escrow[:-1])},
+        )
+
+    amounts_with_zero = [0] + amounts_to_escrow[1:]
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.safeMintBatch(
+            token_metadata_uris,
+            amounts_with_zero,
+            {"from": valid_account, "value": sum(amounts_with_zero)},
+        )
+
+
+def test_safe_mint_batch_is_cheaper_per_token(
+    nft, valid_account, token_metadata_uris, amounts_to_escrow
+):
+    # The first mint initializes the contract-wide counters, so the
+    # comparison is made against a second, warm safeMint.
+    for _ in range(2):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uris[0],
+            {"from": valid_account, "value": amounts_to_escrow[0]},
+        )
+        safe_mint_tx.wait(1)
+
+    safe_mint_batch_tx = nft.safeMintBatch(
+        token_metadata_uris,
+        amounts_to_escrow,
+        {"from": valid_account, "value": sum(amounts_to_escrow)},
+    )
+    safe_mint_batch_tx.wait(1)
+
+    gas_per_token = safe_mint_batch_tx.gas_used / len(token_metadata_uris)
+    assert (
+        gas_per_token < safe_mint_tx.gas_used
+    ), f"safeMintBatch is not cheaper per token: {gas_per_token} >= {safe_mint_tx.gas_used}"
@@ -439,4 +439,197 @@ def test_address_mappings_are_updated(
         1,
         {"from": developer_submitter}
     )
-    assert developer_submissions == ()
\ No newline at end of file
+    assert developer_submissions == ()
+
+
+def test_submission_gas_does_not_grow_with_submissions(
+    nft_with_submissions,
+    seeder_account,
+    seed_submitter_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    nft = nft_with_submissions
+    project_creator = seeder_account
+    developer_submitter = seed_submitter_account
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": project_creator, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    new_token_id = safe_mint_tx.events["NFTMinted"]["_tokenId"]
+
+    # The second submission to the new bounty is compared with one to a
+    # seeded bounty that already has the seeded submissions from the same
+    # submitter. The first submission moves the project from New to
+    # Active, so it is left out of the comparison.
+    gas_used = []
+    for token_id in [new_token_id, new_token_id, 1]:
+        submission_tx = nft.makeSubmission(
+            token_id, submission_metadata_uri, {"from": developer_submitter}
+        )
+        submission_tx.wait(1)
+        gas_used.append(submission_tx.gas_used)
+
+    assert gas_used[1] == gas_used[-1], f"makeSubmission gas grew with the number of submissions: {gas_used}"
+
+
+def test_declare_winning_submission_gas_does_not_grow_with_submissions(
+    nft,
+    utils,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    # Every token gets its own creator and submitter so that the
+    # ownership bookkeeping done by the transfer is identical. The first
+    # round writes zeros (token id 0, submission id 0) and fills the empty
+    # state index, so only the last two rounds are compared.
+    gas_used = []
+    for token_id, number_of_submissions in enumerate([2, 2, 20]):
+        project_creator = utils.get_account(index=2 + 2 * token_id)
+        developer_submitter = utils.get_account(index=3 + 2 * token_id)
+
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri,
+            {"from": project_creator, "value": amount_to_escrow_in_nft},
+        )
+        safe_mint_tx.wait(1)
+
+        for _ in range(number_of_submissions):
+            submission_tx = nft.makeSubmission(
+                token_id, submission_metadata_uri, {"from": developer_submitter}
+            )
+            submission_tx.wait(1)
+
+        winning_submission_tx = nft.declareWinningSubmission(
+            token_id, 0, {"from": project_creator}
+        )
+        winning_submission_tx.wait(1)
+        gas_used.append(winning_submission_tx.gas_used)
+
+    assert gas_used[1] == gas_used[2], f"declareWinningSubmission gas grew with the number of submissions: {gas_used}"
+
+
+def test_redeem_gas_does_not_grow_with_submissions(
+    nft_with_submissions,
+    seeder_account,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    nft = nft_with_submissions
+    project_creator = seeder_account
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": project_creator, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    new_token_id = safe_mint_tx.events["NFTMinted"]["_tokenId"]
+
+    # tokenId 0 is redeemed first so that the contract-wide totals
+    # are already non-zero for the two redemptions being compared: the
+    # new bounty without submissions and a seeded one with them.
+    gas_used = []
+    for token_id in [0, new_token_id, 1]:
+        redemption_tx = nft.redeemEthFromNFT(token_id, {"from": project_creator})
+        redemption_tx.wait(1)
+        gas_used.append(redemption_tx.gas_used)
+
+    assert gas_used[1] == gas_used[2], f"redeemEthFromNFT gas grew with the number of submissions: {gas_used}"
+
+
+def test_submissions_are_stored_once_by_id(
+    nft,
+    valid_account,
+    invalid_account,
+    utils,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    project_creator = valid_account
+    first_submitter = invalid_account
+    second_submitter = utils.get_account(index=2)
+
+    for _ in range(2):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri,
+            {"from": project_creator, "value": amount_to_escrow_in_nft},
+        )
+        safe_mint_tx.wait(1)
+
+    # (tokenId, submitter, metadataURI) in the order they are submitted,
+    # which is also the order of the submission ids.
+    submissions_made = [
+        (0, first_submitter, submission_metadata_uri),
+        (1, second_submitter, "https://block-ops.io/ipfs/second-submitter.json"),
+        (0, second_submitter, "https://block-ops.io/ipfs/another-one.json"),
+        (0, first_submitter, "https://block-ops.io/ipfs/hereissomecool.stuff"),
+    ]
+    for token_id, submitter, metadata_uri in submissions_made:
+        submission_tx = nft.makeSubmission(
+            token_id, metadata_uri, {"from": submitter}
+        )
+        submission_tx.wait(1)
+
+    for submission_id, (_, submitter, metadata_uri) in enumerate(submissions_made):
+        assert nft.getSubmission(submission_id) == (submitter, metadata_uri)
+
+    assert nft.tokenIdToSubmissionIds(0, 0) == 0
+    assert nft.tokenIdToSubmissionIds(0, 1) == 2
+    assert nft.tokenIdToSubmissionIds(0, 2) == 3
+    assert nft.tokenIdToSubmissionIds(1, 0) == 1
+    assert nft.addressToTokenIdSubmissionIds(first_submitter, 0, 1) == 3
+    assert nft.addressToTokenIdSubmissionIds(second_submitter, 1, 0) == 1
+
+    assert nft.tokenIdToSubmissions(0, 1) == (second_submitter, submissions_made[2][2])
+    assert nft.addressToTokenIdSubmissions(first_submitter, 0, 1) == (
+        first_submitter,
+        submissions_made[3][2],
+    )
+    assert nft.getSubmissionsFromAddressForTokenId(second_submitter, 0) == [
+        (second_submitter, submissions_made[2][2])
+    ]
+    assert nft.getTokenIdsWithSubmissionsFromAddress(second_submitter) == (1, 0)
+
+
+def test_winning_submission_is_empty_until_declared(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+    zero_address,
+):
+    project_creator = valid_account
+    developer_submitter = invalid_account
+    token_id = 0
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": project_creator, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+
+    submission_tx = nft.makeSubmission(
+        token_id, submission_metadata_uri, {"from": developer_submitter}
+    )
+    submission_tx.wait(1)
+    assert nft.getWinningSubmissionForTokenId(token_id) == (zero_address, "")
+
+    winning_submission_tx = nft.declareWinningSubmission(
+        token_id, 0, {"from": project_creator}
+    )
+    winning_submission_tx.wait(1)
+    assert nft.getWinningSubmissionForTokenId(token_id) == (
+        developer_submitter,
+        submission_metadata_uri,
+    )
+    assert nft.tokenIdToWinningSubmission(token_id) == (
+        developer_submitter,
+        submission_metadata_uri,
+    )
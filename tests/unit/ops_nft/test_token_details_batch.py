@@ -0,0 +1,69 @@
+import pytest
+from brownie import exceptions
+
+
+def test_token_details_batch_matches_token_details(nft_with_submissions):
+    nft = nft_with_submissions
+    max_submissions = 2
+    token_ids = [2, 0, 1]
+    details = nft.getTokenDetailsBatch(token_ids, max_submissions)
+    assert len(details) == len(token_ids)
+
+    for token_id, token_detail in zip(token_ids, details):
+        (
+            nft_owner,
+            token_metadata,
+            amount,
+            nft_creator,
+            tokenId,
+            project_state,
+            submissions
+        ) = nft.tokenDetails(token_id)
+        assert token_detail[:6] == (
+            nft_owner,
+            token_metadata,
+            amount,
+            nft_creator,
+            tokenId,
+            project_state,
+        )
+        assert token_detail[6] == len(submissions)
+        assert token_detail[7] == submissions[:max_submissions]
+
+
+def test_token_details_batch_without_submissions(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+    submission_tx = nft.makeSubmission(
+        0, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+
+    (token_detail,) = nft.getTokenDetailsBatch([0], 0)
+    assert token_detail[6] == 1
+    assert token_detail[7] == ()
+
+    assert nft.getTokenDetailsBatch([], 10) == ()
+
+
+def test_token_details_batch_requires_existing_tokens(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri,
+        {"from": valid_account, "value": amount_to_escrow_in_nft},
+    )
+    safe_mint_tx.wait(1)
+
+    with pytest.raises(exceptions.VirtualMachineError):
+        nft.getTokenDetailsBatch([0, 1], 0)
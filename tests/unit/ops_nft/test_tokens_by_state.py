@@ -0,0 +1,65 @@
+NEW, ACTIVE, CLOSED = 0, 1, 2
+
+
+def _all_token_ids_by_state(nft, project_state):
+    return list(nft.getTokenIdsByState(project_state, 0, 2**256 - 1))
+
+
+def test_tokens_move_between_states(
+    minted_nft,
+    seeder_account,
+    invalid_account,
+    submission_metadata_uri,
+    number_of_seeded_tokens,
+):
+    nft = minted_nft
+    assert _all_token_ids_by_state(nft, NEW) == list(range(number_of_seeded_tokens))
+    assert nft.getTokenCountByState(NEW) == number_of_seeded_tokens
+    assert nft.getTokenCountByState(ACTIVE) == 0
+    assert nft.getTokenCountByState(CLOSED) == 0
+
+    # Removing token 1 moves the last token of the group into its place.
+    last_token_id = number_of_seeded_tokens - 1
+    for _ in range(2):
+        submission_tx = nft.makeSubmission(
+            1, submission_metadata_uri, {"from": invalid_account}
+        )
+        submission_tx.wait(1)
+    new_token_ids = _all_token_ids_by_state(nft, NEW)
+    assert new_token_ids[:2] == [0, last_token_id]
+    assert sorted(new_token_ids) == [0] + list(range(2, number_of_seeded_tokens))
+    assert _all_token_ids_by_state(nft, ACTIVE) == [1]
+
+    submission_tx = nft.makeSubmission(
+        0, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    assert _all_token_ids_by_state(nft, NEW) == [new_token_ids[-1]] + new_token_ids[1:-1]
+    assert _all_token_ids_by_state(nft, ACTIVE) == [1, 0]
+
+    winning_submission_tx = nft.declareWinningSubmission(1, 0, {"from": seeder_account})
+    winning_submission_tx.wait(1)
+    assert _all_token_ids_by_state(nft, ACTIVE) == [0]
+    assert _all_token_ids_by_state(nft, CLOSED) == [1]
+
+    for token_id in range(number_of_seeded_tokens):
+        project_state = nft.tokenIdToProjectState(token_id)
+        assert token_id in _all_token_ids_by_state(nft, project_state)
+
+
+def test_get_token_ids_by_state_paginated(minted_nft, number_of_seeded_tokens):
+    nft = minted_nft
+    page_size = 2
+    pages = [
+        nft.getTokenIdsByState(NEW, offset, page_size)
+        for offset in range(0, number_of_seeded_tokens, page_size)
+    ]
+    assert all(len(page) == page_size for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= page_size
+    assert [token_id for page in pages for token_id in page] == list(
+        range(number_of_seeded_tokens)
+    )
+
+    assert nft.getTokenIdsByState(NEW, number_of_seeded_tokens, page_size) == []
+    assert nft.getTokenIdsByState(NEW, 0, 0) == []
+    assert nft.getTokenIdsByState(ACTIVE, 0, 10) == []
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from brownie import web3
+
+from scripts.async_client import AsyncOpsNFTClient
+
+
+def _run(nft, max_concurrency, calls, coalesce=True):
+    async def run_calls():
+        async with AsyncOpsNFTClient(
+            web3.provider.endpoint_uri,
+            nft.address,
+            nft.abi,
+            max_concurrency,
+            coalesce=coalesce,
+        ) as client:
+            results = await client.call_many(calls)
+            return results, client.stats
+
+    return asyncio.run(run_calls())
+
+
+def test_async_calls_match_brownie_calls(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    number_of_nfts_to_mint = 6
+    for _ in range(number_of_nfts_to_mint):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+    submission_tx = nft.makeSubmission(
+        2, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+
+    calls = [("tokenDetails", (token_id,)) for token_id in range(number_of_nfts_to_mint)]
+    calls += [
+        ("ownerOf", (0,)),
+        ("getSubmissionsForTokenId", (2,)),
+        ("getRoyaltyNumeratorAndDenominator", ()),
+    ]
+    results, stats = _run(nft, 2, calls)
+
+    assert results == [getattr(nft, method_name)(*args) for method_name, args in calls]
+    assert stats["requests"] == len(calls)
+    assert stats["max_in_flight"] <= 2
+    assert stats["in_flight"] == 0
+
+
+def test_async_call_errors(nft):
+    with pytest.raises(ValueError):
+        _run(nft, 10, [("ownerOf", (0,))])
+
+
+def test_concurrent_identical_calls_are_coalesced(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    for _ in range(2):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+
+    calls = [("tokenDetails", (0,))] * 5 + [("tokenDetails", (1,))] * 3
+    calls += [("getTokenDetailsBatch", ([0, 1], 10))] * 2
+    results, stats = _run(nft, 10, calls)
+    assert results == [getattr(nft, method_name)(*args) for method_name, args in calls]
+    assert stats["calls"] == len(calls)
+    assert stats["requests"] == 3
+    assert stats["coalesced"] == len(calls) - 3
+
+    results, stats = _run(nft, 10, calls, coalesce=False)
+    assert stats["requests"] == len(calls)
+    assert stats["coalesced"] == 0
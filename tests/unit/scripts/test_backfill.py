@@ -0,0 +1,66 @@
+import json
+
+from brownie import web3
+
+from scripts.backfill import backfill, split_block_range
+
+
+def test_split_block_range():
+    assert split_block_range(10, 19, 3) == [(10, 13), (14, 16), (17, 19)]
+    assert split_block_range(10, 11, 4) == [(10, 10), (11, 11)]
+    assert split_block_range(10, 10, 1) == [(10, 10)]
+
+
+def test_backfill_matches_single_process(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+    tmp_path,
+):
+    from_block = web3.eth.block_number + 1
+    for token_id in range(3):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+        submission_tx = nft.makeSubmission(
+            token_id, submission_metadata_uri, {"from": invalid_account}
+        )
+        submission_tx.wait(1)
+    to_block = web3.eth.block_number
+
+    outputs = {}
+    for workers in [1, 3]:
+        output_path = tmp_path / f"events-{workers}.jsonl"
+        result = backfill(
+            web3.provider.endpoint_uri,
+            nft.address,
+            from_block,
+            to_block,
+            str(output_path),
+            workers=workers,
+        )
+        assert result["events"] == 9
+        with open(output_path) as f:
+            outputs[workers] = [json.loads(line) for line in f]
+
+    assert outputs[1] == outputs[3]
+    events = outputs[3]
+    assert [(event["blockNumber"], event["logIndex"]) for event in events] == sorted(
+        (event["blockNumber"], event["logIndex"]) for event in events
+    )
+    assert [event["event"] for event in events[:3]] == [
+        "Transfer",
+        "NFTMinted",
+        "SubmissionMade",
+    ]
+    assert events[2]["args"] == {
+        "_submitter": str(invalid_account),
+        "_tokenId": 0,
+        "_submissionString": submission_metadata_uri,
+        "_nftOwner": str(valid_account),
+        "_contentId": "0x" + "00" * 32,
+    }
@@ -0,0 +1,67 @@
+import pytest
+from brownie import Multicall3, exceptions
+
+
+def _mint_with_submission(
+    nft, valid_account, invalid_account, token_metadata_uri, submission_metadata_uri, amount
+):
+    for _ in range(3):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri, {"from": valid_account, "value": amount}
+        )
+        safe_mint_tx.wait(1)
+    submission_tx = nft.makeSubmission(
+        1, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+
+
+@pytest.mark.parametrize("use_multicall", [True, False])
+def test_batch_call_matches_direct_calls(
+    nft,
+    utils,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+    use_multicall,
+):
+    _mint_with_submission(
+        nft,
+        valid_account,
+        invalid_account,
+        token_metadata_uri,
+        submission_metadata_uri,
+        amount_to_escrow_in_nft,
+    )
+
+    calls = []
+    for token_id in range(3):
+        calls += [
+            (nft.tokenDetails, (token_id,)),
+            (nft.getAmountStoredInNFT, (token_id,)),
+            (nft.ownerOf, (token_id,)),
+        ]
+    calls.append((nft.getRoyaltyNumeratorAndDenominator, ()))
+
+    results = utils.batch_call(calls, batch_size=4, use_multicall=use_multicall)
+    assert results == [method(*args) for method, args in calls]
+    assert len(Multicall3) == (1 if use_multicall else 0)
+
+
+@pytest.mark.parametrize("use_multicall", [True, False])
+def test_batch_call_failures(
+    nft, utils, valid_account, token_metadata_uri, amount_to_escrow_in_nft, use_multicall
+):
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    calls = [(nft.ownerOf, (0,)), (nft.ownerOf, (1,))]
+
+    results = utils.batch_call(calls, allow_failure=True, use_multicall=use_multicall)
+    assert results == [valid_account, None]
+
+    with pytest.raises((exceptions.VirtualMachineError, ValueError)):
+        utils.batch_call(calls, use_multicall=use_multicall)
@@ -0,0 +1,92 @@
+from brownie import chain, web3
+
+from scripts.confirmations import ConfirmationTracker
+
+
+def _tracker(nft, confirmations):
+    seen, confirmed, rolled_back = [], [], []
+    tracker = ConfirmationTracker(
+        nft,
+        confirmations=confirmations,
+        on_log=seen.append,
+        on_confirmed=confirmed.append,
+        on_rollback=rolled_back.append,
+    )
+    return tracker, seen, confirmed, rolled_back
+
+
+def _minted_uris(items):
+    return [
+        item["args"]["_tokenMetadata"]
+        for item in items
+        if item.get("event") == "NFTMinted"
+    ]
+
+
+def test_items_are_confirmed_after_confirmation_depth(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    tracker, seen, confirmed, rolled_back = _tracker(nft, confirmations=3)
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    tracker.track_transaction(safe_mint_tx.txid)
+    tracker.poll()
+
+    # The transaction itself, Transfer and NFTMinted.
+    assert len(seen) == 3
+    assert seen[0]["transactionHash"] == safe_mint_tx.txid
+    assert all(item["blockNumber"] == safe_mint_tx.block_number for item in seen)
+    assert _minted_uris(seen) == [token_metadata_uri]
+    assert confirmed == []
+
+    chain.mine(1)
+    tracker.poll()
+    assert confirmed == []
+
+    chain.mine(1)
+    tracker.poll()
+    assert confirmed == seen
+    assert rolled_back == []
+    assert tracker.blocks == {}
+
+
+def test_orphaned_items_are_rolled_back(
+    nft, valid_account, utils, token_metadata_uri, amount_to_escrow_in_nft
+):
+    tracker, seen, confirmed, rolled_back = _tracker(nft, confirmations=5)
+
+    # Reverting to a snapshot and mining other blocks at the same heights
+    # simulates a reorg.
+    snapshot_id = web3.provider.make_request("evm_snapshot", [])["result"]
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    tracker.track_transaction(safe_mint_tx.txid)
+    tracker.poll()
+    orphaned_items = list(seen)
+    assert len(orphaned_items) == 3
+
+    web3.provider.make_request("evm_revert", [snapshot_id])
+    # A different sender is used so Brownie does not wait on the nonce
+    # of the reverted transaction.
+    other_account = utils.get_account(index=2)
+    replacement_uri = token_metadata_uri + "?replacement"
+    for _ in range(2):
+        safe_mint_tx = nft.safeMint(
+            replacement_uri, {"from": other_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+    tracker.poll()
+
+    assert rolled_back == orphaned_items
+    assert orphaned_items[0]["transactionHash"] in tracker.pending_transactions
+    assert _minted_uris(seen[len(orphaned_items):]) == [replacement_uri] * 2
+    assert all(
+        item["blockHash"] != orphaned_items[0]["blockHash"]
+        for item in seen[len(orphaned_items):]
+    )
+    assert confirmed == []
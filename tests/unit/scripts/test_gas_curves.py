@@ -0,0 +1,49 @@
+import pytest
+
+from scripts.gas_curves import (
+    analyze_curve,
+    classify_growth,
+    fit_linear,
+    fit_quadratic,
+    max_size_under_cap,
+)
+
+SIZES = [1, 10, 100, 1000]
+
+
+def test_fits():
+    assert fit_linear(SIZES, [30000 + 5000 * size for size in SIZES]) == pytest.approx(
+        (30000, 5000)
+    )
+    assert fit_quadratic(
+        SIZES, [30000 + 5000 * size + 2 * size ** 2 for size in SIZES]
+    ) == pytest.approx((30000, 5000, 2))
+
+
+def test_classify_growth():
+    assert classify_growth(SIZES, [25000, 25000, 25010, 25000]) == "constant"
+    assert classify_growth(SIZES, [30000 + 5000 * size for size in SIZES]) == "linear"
+    assert (
+        classify_growth(SIZES, [30000 + 5000 * size + 2 * size ** 2 for size in SIZES])
+        == "super-linear"
+    )
+
+
+def test_max_size_under_cap():
+    assert max_size_under_cap((30000, 5000, 0), 30_000_000) == 5994
+    # 30000 + 5000 * 2817 + 2 * 2817 ** 2 = 29,976,378
+    assert max_size_under_cap((30000, 5000, 2), 30_000_000) == 2817
+    assert max_size_under_cap((30000, 0, 0), 30_000_000) is None
+    assert max_size_under_cap((40_000_000, 5000, 0), 30_000_000) == 0
+
+
+def test_analyze_curve():
+    gas_caps = {"block": 30_000_000, "eth_call": 50_000_000}
+    curve = analyze_curve(SIZES, [30000 + 5000 * size for size in SIZES], gas_caps)
+    assert curve["growth"] == "linear"
+    assert curve["gas_per_item"] == pytest.approx(5000)
+    assert curve["max_size"] == {"block": 5994, "eth_call": 9994}
+
+    curve = analyze_curve(SIZES, [25000] * 4, gas_caps)
+    assert curve["growth"] == "constant"
+    assert curve["max_size"] == {"block": None, "eth_call": None}
@@ -0,0 +1,108 @@
+from scripts.indexer import EventIndexer
+
+
+def test_indexer_tracks_bounties_and_submissions(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+    tmp_path,
+):
+    for _ in range(2):
+        safe_mint_tx = nft.safeMint(
+            token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+        )
+        safe_mint_tx.wait(1)
+    submission_tx = nft.makeSubmission(
+        1, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    winning_submission_tx = nft.declareWinningSubmission(1, 0, {"from": valid_account})
+    winning_submission_tx.wait(1)
+    redemption_tx = nft.redeemEthFromNFT(1, {"from": invalid_account})
+    redemption_tx.wait(1)
+
+    indexer = EventIndexer(nft, db_path=str(tmp_path / "index.db"))
+    # 2 x (Transfer + NFTMinted), SubmissionMade, Transfer + WinningSubmission
+    # and Redeemed.
+    assert indexer.sync() == 8
+    assert indexer.last_processed_block() == redemption_tx.block_number
+
+    bounties = indexer.bounties_by_creator(valid_account)
+    assert [bounty["token_id"] for bounty in bounties] == [0, 1]
+    assert bounties[0]["owner"] == valid_account
+    assert bounties[0]["project_state"] == "NEW"
+    assert bounties[0]["metadata_uri"] == token_metadata_uri
+    assert int(bounties[0]["escrow_value"]) == nft.amountOfEthInNFT(0)
+    assert bounties[1]["owner"] == invalid_account
+    assert bounties[1]["project_state"] == "CLOSED"
+    assert bounties[1]["winner"] == invalid_account
+    assert int(bounties[1]["redeemed_amount"]) == redemption_tx.events["Redeemed"]["_amount"]
+    assert indexer.bounties_by_creator(invalid_account) == []
+
+    (submission,) = indexer.submissions_by_address(invalid_account)
+    assert submission["token_id"] == 1
+    assert submission["metadata_uri"] == submission_metadata_uri
+    assert indexer.submissions_by_address(valid_account) == []
+    indexer.close()
+
+
+def test_indexer_resumes_from_checkpoint(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+    tmp_path,
+):
+    db_path = str(tmp_path / "index.db")
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+
+    indexer = EventIndexer(nft, db_path=db_path)
+    assert indexer.sync() == 2
+    indexer.close()
+
+    for _ in range(2):
+        submission_tx = nft.makeSubmission(
+            0, submission_metadata_uri, {"from": invalid_account}
+        )
+        submission_tx.wait(1)
+
+    # A new indexer on the same database only picks up the new events.
+    indexer = EventIndexer(nft, db_path=db_path)
+    assert indexer.last_processed_block() == safe_mint_tx.block_number
+    assert indexer.sync() == 2
+    assert indexer.sync() == 0
+    assert len(indexer.submissions_by_address(invalid_account)) == 2
+    assert indexer.bounties_by_creator(valid_account)[0]["project_state"] == "ACTIVE"
+    indexer.close()
+
+
+def test_indexer_joins_content_ids_with_the_base_uri(
+    nft, valid_account, invalid_account, amount_to_escrow_in_nft, tmp_path
+):
+    content_id = "0x" + "11" * 32
+    safe_mint_tx = nft.safeMintWithContentId(
+        content_id, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    new_content_base_uri = "https://arweave.net/"
+    set_base_uri_tx = nft.setContentBaseURI(new_content_base_uri, {"from": valid_account})
+    set_base_uri_tx.wait(1)
+    submission_tx = nft.makeSubmissionWithContentId(0, content_id, {"from": invalid_account})
+    submission_tx.wait(1)
+
+    # The URIs are joined with the base URI of the block they were logged in.
+    indexer = EventIndexer(nft, db_path=str(tmp_path / "index.db"))
+    indexer.sync()
+    (bounty,) = indexer.bounties_by_creator(valid_account)
+    assert bounty["metadata_uri"] == "ipfs://f01701220" + content_id[2:]
+    (submission,) = indexer.submissions_by_address(invalid_account)
+    assert submission["metadata_uri"] == new_content_base_uri + content_id[2:]
+    indexer.close()
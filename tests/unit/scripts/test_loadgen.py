@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from scripts.loadgen import LoadGenerator, percentile
+
+
+def test_percentile():
+    values = [5, 1, 4, 2, 3]
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 3
+    assert percentile(values, 95) == 5
+    assert percentile(list(range(1, 101)), 99) == 99
+
+
+def test_load_generator_report(nft, utils, tmp_path):
+    creators = [utils.get_account(index=index) for index in range(2, 4)]
+    submitters = [utils.get_account(index=index) for index in range(4, 6)]
+    # Batches of 8 transactions, so that later batches find bounties to
+    # submit to, close and redeem.
+    load_generator = LoadGenerator(nft, creators, submitters, max_in_flight=2, seed=1)
+    with pytest.raises(ValueError):
+        load_generator.report()
+
+    number_of_transactions = 40
+    report = load_generator.run(number_of_transactions)
+
+    functions = report["functions"]
+    assert report["transactions"] == number_of_transactions
+    assert report["reverted"] == report["dropped"] == 0
+    assert set(functions) == set(load_generator.mix)
+    assert sum(stats["count"] for stats in functions.values()) == number_of_transactions
+    assert nft.totalSupply() == functions["safeMint"]["count"]
+    for stats in functions.values():
+        assert 0 < stats["gas"]["min"] <= stats["gas"]["p50"] <= stats["gas"]["max"]
+        assert stats["latency_ms"]["p50"] <= stats["latency_ms"]["p99"]
+
+    # The report is plain JSON, to be compared across contract revisions.
+    report_path = tmp_path / "report.json"
+    report_path.write_text(json.dumps(report))
+    assert json.loads(report_path.read_text()) == report
+
+    # The same seed sends the same transactions.
+    replay = LoadGenerator(nft, creators, submitters, max_in_flight=2, seed=1)
+    replay.run(number_of_transactions)
+    assert {
+        function_name: len(records)
+        for function_name, records in replay.records.items()
+        if records
+    } == {function_name: stats["count"] for function_name, stats in functions.items()}
@@ -0,0 +1,100 @@
+import pytest
+from brownie import chain, web3
+
+from scripts.events import event_topics
+from scripts.log_fetcher import AdaptiveLogFetcher
+
+
+class _LimitedEth:
+    # Rejects eth_getLogs over more than max_blocks blocks, like providers
+    # that cap the range or the number of results of a request.
+    def __init__(self, max_blocks):
+        self.max_blocks = max_blocks
+
+    def get_logs(self, filter_params):
+        if filter_params["toBlock"] - filter_params["fromBlock"] + 1 > self.max_blocks:
+            raise ValueError({"code": -32005, "message": "query returned more than 10000 results"})
+        return web3.eth.get_logs(filter_params)
+
+
+class _LimitedWeb3:
+    def __init__(self, max_blocks):
+        self.eth = _LimitedEth(max_blocks)
+
+
+def _mint(nft, account, uri, amount, number_of_nfts_to_mint):
+    for _ in range(number_of_nfts_to_mint):
+        safe_mint_tx = nft.safeMint(uri, {"from": account, "value": amount})
+        safe_mint_tx.wait(1)
+
+
+def _fetch_all(fetcher, from_block, to_block):
+    logs = []
+    ranges = []
+    for start_block, end_block, range_logs in fetcher.fetch(from_block, to_block):
+        ranges.append((start_block, end_block))
+        logs += range_logs
+    return ranges, logs
+
+
+def test_fetcher_grows_range_over_empty_blocks(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    from_block = web3.eth.block_number + 1
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft, 2)
+    chain.mine(29)
+    to_block = web3.eth.block_number
+
+    fetcher = AdaptiveLogFetcher(
+        web3, nft.address, event_topics(nft.abi), initial_range=1, target_logs=10
+    )
+    ranges, logs = _fetch_all(fetcher, from_block, to_block)
+
+    # The ranges cover every block once, and are doubled while they are
+    # almost empty: 1 + 2 + 4 + 8 + 16 = 31 blocks.
+    assert ranges[0][0] == from_block
+    assert ranges[-1][1] == to_block
+    assert all(ranges[i][1] + 1 == ranges[i + 1][0] for i in range(len(ranges) - 1))
+    assert len(ranges) == 5
+    assert fetcher.stats["blocks"] == to_block - from_block + 1
+    assert fetcher.blocks_per_second() > 0
+
+    expected_logs = web3.eth.get_logs(
+        {"address": nft.address, "fromBlock": from_block, "toBlock": to_block}
+    )
+    # Approval events are not OpsNFT topics; minting does not emit any.
+    assert logs == expected_logs
+    assert len(logs) == 4
+
+
+def test_fetcher_shrinks_range_on_dense_blocks_and_errors(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    from_block = web3.eth.block_number + 1
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft, 6)
+    to_block = web3.eth.block_number
+    topics = event_topics(nft.abi)
+
+    fetcher = AdaptiveLogFetcher(
+        web3, nft.address, topics, initial_range=6, target_logs=4
+    )
+    ranges, logs = _fetch_all(fetcher, from_block, to_block)
+    # 12 logs over 6 blocks: the range shrinks to 2 blocks after the first
+    # request.
+    assert ranges == [(from_block, to_block)]
+    assert len(logs) == 12
+    assert fetcher.block_range == 2
+
+    fetcher = AdaptiveLogFetcher(
+        _LimitedWeb3(max_blocks=2), nft.address, topics, initial_range=8
+    )
+    ranges, logs = _fetch_all(fetcher, from_block, to_block)
+    assert fetcher.stats["errors"] > 0
+    assert all(end_block - start_block + 1 <= 2 for start_block, end_block in ranges)
+    assert len(logs) == 12
+
+    fetcher = AdaptiveLogFetcher(
+        _LimitedWeb3(max_blocks=0), nft.address, topics, initial_range=4
+    )
+    with pytest.raises(ValueError):
+        _fetch_all(fetcher, from_block, to_block)
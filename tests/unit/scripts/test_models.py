@@ -0,0 +1,83 @@
+from brownie import web3
+
+from scripts.models import ProjectState, Submission, TokenDetails
+
+
+def _mint_with_submissions(
+    nft, valid_account, invalid_account, token_metadata_uri, submission_metadata_uri, amount
+):
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount}
+    )
+    safe_mint_tx.wait(1)
+    for _ in range(3):
+        submission_tx = nft.makeSubmission(
+            0, submission_metadata_uri, {"from": invalid_account}
+        )
+        submission_tx.wait(1)
+
+
+def test_token_details_models(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    _mint_with_submissions(
+        nft,
+        valid_account,
+        invalid_account,
+        token_metadata_uri,
+        submission_metadata_uri,
+        amount_to_escrow_in_nft,
+    )
+
+    token_details = TokenDetails.from_tuple(nft.tokenDetails(0))
+    assert token_details.owner == valid_account
+    assert token_details.token_uri == token_metadata_uri
+    assert token_details.amount_of_eth == nft.amountOfEthInNFT(0)
+    assert token_details.creator == valid_account
+    assert token_details.token_id == 0
+    assert token_details.project_state == ProjectState.ACTIVE
+    assert token_details.submission_count == 3
+    assert token_details.submissions == (
+        Submission(str(invalid_account), submission_metadata_uri),
+    ) * 3
+    assert not hasattr(token_details, "__dict__")
+
+    # getTokenDetailsBatch only returns the first submissions, but the
+    # total count.
+    (batch_details,) = nft.getTokenDetailsBatch([0], 1)
+    batch_token_details = TokenDetails.from_batch_tuple(batch_details)
+    assert batch_token_details.submission_count == 3
+    assert batch_token_details.submissions == token_details.submissions[:1]
+
+
+def test_token_details_from_return_data_decodes_submissions_lazily(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    _mint_with_submissions(
+        nft,
+        valid_account,
+        invalid_account,
+        token_metadata_uri,
+        submission_metadata_uri,
+        amount_to_escrow_in_nft,
+    )
+
+    return_data = web3.eth.call(
+        {"to": nft.address, "data": nft.tokenDetails.encode_input(0)}
+    )
+    token_details = TokenDetails.from_return_data(return_data)
+    assert isinstance(token_details._submissions, bytes)
+    assert token_details.submission_count == 3
+
+    assert token_details == TokenDetails.from_tuple(nft.tokenDetails(0))
+    assert isinstance(token_details._submissions, tuple)
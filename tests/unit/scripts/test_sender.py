@@ -0,0 +1,74 @@
+from scripts.sender import BulkSender
+
+
+class _PendingReceipt:
+    # Stands in for a TransactionReceipt, as a development network mines
+    # every transaction before it could be replaced.
+    def __init__(self):
+        self.status = -1
+        self.replacements = []
+
+    def replace(self, increment=None):
+        replacement = _PendingReceipt()
+        self.replacements.append(replacement)
+        return replacement
+
+
+def test_bulk_sender_spreads_nonces_across_accounts(
+    nft, utils, token_metadata_uri, amount_to_escrow_in_nft
+):
+    senders = [utils.get_account(index=index) for index in range(2, 5)]
+    starting_nonces = [account.nonce for account in senders]
+    sender = BulkSender(senders, max_in_flight=2)
+
+    number_of_nfts_to_mint = 9
+    for _ in range(number_of_nfts_to_mint):
+        sender.send(nft.safeMint, token_metadata_uri, value=amount_to_escrow_in_nft)
+    receipts = sender.wait_all(timeout=60)
+
+    assert len(receipts) == number_of_nfts_to_mint
+    assert all(receipt.status == 1 for receipt in receipts)
+    assert sender.stats == {
+        "sent": number_of_nfts_to_mint,
+        "confirmed": number_of_nfts_to_mint,
+        "reverted": 0,
+        "replaced": 0,
+        "dropped": 0,
+    }
+    assert nft.totalSupply() == number_of_nfts_to_mint
+    for account, starting_nonce in zip(senders, starting_nonces):
+        nonces = sorted(
+            receipt.nonce for receipt in receipts if receipt.sender == account
+        )
+        assert nonces == list(range(starting_nonce, starting_nonce + 3))
+        assert account.nonce == starting_nonce + 3
+
+
+def test_bulk_sender_settles_a_replacement_beaten_by_the_original(utils):
+    original_tx = _PendingReceipt()
+    sender = BulkSender([utils.get_account(index=2)], replace_after=0)
+    sender.send(lambda *args: original_tx)
+    assert sender.poll() == 1
+    (replacement_tx,) = original_tx.replacements
+    assert sender.receipts == [replacement_tx]
+
+    # The original is mined first, so Brownie marks the replacement dropped.
+    original_tx.status = 1
+    replacement_tx.status = -2
+    assert sender.wait_all(timeout=1) == [original_tx]
+    assert sender.stats == {
+        "sent": 1,
+        "confirmed": 1,
+        "reverted": 0,
+        "replaced": 1,
+        "dropped": 0,
+    }
+
+
+def test_bulk_sender_counts_a_nonce_taken_by_another_transaction(utils):
+    tx = _PendingReceipt()
+    sender = BulkSender([utils.get_account(index=2)])
+    sender.send(lambda *args: tx)
+    tx.status = -2
+    assert sender.wait_all(timeout=1) == [tx]
+    assert sender.stats["dropped"] == 1
@@ -0,0 +1,105 @@
+from brownie import web3
+from eth_utils import keccak
+
+from scripts.storage_profiler import SlotResolver, StorageProfile, load_storage_layout
+
+STORAGE_LAYOUT = {
+    "storage": [
+        {"label": "counter", "slot": "0", "offset": 0, "type": "t_uint256"},
+        {
+            "label": "idsByAddress",
+            "slot": "1",
+            "offset": 0,
+            "type": "t_mapping(t_address,t_array(t_uint256)dyn_storage)",
+        },
+    ],
+    "types": {
+        "t_address": {"encoding": "inplace", "label": "address", "numberOfBytes": "20"},
+        "t_uint256": {"encoding": "inplace", "label": "uint256", "numberOfBytes": "32"},
+        "t_array(t_uint256)dyn_storage": {
+            "encoding": "dynamic_array",
+            "label": "uint256[]",
+            "numberOfBytes": "32",
+            "base": "t_uint256",
+        },
+        "t_mapping(t_address,t_array(t_uint256)dyn_storage)": {
+            "encoding": "mapping",
+            "label": "mapping(address => uint256[])",
+            "numberOfBytes": "32",
+            "key": "t_address",
+            "value": "t_array(t_uint256)dyn_storage",
+        },
+    },
+}
+
+
+def _add_hash(resolver, preimage):
+    hash_value = int.from_bytes(keccak(preimage), "big")
+    resolver.add_preimage(hash_value, preimage)
+    return hash_value
+
+
+def test_slot_resolver(valid_account):
+    resolver = SlotResolver(STORAGE_LAYOUT)
+    assert resolver.name(0) == "counter"
+
+    entry_slot = _add_hash(
+        resolver, bytes.fromhex(valid_account.address[2:]).rjust(32, b"\0") + (1).to_bytes(32, "big")
+    )
+    data_slot = _add_hash(resolver, entry_slot.to_bytes(32, "big"))
+    assert resolver.name(entry_slot) == f"idsByAddress[{valid_account.address}]"
+    assert resolver.name(data_slot + 2) == f"idsByAddress[{valid_account.address}][2]"
+    assert resolver.variable(data_slot + 2) == "idsByAddress"
+
+
+def test_storage_layout_of_ops_nft(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft):
+    storage_layout = load_storage_layout(nft)
+    variables = {variable["label"]: variable for variable in storage_layout["storage"]}
+    # Inherited from OpenZeppelin and OpsNFTBase, through their imports.
+    assert "_owners" in variables
+    assert "_allTokens" in variables
+    assert variables["_royaltyAddress"]["slot"] == variables["initialized"]["slot"]
+    assert variables["_royaltyAddress"]["offset"] == 1
+
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    slot = int(variables["accruedRoyalties"]["slot"])
+    stored_value = web3.eth.get_storage_at(nft.address, slot)
+    assert int.from_bytes(stored_value, "big") == nft.accruedRoyalties() > 0
+
+
+def test_storage_profile_of_a_submission(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+    tmp_path,
+):
+    safe_mint_tx = nft.safeMint(
+        token_metadata_uri, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    submission_tx = nft.makeSubmission(0, submission_metadata_uri, {"from": invalid_account})
+    submission_tx.wait(1)
+
+    profile = StorageProfile(submission_tx, load_storage_layout(nft))
+
+    stores = {
+        stack.split(";")[-1] for stack in profile.folded if ";SSTORE " in stack
+    }
+    assert "SSTORE tokenIdToSubmissionIds[0][0]" in stores
+    assert f"SSTORE addressToTokenIdSubmissionIds[{invalid_account.address}][0][0]" in stores
+    assert "SSTORE _submissions[0].submitter" in stores
+    assert profile.by_variable["_submissions"]["SSTORE"] >= 2
+    assert profile.by_variable["tokenIdToSubmissionIds"]["SSTORE"] == 2
+    assert all("makeSubmission" in stack.split(";")[0] for stack in profile.folded)
+    assert profile.attributed_gas > 0
+
+    folded_path = tmp_path / "makeSubmission.folded"
+    profile.write_folded(folded_path)
+    lines = folded_path.read_text().splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == profile.attributed_gas
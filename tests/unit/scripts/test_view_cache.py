@@ -0,0 +1,244 @@
+from brownie import chain, web3
+
+from scripts.events import decode_log, event_topics
+from scripts.view_cache import VIEW_CACHE_EVENTS, ViewCache
+
+
+def _events(nft, tx):
+    # The topics a log follower feeding the cache subscribes to.
+    topics = event_topics(nft.abi, VIEW_CACHE_EVENTS)
+    events = [decode_log(log, topics) for log in tx.logs]
+    return [event for event in events if event is not None]
+
+
+def _mint(nft, account, uri, amount, number_of_nfts_to_mint=1):
+    for _ in range(number_of_nfts_to_mint):
+        safe_mint_tx = nft.safeMint(uri, {"from": account, "value": amount})
+        safe_mint_tx.wait(1)
+    return safe_mint_tx
+
+
+def test_immutable_views_are_memoized(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft)
+    cache = ViewCache(nft)
+
+    assert cache.call("getNFTCreator", 0) == valid_account
+    chain.mine(2)
+    assert cache.call("getNFTCreator", 0) == valid_account
+    assert cache.call("getRoyaltyNumeratorAndDenominator") == (100, 10000)
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 2
+
+
+def test_mutable_views_are_keyed_by_block(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft)
+    cache = ViewCache(nft)
+
+    amount = cache.call("getAmountStoredInNFT", 0)
+    assert cache.call("getAmountStoredInNFT", 0) == amount
+    assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0, "invalidations": 0}
+
+    # A later block is a miss until its logs have been handled.
+    chain.mine(1)
+    cache.call("getAmountStoredInNFT", 0)
+    assert cache.stats["misses"] == 2
+
+    chain.mine(1)
+    cache.handle_logs([], web3.eth.block_number)
+    assert cache.call("getAmountStoredInNFT", 0) == amount
+    assert cache.stats["hits"] == 2
+
+
+def test_handled_logs_set_the_default_block(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft)
+    cache = ViewCache(nft)
+    synced_block = web3.eth.block_number
+    cache.handle_logs([], synced_block)
+
+    # Blocks mined after the last handled logs are not read until their logs
+    # have been handled too.
+    chain.mine(2)
+    amount = cache.call("getAmountStoredInNFT", 0)
+    assert cache.entries[("getAmountStoredInNFT", (0,))][1] == synced_block
+    assert cache.call("getAmountStoredInNFT", 0) == amount
+    assert cache.stats["hits"] == 1
+
+
+def test_addresses_are_keyed_in_checksum_form(nft, valid_account, invalid_account):
+    cache = ViewCache(nft)
+    assert cache.call("isApprovedForAll", valid_account, invalid_account) is False
+    assert (
+        cache.call(
+            "isApprovedForAll", str(valid_account).lower(), str(invalid_account).lower()
+        )
+        is False
+    )
+    assert cache.stats["hits"] == 1
+    assert list(cache.entries) == [
+        ("isApprovedForAll", (str(valid_account), str(invalid_account)))
+    ]
+
+
+def test_approvals_and_ownership_invalidate_their_views(
+    nft,
+    valid_account,
+    invalid_account,
+    zero_address,
+    token_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft, 2)
+    cache = ViewCache(nft)
+    cache.handle_logs([], web3.eth.block_number)
+    assert cache.call("getApproved", 0) == zero_address
+    assert cache.call("getApproved", 1) == zero_address
+    assert cache.call("isApprovedForAll", valid_account, invalid_account) is False
+    assert cache.call("owner") == valid_account
+
+    approve_tx = nft.approve(invalid_account, 0, {"from": valid_account})
+    approve_tx.wait(1)
+    events = _events(nft, approve_tx)
+    assert [event["event"] for event in events] == ["Approval"]
+    cache.handle_logs(events, approve_tx.block_number)
+    assert cache.call("getApproved", 0) == invalid_account
+    assert cache.call("getApproved", 1) == zero_address
+
+    approval_for_all_tx = nft.setApprovalForAll(
+        invalid_account, True, {"from": valid_account}
+    )
+    approval_for_all_tx.wait(1)
+    events = _events(nft, approval_for_all_tx)
+    assert [event["event"] for event in events] == ["ApprovalForAll"]
+    cache.handle_logs(events, approval_for_all_tx.block_number)
+    assert cache.call("isApprovedForAll", valid_account, invalid_account) is True
+
+    ownership_tx = nft.transferOwnership(invalid_account, {"from": valid_account})
+    ownership_tx.wait(1)
+    events = _events(nft, ownership_tx)
+    assert [event["event"] for event in events] == ["OwnershipTransferred"]
+    cache.handle_logs(events, ownership_tx.block_number)
+    assert cache.call("owner") == invalid_account
+    # getApproved of token 1 is the only entry the three logs left untouched.
+    assert cache.stats["hits"] == 1
+
+
+def test_logs_invalidate_matching_entries(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft, 2)
+    cache = ViewCache(nft)
+    for token_id in range(2):
+        assert cache.call("getSubmissionsForTokenId", token_id) == []
+
+    submission_tx = nft.makeSubmission(
+        0, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    cache.handle_logs(_events(nft, submission_tx), submission_tx.block_number)
+    assert cache.stats["invalidations"] == 1
+
+    assert cache.call("getSubmissionsForTokenId", 0) == [
+        (invalid_account, submission_metadata_uri)
+    ]
+    assert cache.call("getSubmissionsForTokenId", 1) == []
+    assert cache.stats["misses"] == 3
+    assert cache.stats["hits"] == 1
+
+
+def test_state_changes_invalidate_state_and_batch_views(
+    nft,
+    valid_account,
+    invalid_account,
+    token_metadata_uri,
+    submission_metadata_uri,
+    amount_to_escrow_in_nft,
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft, 2)
+    cache = ViewCache(nft)
+    assert cache.call("getTokenIdsByState", 0, 0, 10) == [0, 1]
+    assert cache.call("getTokenCountByState", 1) == 0
+    cache.call("getTokenDetailsBatch", [0], 1)
+    cache.call("getTokenDetailsBatch", [1], 1)
+
+    # The first submission moves token 0 from NEW to ACTIVE.
+    submission_tx = nft.makeSubmission(
+        0, submission_metadata_uri, {"from": invalid_account}
+    )
+    submission_tx.wait(1)
+    cache.handle_logs(_events(nft, submission_tx), submission_tx.block_number)
+    assert cache.stats["invalidations"] == 3
+
+    assert cache.call("getTokenIdsByState", 0, 0, 10) == [1]
+    assert cache.call("getTokenCountByState", 1) == 1
+    assert cache.call("getTokenDetailsBatch", [0], 1)[0][6] == 1
+    assert cache.call("getTokenDetailsBatch", [1], 1)[0][6] == 0
+    assert cache.stats["hits"] == 1
+
+    winning_tx = nft.declareWinningSubmission(0, 0, {"from": valid_account})
+    winning_tx.wait(1)
+    cache.handle_logs(_events(nft, winning_tx), winning_tx.block_number)
+    assert cache.call("getTokenCountByState", 2) == 1
+    assert cache.call("getTokenDetailsBatch", [1, 0], 1)[1][0] == invalid_account
+
+
+def test_royalty_withdrawal_invalidates_accrued_royalties(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft)
+    cache = ViewCache(nft)
+    assert cache.call("accruedRoyalties") > 0
+
+    withdraw_tx = nft.withdrawRoyalties({"from": valid_account})
+    withdraw_tx.wait(1)
+    events = _events(nft, withdraw_tx)
+    assert [event["event"] for event in events] == ["RoyaltyPaid"]
+    cache.handle_logs(events, withdraw_tx.block_number)
+    assert cache.call("accruedRoyalties") == 0
+    assert cache.stats["hits"] == 0
+
+
+def test_content_base_uri_update_clears_cache(
+    nft, valid_account, amount_to_escrow_in_nft
+):
+    content_id = "0x" + "11" * 32
+    safe_mint_tx = nft.safeMintWithContentId(
+        content_id, {"from": valid_account, "value": amount_to_escrow_in_nft}
+    )
+    safe_mint_tx.wait(1)
+    cache = ViewCache(nft)
+    assert cache.call("tokenURI", 0) == nft.contentBaseURI() + content_id[2:]
+
+    new_content_base_uri = "https://arweave.net/"
+    set_base_uri_tx = nft.setContentBaseURI(new_content_base_uri, {"from": valid_account})
+    set_base_uri_tx.wait(1)
+    events = _events(nft, set_base_uri_tx)
+    assert [event["event"] for event in events] == ["ContentBaseURIUpdated"]
+    cache.handle_logs(events, set_base_uri_tx.block_number)
+    assert cache.call("tokenURI", 0) == new_content_base_uri + content_id[2:]
+    assert cache.stats["hits"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(
+    nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft
+):
+    _mint(nft, valid_account, token_metadata_uri, amount_to_escrow_in_nft, 3)
+    cache = ViewCache(nft, max_size=2)
+
+    for token_id in [0, 1, 0, 2]:
+        cache.call("getNFTCreator", token_id)
+    assert cache.stats["evictions"] == 1
+    assert list(cache.entries) == [("getNFTCreator", (0,)), ("getNFTCreator", (2,))]
+
+    cache.call("getNFTCreator", 1)
+    assert cache.stats == {"hits": 1, "misses": 4, "evictions": 2, "invalidations": 0}